@@ -27,8 +27,8 @@ def get_url(path, repo=None, rev=None, remote=None):
             raise OutputNotFoundError(path, repo)
 
         cloud = metadata.repo.cloud
-        md5 = metadata.repo.dvcfs.info(fs_path)["md5"]
-        return cloud.get_url_for(remote, checksum=md5)
+        checksum = metadata.repo.dvcfs.checksum(fs_path)
+        return cloud.get_url_for(remote, checksum=checksum)
 
 
 def open(  # noqa, pylint: disable=redefined-builtin
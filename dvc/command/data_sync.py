@@ -38,6 +38,7 @@ class CmdDataPull(CmdDataBase):
                 force=self.args.force,
                 recursive=self.args.recursive,
                 run_cache=self.args.run_cache,
+                refresh_remote_index=self.args.refresh_remote_index,
                 glob=self.args.glob,
             )
             self.log_summary(stats)
@@ -64,6 +65,7 @@ class CmdDataPush(CmdDataBase):
                 with_deps=self.args.with_deps,
                 recursive=self.args.recursive,
                 run_cache=self.args.run_cache,
+                refresh_remote_index=self.args.refresh_remote_index,
                 glob=self.args.glob,
             )
             self.log_summary({"pushed": processed_files_count})
@@ -88,6 +90,7 @@ class CmdDataFetch(CmdDataBase):
                 with_deps=self.args.with_deps,
                 recursive=self.args.recursive,
                 run_cache=self.args.run_cache,
+                refresh_remote_index=self.args.refresh_remote_index,
             )
             self.log_summary({"fetched": processed_files_count})
         except DvcException:
@@ -114,6 +117,15 @@ def shared_parent_parser():
         ),
         metavar="<number>",
     )
+    parent_parser.add_argument(
+        "--refresh-remote-index",
+        action="store_true",
+        default=False,
+        help=(
+            "Re-list the remote storage instead of relying on the local "
+            "snapshot of its contents."
+        ),
+    )
     parent_parser.add_argument(
         "targets",
         nargs="*",
@@ -512,6 +512,7 @@ class CmdExperimentsShow(CmdBase):
                 sha_only=self.args.sha,
                 num=self.args.num,
                 param_deps=self.args.param_deps,
+                jobs=self.args.jobs,
             )
         except DvcException:
             logger.exception("failed to show experiments")
@@ -693,4 +694,15 @@ def add_parser(experiments_subparsers, parent_parser):
             "across the selected experiments."
         ),
     )
+    experiments_show_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Collect the specified number of revisions at a time in "
+            "parallel, using separate processes."
+        ),
+        metavar="<number>",
+    )
     experiments_show_parser.set_defaults(func=CmdExperimentsShow)
@@ -19,7 +19,10 @@ class CmdGC(CmdBase):
             workspace=self.args.workspace,
         )
 
-        msg = "This will remove all cache except items used in "
+        if self.args.dry_run:
+            msg = "Would remove all cache except items used in "
+        else:
+            msg = "This will remove all cache except items used in "
 
         msg += "the workspace"
         if self.args.all_commits:
@@ -41,11 +44,14 @@ class CmdGC(CmdBase):
         else:
             msg += " of the current repo."
 
-        logger.warning(msg)
+        if self.args.dry_run:
+            logger.info(msg)
+        else:
+            logger.warning(msg)
 
-        msg = "Are you sure you want to proceed?"
-        if not self.args.force and not ui.confirm(msg):
-            return 1
+            msg = "Are you sure you want to proceed?"
+            if not self.args.force and not ui.confirm(msg):
+                return 1
 
         self.repo.gc(
             all_branches=self.args.all_branches,
@@ -58,6 +64,7 @@ class CmdGC(CmdBase):
             jobs=self.args.jobs,
             repos=self.args.repos,
             workspace=self.args.workspace,
+            dry_run=self.args.dry_run,
         )
         return 0
 
@@ -129,6 +136,15 @@ def add_parser(subparsers, parent_parser):
         default=False,
         help="Force garbage collection - automatically agree to all prompts.",
     )
+    gc_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        default=False,
+        help=(
+            "Only report the number and the size of the objects that would "
+            "be removed, without removing them."
+        ),
+    )
     gc_parser.add_argument(
         "-j",
         "--jobs",
@@ -26,6 +26,7 @@ class CmdMetricsShow(CmdMetricsBase):
                 all_tags=self.args.all_tags,
                 all_commits=self.args.all_commits,
                 recursive=self.args.recursive,
+                jobs=self.args.jobs,
             )
         except DvcException:
             logger.exception("")
@@ -171,6 +172,17 @@ def add_parser(subparsers, parent_parser):
         ),
         metavar="<n>",
     )
+    metrics_show_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Collect the specified number of revisions at a time in "
+            "parallel, using separate processes."
+        ),
+        metavar="<number>",
+    )
     metrics_show_parser.set_defaults(func=CmdMetricsShow)
 
     METRICS_DIFF_HELP = (
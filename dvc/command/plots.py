@@ -89,6 +89,7 @@ class CmdPlotsDiff(CmdPlots):
             *args,
             revs=self.args.revisions,
             experiment=self.args.experiment,
+            jobs=self.args.jobs,
             **kwargs,
         )
 
@@ -171,6 +172,17 @@ def add_parser(subparsers, parent_parser):
     plots_diff_parser.add_argument(
         "revisions", nargs="*", default=None, help="Git commits to plot from"
     )
+    plots_diff_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Collect the specified number of revisions at a time in "
+            "parallel, using separate processes."
+        ),
+        metavar="<number>",
+    )
     _add_props_arguments(plots_diff_parser)
     _add_output_arguments(plots_diff_parser)
     plots_diff_parser.set_defaults(func=CmdPlotsDiff)
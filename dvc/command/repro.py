@@ -9,7 +9,7 @@ class CmdRepro(CmdBase):
     def run(self):
         from dvc.ui import ui
 
-        stages = self.repo.reproduce(**self._repro_kwargs)
+        stages = self.repo.reproduce(**self._repro_kwargs, jobs=self.args.jobs)
         if len(stages) == 0:
             ui.write(CmdDataStatus.UP_TO_DATE_MSG)
         else:
@@ -166,4 +166,16 @@ def add_parser(subparsers, parent_parser):
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     add_arguments(repro_parser)
+    repro_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Run the specified number of independent stages at a time in "
+            "parallel. Stage commands can't use DVC in the same repository "
+            "when running in parallel."
+        ),
+        metavar="<number>",
+    )
     repro_parser.set_defaults(func=CmdRepro)
@@ -61,6 +61,7 @@ class CmdDataStatus(CmdDataBase):
                     all_commits=self.args.all_commits,
                     with_deps=self.args.with_deps,
                     recursive=self.args.recursive,
+                    refresh_remote_index=self.args.refresh_remote_index,
                 )
             except DvcException:
                 logger.exception("")
@@ -80,12 +80,15 @@ REMOTE_COMMON = {
     "jobs": All(Coerce(int), Range(1)),
     Optional("no_traverse"): Bool,  # obsoleted
     "verify": Bool,
+    "pack_threshold": All(Coerce(int), Range(1)),
 }
 LOCAL_COMMON = {
     "type": supported_cache_type,
     Optional("protected", default=False): Bool,  # obsoleted
     "shared": All(Lower, Choices("group")),
     Optional("slow_link_warning", default=True): Bool,
+    "chunk_threshold": All(Coerce(int), Range(1)),
+    "hash": All(Lower, Choices("md5", "sha256", "blake3")),
 }
 HTTP_COMMON = {
     "auth": All(Lower, Choices("basic", "digest", "custom")),
@@ -111,6 +114,7 @@ SCHEMA = {
     "core": {
         "remote": Lower,
         "checksum_jobs": All(Coerce(int), Range(1)),
+        "hash_backend": All(Lower, Choices("thread", "process")),
         Optional("interactive", default=False): Bool,
         Optional("analytics", default=True): Bool,
         Optional("hardlink_lock", default=False): Bool,
@@ -228,6 +232,7 @@ SCHEMA = {
     },
     "state": {
         "dir": str,
+        Optional("trust_dir_mtime", default=False): Bool,
         "row_limit": All(Coerce(int), Range(1)),  # obsoleted
         "row_cleanup_quota": All(Coerce(int), Range(0, 100)),  # obsoleted
     },
@@ -1,13 +1,14 @@
 """Manages dvc remotes that user can use with push/pull/status commands."""
 
 import logging
-from typing import TYPE_CHECKING, Iterable, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
 
-from dvc.objects.db import get_index
+from dvc.objects.db import get_index, get_snapshot
 
 if TYPE_CHECKING:
     from dvc.hash_info import HashInfo
     from dvc.objects.db.base import ObjectDB
+    from dvc.objects.db.index import ObjectDBSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,12 @@ class DataCloud:
 
     def __init__(self, repo):
         self.repo = repo
+        self._snapshots: Dict[str, "ObjectDBSnapshot"] = {}
+
+    def close(self):
+        for snapshot in self._snapshots.values():
+            snapshot.close()
+        self._snapshots.clear()
 
     def get_remote_odb(
         self,
@@ -62,12 +69,28 @@ class DataCloud:
         config["tmp_dir"] = self.repo.index_db_dir
         return get_odb(cls(**config), fs_path, **config)
 
+    def _get_snapshot(self, odb, jobs=None, refresh=False):
+        snapshot = get_snapshot(odb)
+        if snapshot is None:
+            return None
+        # NOTE: reuse a single snapshot (and its sqlite connection) per ODB
+        snapshot = self._snapshots.setdefault(snapshot.path, snapshot)
+        # prefixes which are older than `MAX_AGE` are always re-listed
+        snapshot.refresh(
+            odb,
+            jobs=jobs,
+            name=odb.fs_path,
+            max_age=None if refresh else snapshot.MAX_AGE,
+        )
+        return snapshot
+
     def push(
         self,
         objs: Iterable["HashInfo"],
         jobs: Optional[int] = None,
         remote: Optional[str] = None,
         odb: Optional["ObjectDB"] = None,
+        refresh_index: bool = False,
     ):
         """Push data items in a cloud-agnostic way.
 
@@ -77,6 +100,8 @@ class DataCloud:
             remote: optional name of remote to push to.
                 By default remote from core.remote config option is used.
             odb: optional ODB to push to. Overrides remote.
+            refresh_index: re-list the remote before pushing, instead of
+                relying on the hashes it was last known to contain.
         """
         from dvc.objects.transfer import transfer
 
@@ -88,6 +113,7 @@ class DataCloud:
             objs,
             jobs=jobs,
             dest_index=get_index(odb),
+            dest_snapshot=self._get_snapshot(odb, jobs, refresh_index),
             cache_odb=self.repo.odb.local,
         )
 
@@ -97,6 +123,7 @@ class DataCloud:
         jobs: Optional[int] = None,
         remote: Optional[str] = None,
         odb: Optional["ObjectDB"] = None,
+        refresh_index: bool = False,
     ):
         """Pull data items in a cloud-agnostic way.
 
@@ -106,6 +133,8 @@ class DataCloud:
             remote: optional name of remote to pull from.
                 By default remote from core.remote config option is used.
             odb: optional ODB to pull from. Overrides remote.
+            refresh_index: re-list the remote before pulling, instead of
+                relying on the hashes it was last known to contain.
         """
         from dvc.objects.transfer import transfer
 
@@ -117,6 +146,7 @@ class DataCloud:
             objs,
             jobs=jobs,
             src_index=get_index(odb),
+            src_snapshot=self._get_snapshot(odb, jobs, refresh_index),
             cache_odb=self.repo.odb.local,
             verify=odb.verify,
         )
@@ -128,6 +158,7 @@ class DataCloud:
         remote: Optional[str] = None,
         odb: Optional["ObjectDB"] = None,
         log_missing: bool = True,
+        refresh_index: bool = False,
     ):
         """Check status of data items in a cloud-agnostic way.
 
@@ -140,6 +171,8 @@ class DataCloud:
             odb: optional ODB to check status from. Overrides remote.
             log_missing: log warning messages if file doesn't exist
                 neither in cache, neither in cloud.
+            refresh_index: re-list the remote before comparing, instead of
+                relying on the hashes it was last known to contain.
         """
         from dvc.objects.status import compare_status
 
@@ -152,6 +185,7 @@ class DataCloud:
             jobs=jobs,
             log_missing=log_missing,
             dest_index=get_index(odb),
+            dest_snapshot=self._get_snapshot(odb, jobs, refresh_index),
             cache_odb=self.repo.odb.local,
         )
 
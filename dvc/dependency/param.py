@@ -1,6 +1,7 @@
 import logging
 import os
 from collections import defaultdict
+from functools import partial
 
 import dpath.util
 from voluptuous import Any
@@ -95,7 +96,12 @@ class ParamsDependency(Dependency):
         suffix = self.repo.fs.path.suffix(self.fs_path).lower()
         loader = LOADERS[suffix]
         try:
-            return loader(self.fs_path, fs=self.repo.fs)
+            return self.repo.parse_cache.load(
+                self.repo.fs,
+                self.fs_path,
+                f"params{suffix}",
+                partial(loader, self.fs_path, fs=self.repo.fs),
+            )
         except ParseError as exc:
             raise BadParamFileError(
                 f"Unable to read parameters from '{self}'"
@@ -1,6 +1,7 @@
 import contextlib
 import logging
 import os
+from functools import partial
 from typing import TYPE_CHECKING, Any, Callable, Tuple, TypeVar, Union
 
 from dvc.exceptions import DvcException
@@ -158,12 +159,21 @@ class FileMixin:
     def _load_yaml(self, **kwargs: Any) -> Tuple[Any, str]:
         from dvc.utils import strictyaml
 
-        return strictyaml.load(
+        load = partial(
+            strictyaml.load,
             self.path,
             self.SCHEMA,  # type: ignore[arg-type]
             self.repo.fs,
             **kwargs,
         )
+        if kwargs:
+            return load()
+        if not self.repo.index_cache.enabled:
+            # NOTE: dvcfiles from git revisions are cached by their blob ids
+            return self.repo.parse_cache.load(
+                self.repo.fs, self.path, type(self).__name__, load
+            )
+        return self.repo.index_cache.load_yaml(self.path, load)
 
     def remove(self, force=False):  # pylint: disable=unused-argument
         with contextlib.suppress(FileNotFoundError):
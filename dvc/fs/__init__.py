@@ -108,6 +108,11 @@ def get_cloud_fs(repo, **kwargs):
         if checksum_jobs:
             remote_conf["checksum_jobs"] = checksum_jobs
 
+    if "hash_backend" not in remote_conf:
+        hash_backend = core_config.get("hash_backend")
+        if hash_backend:
+            remote_conf["hash_backend"] = hash_backend
+
     cls = get_fs_cls(remote_conf)
 
     if cls == GDriveFileSystem and repo:
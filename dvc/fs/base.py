@@ -44,6 +44,7 @@ class FileSystem:
     _JOBS = 4 * cpu_count()
 
     HASH_JOBS = max(1, min(4, cpu_count() // 2))
+    HASH_BACKEND = "thread"
     LIST_OBJECT_PAGE_SIZE = 1000
     TRAVERSE_WEIGHT_MULTIPLIER = 5
     TRAVERSE_PREFIX_LEN = 3
@@ -60,6 +61,7 @@ class FileSystem:
 
         self.jobs = kwargs.get("jobs") or self._JOBS
         self.hash_jobs = kwargs.get("checksum_jobs") or self.HASH_JOBS
+        self.hash_backend = kwargs.get("hash_backend") or self.HASH_BACKEND
         self._config = kwargs
 
     @property
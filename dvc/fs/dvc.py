@@ -31,6 +31,7 @@ class DvcFileSystem(FileSystem):  # pylint:disable=abstract-method
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.repo = kwargs["repo"]
+        self._trees = {}
 
     @property
     def config(self):
@@ -48,18 +49,36 @@ class DvcFileSystem(FileSystem):  # pylint:disable=abstract-method
 
         return outs
 
+    def _load_tree(self, out: "Output", remote=None):
+        from dvc.objects.compact_tree import CompactTree
+        from dvc.objects.errors import ObjectFormatError
+
+        if out.obj is not None:
+            return out.obj
+
+        tree = self._trees.get(out.hash_info)
+        if tree is not None:
+            return tree
+
+        try:
+            tree = CompactTree.load(out.odb, out.hash_info)
+        except (FileNotFoundError, ObjectFormatError):
+            out.get_dir_cache(remote=remote)
+            if out.obj is None:
+                raise FileNotFoundError
+            tree = out.obj
+        self._trees[out.hash_info] = tree
+        return tree
+
     def _get_granular_hash(self, path: "AnyPath", out: "Output", remote=None):
         # NOTE: use string paths here for performance reasons
         key = tuple(relpath(path, out.fs_path).split(os.sep))
-        out.get_dir_cache(remote=remote)
-        if out.obj is None:
-            raise FileNotFoundError
-        (_, oid) = out.obj.trie.get(key) or (None, None)
+        oid = self._load_tree(out, remote=remote).get_oid(key)
         if oid:
             return oid
         raise FileNotFoundError
 
-    def _get_fs_path(self, path: "AnyPath", remote=None):
+    def _get_odb_and_hash(self, path: "AnyPath", remote=None):
         try:
             outs = self._find_outs(path, strict=False)
         except OutputNotFoundError as exc:
@@ -82,27 +101,32 @@ class DvcFileSystem(FileSystem):  # pylint:disable=abstract-method
                 remote_odb = self.repo.cloud.get_remote_odb(remote)
             except NoRemoteError as exc:
                 raise FileNotFoundError from exc
-            if out.is_dir_checksum:
-                checksum = self._get_granular_hash(path, out).value
-            else:
-                checksum = out.hash_info.value
-            remote_fs_path = remote_odb.hash_to_path(checksum)
-            return remote_odb.fs, remote_fs_path
+            odb = remote_odb
+        else:
+            odb = out.odb
 
         if out.is_dir_checksum:
-            checksum = self._get_granular_hash(path, out).value
-            cache_path = out.odb.fs.unstrip_protocol(
-                out.odb.hash_to_path(checksum)
-            )
-        else:
-            cache_path = out.cache_path
-        return out.odb.fs, cache_path
+            return odb, self._get_granular_hash(path, out)
+        return odb, out.hash_info
+
+    def _get_fs_path(self, path: "AnyPath", remote=None):
+        odb, hash_info = self._get_odb_and_hash(path, remote=remote)
+        return odb.fs, odb.fs.unstrip_protocol(
+            odb.hash_to_path(hash_info.value)
+        )
 
     def open(  # type: ignore
         self, path: str, mode="r", encoding=None, **kwargs
     ):  # pylint: disable=arguments-renamed
-        fs, fspath = self._get_fs_path(path, **kwargs)
-        return fs.open(fspath, mode=mode, encoding=encoding)
+        from dvc.objects.chunked import ChunkedFile
+
+        odb, hash_info = self._get_odb_and_hash(path, **kwargs)
+        if hash_info.ischunked:
+            obj = ChunkedFile.load(odb, hash_info)
+            return obj.open(odb, mode=mode, encoding=encoding)
+        obj = odb.get(hash_info)
+        fspath = obj.fs.unstrip_protocol(obj.fs_path)
+        return obj.fs.open(fspath, mode=mode, encoding=encoding)
 
     def exists(self, path):  # pylint: disable=arguments-renamed
         try:
@@ -252,7 +276,9 @@ class DvcFileSystem(FileSystem):  # pylint:disable=abstract-method
         elif meta.part_of_output:
             (out,) = meta.outs
             key = self.path.parts(self.path.relpath(path, out.fs_path))
-            (obj_meta, oid) = out.obj.trie.get(key) or (None, None)
+            tree = self._load_tree(out)
+            oid = tree.get_oid(key)
+            obj_meta = out.obj.trie[key][0] if out.obj and oid else None
             if oid:
                 ret["size"] = obj_meta.size if obj_meta else 0
                 ret[oid.name] = oid.value
@@ -262,14 +288,25 @@ class DvcFileSystem(FileSystem):  # pylint:disable=abstract-method
     def get_file(
         self, from_info, to_file, callback=DEFAULT_CALLBACK, **kwargs
     ):
-        fs, path = self._get_fs_path(from_info)
-        fs.get_file(  # pylint: disable=protected-access
+        odb, hash_info = self._get_odb_and_hash(from_info)
+        if hash_info.ischunked:
+            from dvc.fs.local import localfs
+
+            with self.open(from_info, mode="rb") as fobj:
+                localfs.upload_fobj(fobj, to_file)
+            return
+
+        obj = odb.get(hash_info)
+        path = obj.fs.unstrip_protocol(obj.fs_path)
+        obj.fs.get_file(  # pylint: disable=protected-access
             path, to_file, callback=callback, **kwargs
         )
 
     def checksum(self, path):
+        from dvc.hash_info import HASH_NAMES
+
         info = self.info(path)
-        md5 = info.get("md5")
-        if md5:
-            return md5
+        for name in HASH_NAMES:
+            if info.get(name):
+                return info[name]
         raise NotImplementedError
@@ -1,6 +1,21 @@
 import os
 import shutil
-from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, Optional, overload
+from contextlib import suppress
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
 from funcy import cached_property
 from tqdm.utils import CallbackIOWrapper
@@ -20,6 +35,10 @@ if TYPE_CHECKING:
 # in the future (e.g for properly type 'size' etc).
 Entry = Dict[str, Any]
 
+# Called with source and destination paths and the raised exception (if any)
+# once a transfer is finished.
+TransferCallback = Callable[[AnyFSPath, AnyFSPath, Optional[Exception]], Any]
+
 
 # pylint: disable=no-member
 class FSSpecWrapper(FileSystem):
@@ -109,7 +128,13 @@ class FSSpecWrapper(FileSystem):
     def move(self, from_info: AnyFSPath, to_info: AnyFSPath) -> None:
         self.fs.move(from_info, to_info)
 
-    def remove(self, path: AnyFSPath) -> None:
+    def remove(self, path: Union[AnyFSPath, List[AnyFSPath]]) -> None:
+        if isinstance(path, list):
+            # NOTE: lets the filesystem use bulk deletes if it supports them
+            # (e.g. DeleteObjects in s3fs)
+            if path:
+                self.fs.rm(path)
+            return
         self.fs.rm_file(path)
 
     def info(self, path: AnyFSPath) -> "Entry":
@@ -144,6 +169,105 @@ class FSSpecWrapper(FileSystem):
                 fobj, fdest, length=getattr(fdest, "blocksize", None)
             )
 
+    @property
+    def async_impl(self) -> bool:
+        """Whether the underlying fsspec filesystem is async-capable."""
+        return getattr(self.fs, "async_impl", False)
+
+    async def _put_file_async(
+        self, from_file: AnyFSPath, to_info: AnyFSPath
+    ) -> None:
+        await self.fs._put_file(from_file, to_info)
+
+    async def _get_file_async(
+        self, from_info: AnyFSPath, to_file: AnyFSPath
+    ) -> None:
+        from dvc.utils import tmp_fname
+        from dvc.utils.fs import makedirs
+
+        makedirs(os.path.dirname(to_file), exist_ok=True)
+        tmp_file = tmp_fname(to_file)
+        try:
+            await self.fs._get_file(from_info, tmp_file)
+        except Exception:  # pylint: disable=broad-except
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_file)
+            raise
+        os.replace(tmp_file, to_file)
+
+    def _run_many(
+        self,
+        func: Callable[[AnyFSPath, AnyFSPath], Awaitable[None]],
+        pairs: Iterable[Tuple[AnyFSPath, AnyFSPath]],
+        jobs: Optional[int] = None,
+        callback: Optional[TransferCallback] = None,
+    ) -> None:
+        import asyncio
+
+        from fsspec.asyn import sync
+
+        async def _worker(it):
+            for from_info, to_info in it:
+                exc = None
+                try:
+                    await func(from_info, to_info)
+                except Exception as _exc:  # pylint: disable=broad-except
+                    exc = _exc
+                if callback:
+                    callback(from_info, to_info, exc)
+
+        async def _run():
+            # NOTE: workers share a single iterator, so that no more than
+            # `jobs` transfers are in flight and there is no need to create a
+            # task for every file beforehand.
+            it = iter(pairs)
+            await asyncio.gather(
+                *(_worker(it) for _ in range(jobs or self.jobs))
+            )
+
+        sync(self.fs.loop, _run)
+
+    def put_many(
+        self,
+        pairs: Iterable[Tuple[AnyFSPath, AnyFSPath]],
+        jobs: Optional[int] = None,
+        callback: Optional[TransferCallback] = None,
+    ) -> None:
+        """Upload (local path, remote path) pairs in a single event loop.
+
+        Requires an async-capable fsspec filesystem. At most `jobs` uploads
+        run concurrently. `callback` is called with the paths and the raised
+        exception (or None) once each of the uploads is finished.
+        """
+        assert self.async_impl
+        parents = set()
+
+        def _put_file(from_file, to_info):
+            parents.add(self.path.parent(to_info))
+            return self._put_file_async(from_file, to_info)
+
+        try:
+            self._run_many(_put_file, pairs, jobs=jobs, callback=callback)
+        finally:
+            for parent in parents:
+                self.fs.invalidate_cache(parent)
+
+    def get_many(
+        self,
+        pairs: Iterable[Tuple[AnyFSPath, AnyFSPath]],
+        jobs: Optional[int] = None,
+        callback: Optional[TransferCallback] = None,
+    ) -> None:
+        """Download (remote path, local path) pairs in a single event loop.
+
+        Same as `put_many`, but files are downloaded to a temporary file
+        first and moved to the destination once they are complete.
+        """
+        assert self.async_impl
+        self._run_many(
+            self._get_file_async, pairs, jobs=jobs, callback=callback
+        )
+
 
 # pylint: disable=abstract-method
 class ObjectFSWrapper(FSSpecWrapper):
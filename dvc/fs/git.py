@@ -1,15 +1,164 @@
 import os
 import threading
-from typing import TYPE_CHECKING, Any, Callable
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Tuple
 
 from funcy import cached_property, wrap_prop
+from scmrepo.fs import GitFileSystem as FsspecGitFileSystem
 
 from .fsspec_wrapper import AnyFSPath, FSSpecWrapper
 
 if TYPE_CHECKING:
-    from scmrepo.fs import GitFileSystem as FsspecGitFileSystem
     from scmrepo.git import Git
-    from scmrepo.git.objects import GitTrie
+    from scmrepo.git.objects import GitObject, GitTrie
+
+
+class GitTreeCache:
+    """Entries of git trees and sizes of blobs, by their SHAs.
+
+    Most of the trees are the same between revisions, so the cache is
+    shared between the filesystems of all revisions of a repo (see
+    `get_tree_cache()`) and each tree is only read from git once.
+    """
+
+    MAX_TREES = 10_000
+    MAX_SIZES = 100_000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._trees: "OrderedDict[str, Dict[str, GitObject]]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+
+    def entries(self, tree: "GitObject") -> Dict[str, "GitObject"]:
+        sha = tree.sha
+        with self._lock:
+            entries = self._trees.get(sha)
+            if entries is not None:
+                self._trees.move_to_end(sha)
+                return entries
+
+        entries = {obj.name: obj for obj in tree.scandir()}
+        with self._lock:
+            self._trees[sha] = entries
+            if len(self._trees) > self.MAX_TREES:
+                self._trees.popitem(last=False)
+        return entries
+
+    def size(self, obj: "GitObject") -> int:
+        sha = obj.sha
+        size = self._sizes.get(sha)
+        if size is None:
+            # NOTE: `obj.size` reads the whole object
+            size = obj.size
+            with self._lock:
+                if len(self._sizes) >= self.MAX_SIZES:
+                    self._sizes.clear()
+                self._sizes[sha] = size
+        return size
+
+
+_tree_caches: "weakref.WeakKeyDictionary[Git, GitTreeCache]" = (
+    weakref.WeakKeyDictionary()
+)
+_tree_caches_lock = threading.Lock()
+
+
+def get_tree_cache(scm: "Git") -> GitTreeCache:
+    with _tree_caches_lock:
+        cache = _tree_caches.get(scm)
+        if cache is None:
+            cache = _tree_caches[scm] = GitTreeCache()
+        return cache
+
+
+class LazyGitTrie:
+    """Same interface as `scmrepo.git.objects.GitTrie`, but trees are read
+    on demand through `GitTreeCache`, instead of reading the whole tree
+    of a revision upfront.
+    """
+
+    def __init__(self, tree: "GitObject", rev: str, cache: GitTreeCache):
+        self.tree = tree
+        self.rev = rev
+        self.cache = cache
+
+    def _get(self, key: Tuple[str, ...]) -> "GitObject":
+        obj = self.tree
+        for part in key:
+            if not obj.isdir:
+                raise KeyError(key)
+            obj = self.cache.entries(obj)[part]
+        return obj
+
+    def open(self, key: tuple, mode: str = "r", encoding: str = None):
+        obj = self._get(key)
+        if obj.isdir:
+            raise IsADirectoryError
+        return obj.open(mode=mode, encoding=encoding)
+
+    def exists(self, key: tuple) -> bool:
+        try:
+            self._get(key)
+        except KeyError:
+            return False
+        return True
+
+    def isdir(self, key: tuple) -> bool:
+        try:
+            return self._get(key).isdir
+        except KeyError:
+            return False
+
+    def isfile(self, key: tuple) -> bool:
+        try:
+            return self._get(key).isfile
+        except KeyError:
+            return False
+
+    def walk(self, top: tuple, topdown: bool = True):
+        dirs = []
+        nondirs = []
+        for name, obj in self.cache.entries(self._get(top)).items():
+            if obj.isdir:
+                dirs.append(name)
+            else:
+                nondirs.append(name)
+
+        if topdown:
+            yield top, dirs, nondirs
+
+        for dname in dirs:
+            yield from self.walk(top + (dname,), topdown=topdown)
+
+        if not topdown:
+            yield top, dirs, nondirs
+
+    def info(self, key: tuple) -> dict:
+        import stat
+
+        obj = self._get(key)
+        return {
+            "size": self.cache.size(obj),
+            "type": "directory" if stat.S_ISDIR(obj.mode) else "file",
+            "sha": obj.sha,
+            "mode": obj.mode,
+        }
+
+
+class _GitFileSystem(FsspecGitFileSystem):  # pylint:disable=abstract-method
+    def _get_key(self, path: str) -> Tuple[str, ...]:
+        # NOTE: fast path for normalized absolute paths, which is
+        # what dvc uses, as `relpath` is comparatively slow.
+        path = os.fspath(path)
+        root = self.root_dir
+        if path == root:
+            return ()
+        if path.startswith(root) and path[len(root)] == os.sep:
+            parts = tuple(path[len(root) + 1 :].split(os.sep))
+            if all(part not in ("", ".", "..") for part in parts):
+                return parts
+        return super()._get_key(path)
 
 
 class GitFileSystem(FSSpecWrapper):  # pylint:disable=abstract-method
@@ -43,9 +192,17 @@ class GitFileSystem(FSSpecWrapper):  # pylint:disable=abstract-method
     @wrap_prop(threading.Lock())
     @cached_property
     def fs(self) -> "FsspecGitFileSystem":
-        from scmrepo.fs import GitFileSystem as FsspecGitFileSystem
-
-        return FsspecGitFileSystem(**self.fs_args)
+        fs_args = self.fs_args
+        scm = fs_args["scm"]
+        if scm is not None and not fs_args["trie"]:
+            resolved = fs_args["rev_resolver"](scm, fs_args["rev"] or "HEAD")
+            trie = LazyGitTrie(
+                scm.pygit2.get_tree_obj(rev=resolved),
+                resolved,
+                get_tree_cache(scm),
+            )
+            fs_args = {**fs_args, "path": scm.root_dir, "trie": trie}
+        return _GitFileSystem(**fs_args)
 
     @property
     def rev(self) -> str:
@@ -139,3 +139,8 @@ class HTTPFileSystem(NoDirectoriesMixin, FSSpecWrapper):
     ) -> None:
         kwargs.setdefault("method", self.upload_method)
         super().put_file(from_file, to_info, callback=callback, **kwargs)
+
+    async def _put_file_async(
+        self, from_file: AnyFSPath, to_info: AnyFSPath
+    ) -> None:
+        await self.fs._put_file(from_file, to_info, method=self.upload_method)
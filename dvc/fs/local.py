@@ -1,5 +1,6 @@
 import logging
 import os
+from typing import Iterable, Iterator, NamedTuple
 
 from dvc.scheme import Schemes
 from dvc.system import System
@@ -12,6 +13,41 @@ from .base import FileSystem
 logger = logging.getLogger(__name__)
 
 
+class ScanEntry(NamedTuple):
+    """Stat results of a file found while scanning a directory.
+
+    `mtime` and `size` are those of the symlink target, like in `info()`,
+    while `inode` is the one of the link itself, like in `System.inode()`.
+    """
+
+    path: str
+    inode: int
+    mtime: float
+    size: int
+    is_symlink: bool
+
+
+def scan_entries(entries: Iterable[os.DirEntry]) -> Iterator[ScanEntry]:
+    """Stat files listed by `os.scandir()`.
+
+    This takes a single `stat()` call per file, as the inode and the type
+    of the entry come with the directory listing. Broken symlinks and
+    files removed in the meantime are skipped.
+    """
+    for entry in entries:
+        try:
+            st = entry.stat()
+        except FileNotFoundError:
+            continue
+        yield ScanEntry(
+            entry.path,
+            entry.inode(),
+            st.st_mtime,
+            st.st_size,
+            entry.is_symlink(),
+        )
+
+
 class LocalFileSystem(FileSystem):
     sep = os.sep
 
@@ -62,6 +98,52 @@ class LocalFileSystem(FileSystem):
         ):
             yield os.path.normpath(root), dirs, files
 
+    def walk_entries(self, top, onerror=None):
+        """Directory fs generator, like `walk`, but yielding `os.DirEntry`
+        objects for files, so that stat results from the directory listing
+        can be reused.
+
+        Yields (root, dirs, entries) tuples, where `dirs` can be modified
+        in place to skip directories, like with `os.walk`.
+        """
+        stack = [os.path.normpath(top)]
+        while stack:
+            root = stack.pop()
+            dirs = []
+            links = set()
+            entries = []
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if not is_dir:
+                            entries.append(entry)
+                            continue
+                        dirs.append(entry.name)
+                        if entry.is_symlink():
+                            links.add(entry.name)
+            except OSError as exc:
+                if onerror is not None:
+                    onerror(exc)
+                continue
+
+            yield root, dirs, entries
+            # NOTE: like `os.walk`, symlinks to directories are listed, but
+            # not walked into
+            stack.extend(
+                os.path.join(root, dname)
+                for dname in reversed(dirs)
+                if dname not in links
+            )
+
+    def scan(self, path) -> Iterator[ScanEntry]:
+        """Like `find`, but yields files along with their stat results."""
+        for _, _, entries in self.walk_entries(path):
+            yield from scan_entries(entries)
+
     def find(self, path, prefix=None):
         for root, _, files in self.walk(path):
             for file in files:
@@ -78,6 +160,10 @@ class LocalFileSystem(FileSystem):
         return False
 
     def remove(self, path):
+        if isinstance(path, list):
+            for fs_path in path:
+                remove(fs_path)
+            return
         remove(path)
 
     def makedirs(self, path, **kwargs):
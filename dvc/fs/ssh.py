@@ -34,6 +34,9 @@ class SSHFileSystem(FSSpecWrapper):
     DEFAULT_PORT = 22
     PARAM_CHECKSUM = "md5"
 
+    # NOTE: uploads need to go through `as_atomic`, see `put_file`
+    async_impl = False
+
     @classmethod
     def _strip_protocol(cls, path: str) -> str:
         from fsspec.utils import infer_storage_options
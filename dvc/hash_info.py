@@ -3,6 +3,13 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 HASH_DIR_SUFFIX = ".dir"
+HASH_CHUNKS_SUFFIX = ".chunks"
+
+# NOTE: hashes of the contents of files, which (unlike e.g. etags assigned
+# by clouds) can be computed locally for any object. md5 is the default,
+# others can be configured with `cache.hash`.
+DEFAULT_HASH_NAME = "md5"
+HASH_NAMES = ("md5", "sha256", "blake3")
 
 
 @dataclass
@@ -41,3 +48,9 @@ class HashInfo:
         if not self:
             return False
         return self.value.endswith(HASH_DIR_SUFFIX)
+
+    @property
+    def ischunked(self):
+        if not self:
+            return False
+        return self.value.endswith(HASH_CHUNKS_SUFFIX)
@@ -2,22 +2,191 @@ import logging
 import os
 import re
 from collections import namedtuple
-from itertools import groupby, takewhile
+from functools import lru_cache
+from itertools import takewhile
+from typing import FrozenSet, Set, Tuple
 
 from pathspec.patterns import GitWildMatchPattern
 from pathspec.util import normalize_file
 
 from dvc.fs.base import FileSystem
-from dvc.fs.local import localfs
+from dvc.fs.local import LocalFileSystem, localfs, scan_entries
 from dvc.pathspec_math import PatternInfo, merge_patterns
 from dvc.scheme import Schemes
-from dvc.types import AnyPath, List, Optional
+from dvc.types import AnyPath, Dict, List, Optional
 from dvc.utils import relpath
 from dvc.utils.collections import PathStringTrie
 
 logger = logging.getLogger(__name__)
 
 
+_translate_segment_glob = (
+    GitWildMatchPattern._translate_segment_glob  # pylint: disable=W0212
+)
+
+# NOTE: state of a rule which matched a parent directory of the path, which
+# means that it also matches everything underneath it.
+_MATCHED = -1
+
+
+class _UnsupportedPattern(Exception):
+    pass
+
+
+class _SegmentRule:
+    """Gitignore pattern, which is matched one path component at a time.
+
+    Follows the normalization of `GitWildMatchPattern.pattern_to_regex`,
+    but keeps the pattern split into segments, so that it can be applied
+    to the components of a directory once and then only the names of its
+    entries need to be matched.
+
+    States are indexes of the next segment to match.
+    """
+
+    STAR_REGEX = "[^/]+"
+
+    def __init__(self, pattern: str, ignore: bool):
+        self.ignore = ignore
+        self.segs = self._normalize(pattern)
+        self.globs = [
+            self.STAR_REGEX if seg == "*" else _translate_segment_glob(seg)
+            for seg in self.segs
+        ]
+        self.regexes = [re.compile(glob) for glob in self.globs]
+
+        self.end = len(self.segs)
+        last = self.segs[-1]
+        # `**` at the end matches everything inside, but not the path itself
+        self.end_star = self.end - 1 if last == "**" else None
+        # patterns ending with a name also match everything inside of it
+        self.trailing = ignore and last not in ("**", "*")
+        self.closures = [self._closure(i) for i in range(self.end + 1)]
+        self.start = self.closures[0]
+
+    @staticmethod
+    def _normalize(pattern: str) -> List[str]:
+        pattern = pattern.strip()
+        if pattern.startswith("!"):
+            pattern = pattern[1:]
+        if pattern.startswith("\\"):
+            pattern = pattern[1:]
+
+        segs = pattern.split("/")
+        for i in range(len(segs) - 1, 0, -1):
+            if segs[i - 1] == "**" and segs[i] == "**":
+                del segs[i]
+
+        if len(segs) == 2 and segs[0] == "**" and not segs[1]:
+            raise _UnsupportedPattern(pattern)
+
+        if not segs[0]:
+            del segs[0]
+        elif len(segs) == 1 or (len(segs) == 2 and not segs[1]):
+            if segs[0] != "**":
+                segs.insert(0, "**")
+
+        if not segs:
+            raise _UnsupportedPattern(pattern)
+
+        if not segs[-1] and len(segs) > 1:
+            segs[-1] = "**"
+            if segs == ["**", "**"]:
+                # EDGE CASE: `/**/` doesn't match anything in pathspec
+                raise _UnsupportedPattern(pattern)
+        return segs
+
+    def _closure(self, i: int) -> FrozenSet[int]:
+        states = {i}
+        # `**` (unless it's at the end) also matches zero components
+        while i < self.end and i != self.end_star and self.segs[i] == "**":
+            i += 1
+            states.add(i)
+        return frozenset(states)
+
+    def step(self, states: FrozenSet[int], name: str) -> FrozenSet[int]:
+        ret: Set[int] = set()
+        for i in states:
+            if i == _MATCHED or i == self.end_star:
+                ret.add(_MATCHED)
+            elif i == self.end:
+                if self.trailing:
+                    ret.add(_MATCHED)
+            elif self.segs[i] == "**":
+                ret.update(self.closures[i])
+            elif self.regexes[i].fullmatch(name):
+                ret.update(self.closures[i + 1])
+        return frozenset(ret)
+
+    def globs_for(
+        self, states: FrozenSet[int]
+    ) -> Optional[Tuple[List[str], List[str]]]:
+        """Return globs, which the names of files and directories inside of
+        a directory with the specified states need to match, or None if the
+        rule matches all of them."""
+        if (
+            _MATCHED in states
+            or self.end_star in states
+            or (self.trailing and self.end in states)
+        ):
+            return None
+
+        files: List[str] = []
+        dirs: List[str] = []
+        for i in states:
+            if i == self.end or self.segs[i] == "**":
+                continue
+            closure = self.closures[i + 1]
+            if self.end in closure:
+                files.append(self.globs[i])
+                dirs.append(self.globs[i])
+            elif self.end_star in closure:
+                dirs.append(self.globs[i])
+        return files, dirs
+
+
+# (regex, verdicts of its groups, verdict if nothing matched)
+_NameMatcher = Tuple[Optional["re.Pattern"], List[bool], bool]
+
+
+@lru_cache(maxsize=1024)
+def _compile_name_matcher(
+    alternatives: Tuple[Tuple[Tuple[str, ...], bool], ...], default: bool
+) -> _NameMatcher:
+    groups: List[Tuple[List[str], bool]] = []
+    for globs, ignore in alternatives:
+        # consecutive alternatives with the same verdict share a group
+        if groups and groups[-1][1] == ignore:
+            groups[-1][0].extend(globs)
+        else:
+            groups.append((list(globs), ignore))
+
+    if not groups:
+        return None, [], default
+
+    regex = re.compile(
+        "|".join(
+            "({})".format("|".join(dict.fromkeys(globs)))
+            for globs, _ in groups
+        )
+    )
+    return regex, [False] + [ignore for _, ignore in groups], default
+
+
+def _filter_names(names: List[str], matcher: _NameMatcher) -> List[str]:
+    regex, verdicts, default = matcher
+    if regex is None:
+        return [] if default else names
+
+    # NOTE: the regex is applied with `map`, which avoids a python-level
+    # call per entry
+    return [
+        name
+        for name, match in zip(names, map(regex.fullmatch, names))
+        if not (verdicts[match.lastindex] if match else default)
+    ]
+
+
 class DvcIgnore:
     DVCIGNORE_FILE = ".dvcignore"
 
@@ -42,13 +211,40 @@ class DvcIgnorePatterns(DvcIgnore):
             for pattern_info in pattern_list
         ]
 
-        self.ignore_spec = [
-            (ignore, re.compile("|".join(item[0] for item in group)))
-            for ignore, group in groupby(
-                self.regex_pattern_list, lambda x: x[1]
-            )
+        # NOTE: the last pattern that matches a path decides whether it is
+        # ignored, so all of the patterns are combined into a single regex
+        # as alternatives in reverse order. The first alternative (i.e. the
+        # capturing group) that matches gives the verdict.
+        patterns = [
+            (regex, ignore)
+            for regex, ignore in reversed(self.regex_pattern_list)
             if ignore is not None
         ]
+        self._verdicts = [False] + [ignore for _, ignore in patterns]
+        self._regex = (
+            re.compile("|".join(f"({regex})" for regex, _ in patterns))
+            if patterns
+            else None
+        )
+
+        # NOTE: `filter()` applies the rules to the components of the
+        # directory once (memoizing their states for the subdirectories)
+        # and then only needs to match the names of the entries.
+        self._rules: Optional[List[_SegmentRule]]
+        try:
+            self._rules = [
+                _SegmentRule(pattern_info.patterns, ignore)
+                for pattern_info, (_, ignore) in zip(
+                    pattern_list, self.regex_pattern_list
+                )
+                if ignore is not None
+            ]
+        except _UnsupportedPattern:
+            self._rules = None
+        self._dir_states: Dict[str, Tuple[FrozenSet[int], ...]] = {}
+        self._matchers: Dict[
+            Tuple[FrozenSet[int], ...], Tuple[_NameMatcher, _NameMatcher]
+        ] = {}
 
     @classmethod
     def from_file(cls, path, fs, name):
@@ -65,11 +261,87 @@ class DvcIgnorePatterns(DvcIgnore):
 
         return cls(path_spec_lines, dirname)
 
-    def __call__(self, root: List[str], dirs: List[str], files: List[str]):
-        files = [f for f in files if not self.matches(root, f)]
-        dirs = [d for d in dirs if not self.matches(root, d, True)]
+    def __call__(self, root: str, dirs: List[str], files: List[str]):
+        return self.filter(root, dirs, files)
 
-        return dirs, files
+    def filter(self, root: str, dirs: List[str], files: List[str]):
+        """Filter out ignored entries of the `root` directory in bulk."""
+        prefix = self._get_prefix(root)
+        if prefix is None or self._regex is None:
+            return dirs, files
+
+        if self._rules is None:
+            files = [f for f in files if not self.ignore(prefix + f, False)]
+            dirs = [d for d in dirs if not self.ignore(prefix + d, True)]
+            return dirs, files
+
+        files_matcher, dirs_matcher = self._get_name_matchers(prefix)
+        return (
+            _filter_names(dirs, dirs_matcher),
+            _filter_names(files, files_matcher),
+        )
+
+    def _get_states(self, prefix: str) -> Tuple[FrozenSet[int], ...]:
+        assert self._rules is not None
+        states = self._dir_states.get(prefix)
+        if states is None:
+            if prefix:
+                parent, _, name = prefix[:-1].rpartition("/")
+                parent_states = self._get_states(
+                    f"{parent}/" if parent else ""
+                )
+                states = tuple(
+                    rule.step(rule_states, name)
+                    for rule, rule_states in zip(self._rules, parent_states)
+                )
+            else:
+                states = tuple(rule.start for rule in self._rules)
+            self._dir_states[prefix] = states
+        return states
+
+    def _get_name_matchers(
+        self, prefix: str
+    ) -> Tuple[_NameMatcher, _NameMatcher]:
+        states = self._get_states(prefix)
+        matchers = self._matchers.get(states)
+        if matchers is None:
+            matchers = self._matchers[states] = self._build_name_matchers(
+                states
+            )
+        return matchers
+
+    def _build_name_matchers(
+        self, states: Tuple[FrozenSet[int], ...]
+    ) -> Tuple[_NameMatcher, _NameMatcher]:
+        assert self._rules is not None
+        files: List[Tuple[Tuple[str, ...], bool]] = []
+        dirs: List[Tuple[Tuple[str, ...], bool]] = []
+        default = False
+        # the last matching rule wins
+        for rule, rule_states in zip(reversed(self._rules), reversed(states)):
+            globs = rule.globs_for(rule_states)
+            if globs is None:
+                default = rule.ignore
+                break
+            files_globs, dirs_globs = globs
+            if files_globs:
+                files.append((tuple(sorted(files_globs)), rule.ignore))
+            if dirs_globs:
+                dirs.append((tuple(sorted(dirs_globs)), rule.ignore))
+        return (
+            _compile_name_matcher(tuple(files), default),
+            _compile_name_matcher(tuple(dirs), default),
+        )
+
+    def _get_prefix(self, dirname: str) -> Optional[str]:
+        if dirname == self.dirname:
+            return ""
+        if not dirname.startswith(self.prefix):
+            return None
+        rel = dirname[len(self.prefix) :]
+        if os.name == "nt":
+            rel = normalize_file(rel)
+        return f"{rel}/"
 
     def _get_normalize_path(self, dirname, basename):
         # NOTE: `relpath` is too slow, so we have to assume that both
@@ -97,21 +369,16 @@ class DvcIgnorePatterns(DvcIgnore):
         return self.ignore(path, is_dir)
 
     def ignore(self, path, is_dir):
-        def matches(pattern, path, is_dir) -> bool:
-            matches_ = bool(pattern.match(path))
-
-            if is_dir:
-                matches_ |= bool(pattern.match(f"{path}/"))
-
-            return matches_
-
-        result = False
+        if self._regex is None:
+            return False
 
-        for ignore, pattern in self.ignore_spec[::-1]:
-            if matches(pattern, path, is_dir):
-                result = ignore
-                break
-        return result
+        match = self._regex.match(path)
+        index = match.lastindex if match else None
+        if is_dir:
+            dir_match = self._regex.match(f"{path}/")
+            if dir_match and (index is None or dir_match.lastindex < index):
+                index = dir_match.lastindex
+        return bool(index) and self._verdicts[index]
 
     def _ignore_details(self, path, is_dir: bool):
         result = []
@@ -171,6 +438,7 @@ class DvcIgnoreFilter:
         self.fs = fs
         self.root_dir = root_dir
         self.ignores_trie_fs = PathStringTrie()
+        self._patterns: Dict[Tuple[str, bool], "DvcIgnorePatterns"] = {}
         self._ignores_trie_subrepos = PathStringTrie()
         self.ignores_trie_fs[root_dir] = DvcIgnorePatterns(
             default_ignore_patterns, root_dir
@@ -287,9 +555,31 @@ class DvcIgnoreFilter:
         else:
             yield from fs.find(path)
 
+    def scan(self, fs: LocalFileSystem, path: AnyPath, **kwargs):
+        """Like `find`, but yields `ScanEntry` records with the stat results
+        of the files. Only supported for the local filesystem."""
+        ignore_subrepos = kwargs.pop("ignore_subrepos", True)
+        for root, dirs, entries in fs.walk_entries(path, **kwargs):
+            names = [entry.name for entry in entries]
+            dirs[:], names = self(
+                root, dirs, names, ignore_subrepos=ignore_subrepos
+            )
+            if len(names) != len(entries):
+                kept = set(names)
+                entries = [entry for entry in entries if entry.name in kept]
+            yield from scan_entries(entries)
+
     def _get_trie_pattern(
         self, dirname, dnames: Optional["List"] = None, ignore_subrepos=True
     ) -> Optional["DvcIgnorePatterns"]:
+        # NOTE: patterns of a directory don't change once they are resolved,
+        # so they are memoized to avoid the trie lookups for every walked
+        # directory and for every `is_ignored_*` call.
+        key = (dirname, ignore_subrepos)
+        ignore_pattern = self._patterns.get(key)
+        if ignore_pattern is not None:
+            return ignore_pattern
+
         if ignore_subrepos:
             ignores_trie = self.ignores_trie_fs
         else:
@@ -297,26 +587,33 @@ class DvcIgnoreFilter:
 
         ignore_pattern = ignores_trie.get(dirname)
         if ignore_pattern:
+            self._patterns[key] = ignore_pattern
             return ignore_pattern
 
-        prefix = ignores_trie.longest_prefix(dirname).key
-        if not prefix:
-            # outside of the repo
-            return None
-
-        dirs = list(
-            takewhile(
-                lambda path: path != prefix,
-                (parent for parent in localfs.path.parents(dirname)),
+        if (os.path.dirname(dirname), ignore_subrepos) in self._patterns:
+            # the parent is already resolved, e.g. when walking top-down
+            dirs = [dirname]
+        else:
+            prefix = ignores_trie.longest_prefix(dirname).key
+            if not prefix:
+                # outside of the repo
+                return None
+
+            dirs = list(
+                takewhile(
+                    lambda path: path != prefix,
+                    (parent for parent in localfs.path.parents(dirname)),
+                )
             )
-        )
-        dirs.reverse()
-        dirs.append(dirname)
+            dirs.reverse()
+            dirs.append(dirname)
 
         for parent in dirs:
             self._update(parent, ignores_trie, dnames, ignore_subrepos)
-
-        return ignores_trie.get(dirname)
+            ignore_pattern = ignores_trie.get(parent)
+            if ignore_pattern:
+                self._patterns[(parent, ignore_subrepos)] = ignore_pattern
+        return self._patterns.get(key)
 
     def _is_ignored(
         self, path: str, is_dir: bool = False, ignore_subrepos: bool = True
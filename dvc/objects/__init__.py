@@ -1,6 +1,7 @@
 import logging
 from typing import TYPE_CHECKING, Iterator, Union
 
+from .chunked import ChunkedFile
 from .tree import Tree
 
 if TYPE_CHECKING:
@@ -13,7 +14,7 @@ logger = logging.getLogger(__name__)
 
 
 def check(odb: "ObjectDB", obj: "HashFile", **kwargs):
-    if isinstance(obj, Tree):
+    if isinstance(obj, (Tree, ChunkedFile)):
         for _, _, oid in obj:
             odb.check(oid, **kwargs)
 
@@ -23,6 +24,8 @@ def check(odb: "ObjectDB", obj: "HashFile", **kwargs):
 def load(odb: "ObjectDB", hash_info: "HashInfo") -> "HashFile":
     if hash_info.isdir:
         return Tree.load(odb, hash_info)
+    if hash_info.ischunked:
+        return ChunkedFile.load(odb, hash_info)
     return odb.get(hash_info)
 
 
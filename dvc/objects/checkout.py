@@ -1,6 +1,8 @@
 import logging
 from itertools import chain
 
+from funcy import lsplit
+
 from dvc import prompt
 from dvc.exceptions import CacheLinkError, CheckoutError, ConfirmRemoveError
 from dvc.fs.utils import test_links, transfer
@@ -46,6 +48,19 @@ def _relink(link, cache, cache_info, fs, path, in_cache, force):
     cache.protect(cache_info)
 
 
+def _checkout_chunked(fs_path, fs, change, cache, force):
+    from .chunked import ChunkedFile
+
+    try:
+        obj = ChunkedFile.load(cache, change.new.oid)
+        with obj.open(cache) as fobj:
+            if change.old.oid:
+                _remove(fs_path, fs, change.old.in_cache, force=force)
+            fs.upload_fobj(fobj, fs_path)
+    except FileNotFoundError as exc:
+        raise CheckoutError([fs_path]) from exc
+
+
 def _checkout_file(
     link,
     fs_path,
@@ -55,13 +70,18 @@ def _checkout_file(
     force,
     progress_callback=None,
     relink=False,
-    state=None,
 ):
     """The file is changed we need to checkout a new copy"""
     modified = False
 
     cache_fs_path = cache.hash_to_path(change.new.oid.value)
-    if change.old.oid:
+    if change.new.oid.ischunked:
+        # NOTE: chunked files can't be linked and are always independent
+        # copies, so there is nothing to relink
+        if change.old.oid != change.new.oid:
+            modified = True
+            _checkout_chunked(fs_path, fs, change, cache, force)
+    elif change.old.oid:
         if relink:
             if fs.iscopy(fs_path) and cache.cache_types[0] == "copy":
                 cache.unprotect(fs_path)
@@ -90,9 +110,6 @@ def _checkout_file(
         link(cache, cache_fs_path, fs, fs_path)
         modified = True
 
-    if state:
-        state.save(fs_path, fs, change.new.oid)
-
     if progress_callback:
         progress_callback(fs_path)
 
@@ -137,7 +154,7 @@ class Link:
         if to_fs.exists(to_path):
             to_fs.remove(to_path)  # broken symlink
 
-        cache.makedirs(cache.fs.path.parent(to_path))
+        # NOTE: parent directories are created by `_checkout` beforehand
         try:
             transfer(cache.fs, from_path, to_fs, to_path, links=self._links)
         except FileNotFoundError as exc:
@@ -146,6 +163,61 @@ class Link:
             raise CacheLinkError([to_path]) from exc
 
 
+def _needs_confirmation(change, force):
+    # removing a workspace file which is not in cache may need to prompt
+    return not force and change.old.oid and not change.old.in_cache
+
+
+def _checkout_entries(
+    link,
+    entries,
+    fs,
+    cache,
+    force=False,
+    progress_callback=None,
+    relink=False,
+    jobs=None,
+):
+    from dvc.utils.threadpool import ThreadPoolExecutor
+
+    def _checkout_entry(entry_path, change):
+        try:
+            _checkout_file(
+                link,
+                entry_path,
+                fs,
+                change,
+                cache,
+                force,
+                progress_callback,
+                relink,
+            )
+        except CheckoutError as exc:
+            return exc.target_infos
+        return []
+
+    # NOTE: entries that might need to prompt the user are checked out
+    # first, one by one, everything else is checked out in parallel.
+    interactive, parallel = lsplit(
+        lambda entry: _needs_confirmation(entry[1], force), entries
+    )
+    failed = []
+    for entry_path, change in interactive:
+        failed.extend(_checkout_entry(entry_path, change))
+
+    jobs = jobs or cache.fs.jobs
+    if len(parallel) > 1 and jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            for entry_failed in executor.imap_unordered(
+                _checkout_entry, *zip(*parallel)
+            ):
+                failed.extend(entry_failed)
+    else:
+        for entry_path, change in parallel:
+            failed.extend(_checkout_entry(entry_path, change))
+    return failed
+
+
 def _checkout(
     diff,
     fs_path,
@@ -155,6 +227,7 @@ def _checkout(
     progress_callback=None,
     relink=False,
     state=None,
+    jobs=None,
 ):
     if not diff:
         return
@@ -172,7 +245,9 @@ def _checkout(
         )
         _remove(entry_path, fs, change.old.in_cache, force=force)
 
-    failed = []
+    dirs = []
+    parents = set()
+    entries = []
     for change in chain(diff.added, diff.modified):
         entry_path = (
             fs.path.join(fs_path, *change.new.key)
@@ -180,23 +255,39 @@ def _checkout(
             else fs_path
         )
         if change.new.oid.isdir:
-            fs.makedirs(entry_path)
-            continue
+            dirs.append(entry_path)
+        else:
+            parents.add(fs.path.parent(entry_path))
+            entries.append((entry_path, change))
+
+    # NOTE: create all directories in one pass, so that workers don't
+    # race each other trying to create the same parents.
+    for dir_path in dirs:
+        fs.makedirs(dir_path)
+    for parent in sorted(parents):
+        cache.makedirs(parent)
+
+    failed = _checkout_entries(
+        link,
+        entries,
+        fs,
+        cache,
+        force=force,
+        progress_callback=progress_callback,
+        relink=relink,
+        jobs=jobs,
+    )
 
-        try:
-            _checkout_file(
-                link,
-                entry_path,
-                fs,
-                change,
-                cache,
-                force,
-                progress_callback,
-                relink,
-                state=state,
-            )
-        except CheckoutError as exc:
-            failed.extend(exc.target_infos)
+    if state:
+        failed_paths = set(failed)
+        state.save_many(
+            (
+                (entry_path, change.new.oid)
+                for entry_path, change in entries
+                if entry_path not in failed_paths
+            ),
+            fs,
+        )
 
     if failed:
         raise CheckoutError(failed)
@@ -213,6 +304,7 @@ def checkout(
     quiet=False,
     dvcignore: Optional[DvcIgnoreFilter] = None,
     state=None,
+    jobs=None,
 ):
     # if scheme(fs_path) not in ["local", cache.fs.scheme]:
     #    raise NotImplementedError
@@ -247,6 +339,7 @@ def checkout(
             progress_callback=progress_callback,
             relink=relink,
             state=state,
+            jobs=jobs,
         )
     except CheckoutError as exc:
         failed.extend(exc.target_infos)
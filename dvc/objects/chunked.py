@@ -0,0 +1,303 @@
+import functools
+import hashlib
+import io
+import json
+import logging
+import operator
+import zlib
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+from .errors import ObjectFormatError
+from .file import HashFile
+from .meta import Meta
+from .stage import get_file_hash
+
+if TYPE_CHECKING:
+    from dvc.fs.base import FileSystem
+    from dvc.hash_info import HashInfo
+    from dvc.types import AnyPath
+
+    from .db.base import ObjectDB
+
+logger = logging.getLogger(__name__)
+
+CHUNK_MIN_SIZE = 4 * 1024 * 1024  # 4 MiB
+CHUNK_MAX_SIZE = 16 * 1024 * 1024  # 16 MiB
+
+# NOTE: boundaries are found block-wise, so that the work done per byte
+# happens in C (`bytes.translate`, big int xor and `bytes.find`) rather
+# than in Python. An 8-bit hash of the last `_HASH_WINDOW` bytes is computed
+# for all positions of a block at once, by xor-ing the block translated with
+# a table per position in the window, and the spots where it is zero (1 in
+# 256 on average) are boundary candidates. A candidate becomes a boundary
+# when the crc32 of the last `_CRC_WINDOW` bytes has all bits selected by
+# the mask unset. Both only depend on the surrounding content, so boundaries
+# are found at the same spots when data is inserted or removed earlier in
+# the file, for text and binary data alike. The mask is chosen so that
+# boundaries occur `min_size` bytes after the minimal size on average
+# (~8 MiB chunks with the default sizes).
+_HASH_WINDOW = 4
+_CRC_WINDOW = 32
+_SCAN_SIZE = 1024 * 1024
+
+
+def _make_tables():
+    tables = [
+        bytearray(hashlib.md5(bytes([lag, i])).digest()[0] for i in range(256))
+        for lag in range(_HASH_WINDOW)
+    ]
+    # runs of the same byte (e.g. zeros) must not be candidates everywhere
+    for i in range(256):
+        if not functools.reduce(operator.xor, (t[i] for t in tables)):
+            tables[0][i] ^= 1
+    return tuple(bytes(table) for table in tables)
+
+
+_TABLES = _make_tables()
+
+
+def _boundary_mask(min_size: int) -> int:
+    # 1 in 2 ** 8 positions is a candidate (see above)
+    bits = max(min_size.bit_length() - 1 - 8, 0)
+    return (1 << bits) - 1
+
+
+def _window_hashes(data: bytes) -> bytes:
+    """Hash each window of `_HASH_WINDOW` bytes in data to a single byte."""
+    size = len(data) - _HASH_WINDOW + 1
+    if size <= 0:
+        return b""
+
+    acc = 0
+    for lag, table in enumerate(_TABLES):
+        start = _HASH_WINDOW - 1 - lag
+        window = data[start : start + size].translate(table)
+        acc ^= int.from_bytes(window, "big")
+    return acc.to_bytes(size, "big")
+
+
+def _find_boundary(buf: bytearray, min_size: int, max_size: int) -> int:
+    end = min(len(buf), max_size)
+    if end <= min_size:
+        return end
+
+    mask = _boundary_mask(min_size)
+    # only hash as much as needed, most boundaries are found long before
+    # the maximal size
+    for offset in range(min_size + 1 - _HASH_WINDOW, end, _SCAN_SIZE):
+        offset = max(offset, 0)
+        block_end = min(offset + _SCAN_SIZE + _HASH_WINDOW - 1, end)
+        hashes = _window_hashes(buf[offset:block_end])
+        pos = hashes.find(0)
+        while pos != -1:
+            # hashes[pos] is the hash of the window ending at `boundary`
+            boundary = offset + pos + _HASH_WINDOW
+            window = buf[max(boundary - _CRC_WINDOW, 0) : boundary]
+            if not zlib.crc32(window) & mask:
+                return boundary
+            pos = hashes.find(0, pos + 1)
+    return end
+
+
+def split(
+    fobj, min_size: Optional[int] = None, max_size: Optional[int] = None
+) -> Iterator[bytes]:
+    """Split file contents into content-defined chunks."""
+    min_size = min_size or CHUNK_MIN_SIZE
+    max_size = max_size or CHUNK_MAX_SIZE
+    buf = bytearray()
+    eof = False
+    while True:
+        while not eof and len(buf) < max_size:
+            data = fobj.read(max_size - len(buf))
+            if not data:
+                eof = True
+            buf += data
+
+        if not buf:
+            return
+
+        boundary = _find_boundary(buf, min_size, max_size)
+        yield bytes(buf[:boundary])
+        del buf[:boundary]
+
+
+def _chunk_hash(data: bytes, name: str) -> str:
+    from dvc.utils import get_hasher
+
+    # NOTE: unlike `file_md5`, line endings are never normalized, as a chunk
+    # of a text file is only a part of it (see `HashFile._check_hash`).
+    hasher = get_hasher(name)
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+class _ChunksReader(io.RawIOBase):
+    def __init__(self, odb: "ObjectDB", oids: List["HashInfo"]):
+        super().__init__()
+        self._odb = odb
+        self._oids = iter(oids)
+        self._fobj = None
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while True:
+            if self._fobj is None:
+                oid = next(self._oids, None)
+                if oid is None:
+                    return 0
+                obj = self._odb.get(oid)
+                self._fobj = obj.fs.open(obj.fs_path, "rb")
+            data = self._fobj.read(len(b))
+            if data:
+                b[: len(data)] = data
+                return len(data)
+            self._fobj.close()
+            self._fobj = None
+
+    def close(self):
+        if self._fobj is not None:
+            self._fobj.close()
+            self._fobj = None
+        super().close()
+
+
+class ChunkedFile(HashFile):
+    """File object which is stored as a list of content-defined chunks.
+
+    The object itself is a manifest listing the hashes and sizes of the
+    chunks in order, while the chunks are regular file objects in the ODB.
+    """
+
+    PARAM_SIZE = "size"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._chunks: List[Tuple["Meta", "HashInfo"]] = []
+
+    def add(self, meta: "Meta", oid: "HashInfo"):
+        self._chunks.append((meta, oid))
+
+    @property
+    def size(self) -> int:
+        return sum(meta.size for meta, _ in self._chunks)
+
+    def __iter__(self):
+        offset = 0
+        for meta, oid in self._chunks:
+            yield offset, meta, oid
+            offset += meta.size
+
+    def digest(
+        self, hash_info: Optional["HashInfo"] = None, name: str = "md5"
+    ):
+        from dvc.fs.memory import MemoryFileSystem
+        from dvc.hash_info import HASH_CHUNKS_SUFFIX
+        from dvc.utils import tmp_fname
+
+        memfs = MemoryFileSystem()
+        fs_path = "memory://{}".format(tmp_fname(""))
+        with memfs.open(fs_path, "wb") as fobj:
+            fobj.write(self.as_bytes())
+        self.fs = memfs
+        self.fs_path = fs_path
+        if hash_info:
+            self.hash_info = hash_info
+        else:
+            _, self.hash_info = get_file_hash(fs_path, memfs, name)
+            assert self.hash_info.value
+            self.hash_info.value += HASH_CHUNKS_SUFFIX
+
+    def as_list(self):
+        return [
+            {oid.name: oid.value, self.PARAM_SIZE: meta.size}
+            for meta, oid in self._chunks
+        ]
+
+    def as_bytes(self):
+        return json.dumps(self.as_list(), sort_keys=True).encode("utf-8")
+
+    @classmethod
+    def from_list(cls, lst):
+        from dvc.hash_info import HashInfo
+
+        obj = cls(None, None, None)
+        for _entry in lst:
+            entry = _entry.copy()
+            size = entry.pop(cls.PARAM_SIZE)
+            obj.add(Meta(size=size), HashInfo.from_dict(entry))
+        return obj
+
+    @classmethod
+    def load(cls, odb, hash_info):
+        raw_obj = odb.get(hash_info)
+
+        try:
+            with raw_obj.fs.open(raw_obj.fs_path, "r") as fobj:
+                raw = json.load(fobj)
+        except ValueError as exc:
+            raise ObjectFormatError(f"{raw_obj} is corrupted") from exc
+
+        if not isinstance(raw, list):
+            raise ObjectFormatError(f"{raw_obj} is corrupted")
+
+        obj = cls.from_list(raw)
+        obj.fs_path = raw_obj.fs_path
+        obj.fs = raw_obj.fs
+        obj.hash_info = hash_info
+        return obj
+
+    @classmethod
+    def from_file(
+        cls,
+        fs_path: "AnyPath",
+        fs: "FileSystem",
+        odb: Optional["ObjectDB"] = None,
+        name: str = "md5",
+    ) -> "ChunkedFile":
+        """Split the specified file into chunks hashed with `name`.
+
+        If odb is set, the chunks will also be added to it.
+        """
+        from dvc.fs.memory import MemoryFileSystem
+        from dvc.hash_info import HashInfo
+        from dvc.progress import Tqdm
+        from dvc.utils import LARGE_FILE_SIZE, tmp_fname
+
+        obj = cls(None, None, None)
+        memfs = MemoryFileSystem()
+        size = fs.getsize(fs_path) or 0
+        with Tqdm(
+            desc=f"Chunking '{fs.path.name(fs_path)}'",
+            disable=size < LARGE_FILE_SIZE,
+            total=size,
+            bytes=True,
+            leave=False,
+        ) as pbar:
+            with fs.open(fs_path, "rb") as fobj:
+                for data in split(fobj):
+                    oid = HashInfo(name, _chunk_hash(data, name))
+                    if odb is not None:
+                        tmp_path = "memory://{}".format(tmp_fname(""))
+                        with memfs.open(tmp_path, "wb") as tmp_fobj:
+                            tmp_fobj.write(data)
+                        odb.add(tmp_path, memfs, oid, hardlink=False)
+                        memfs.remove(tmp_path)
+                    obj.add(Meta(size=len(data)), oid)
+                    pbar.update(len(data))
+        return obj
+
+    def open(self, odb: "ObjectDB", mode: str = "rb", encoding=None):
+        """Open the contents of this file for reading.
+
+        Chunks are read from the specified ODB.
+        """
+        assert mode in ("r", "rb")
+        reader = io.BufferedReader(
+            _ChunksReader(odb, [oid for _, _, oid in self])
+        )
+        if mode == "rb":
+            return reader
+        return io.TextIOWrapper(reader, encoding=encoding)
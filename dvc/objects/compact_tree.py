@@ -0,0 +1,285 @@
+import json
+import logging
+import mmap
+import os
+import posixpath
+import struct
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple
+
+from .errors import ObjectFormatError
+from .tree import Tree
+
+if TYPE_CHECKING:
+    from dvc.hash_info import HashInfo
+
+    from .db.base import ObjectDB
+    from .file import HashFile
+    from .meta import Meta
+
+logger = logging.getLogger(__name__)
+
+# File layout (all integers are little-endian uint64):
+#
+#   header:  MAGIC, number of entries, name of the hash (NUL-padded)
+#   offsets: (count + 1) offsets of entry relpaths in the names section
+#   digests: count raw digests (see `_DIGEST_SIZES`)
+#   names:   utf-8 posix relpaths, sorted
+#
+# NOTE: relpaths are sorted as utf-8 bytes, which matches the code point
+# order used when sorting `.dir` entries, so entries under a directory
+# form a contiguous range and can be found with a binary search.
+MAGIC = b"DVCTREE2"
+_HEADER = struct.Struct("<8sQ8s")
+_OFFSET = struct.Struct("<Q")
+_DIGEST_SIZES = {"md5": 16, "sha256": 32, "blake3": 32}
+_SEP = b"/"
+# first byte that sorts after the separator
+_SEP_NEXT = b"0"
+
+
+def _entries_from_list(lst):
+    from dvc.hash_info import DEFAULT_HASH_NAME
+
+    name = DEFAULT_HASH_NAME
+    if lst:
+        name = next((key for key in lst[0] if key != Tree.PARAM_RELPATH), None)
+    digest_size = _DIGEST_SIZES.get(name)
+
+    entries = []
+    for entry in lst:
+        relpath = entry[Tree.PARAM_RELPATH]
+        value = entry.get(name)
+        if (
+            len(entry) != 2
+            or not digest_size
+            or not value
+            or len(value) != 2 * digest_size
+        ):
+            raise ValueError(f"can't pack '{relpath}'")
+        entries.append((relpath.encode("utf-8"), bytes.fromhex(value)))
+    entries.sort()
+    return name, entries
+
+
+def write(fs_path: str, lst) -> None:
+    """Write a compact tree file for the specified `.dir` entries list.
+
+    Raises ValueError if some of the entries can't be packed (e.g. they
+    have metadata or aren't all hashed with the same hash).
+    """
+    from dvc.utils import tmp_fname
+    from dvc.utils.fs import makedirs
+
+    hash_name, entries = _entries_from_list(lst)
+
+    offsets = []
+    offset = 0
+    for name, _ in entries:
+        offsets.append(offset)
+        offset += len(name)
+    offsets.append(offset)
+
+    makedirs(os.path.dirname(fs_path), exist_ok=True)
+    tmp_path = tmp_fname(fs_path)
+    with open(tmp_path, "wb") as fobj:
+        fobj.write(
+            _HEADER.pack(MAGIC, len(entries), hash_name.encode("ascii"))
+        )
+        fobj.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        fobj.writelines(digest for _, digest in entries)
+        fobj.writelines(name for name, _ in entries)
+    os.replace(tmp_path, fs_path)
+
+
+class CompactTree(Tree):
+    """Read-only tree backed by a memory-mapped compact tree file.
+
+    Unlike `Tree`, entries are not loaded into memory. Lookups use a
+    binary search over the sorted relpaths and iteration decodes entries
+    as it goes, so opening a huge directory is cheap.
+    """
+
+    TREES_DIR = "trees"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._mmap: Optional[mmap.mmap] = None
+        self._oid_name = ""
+        self._digest_size = 0
+        self._count = 0
+        self._start = 0
+        self._stop = 0
+
+    @classmethod
+    def open(cls, path: str) -> "CompactTree":
+        with open(path, "rb") as fobj:
+            try:
+                mm = mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:
+                raise ObjectFormatError(f"'{path}' is corrupted") from exc
+
+        if len(mm) < _HEADER.size:
+            raise ObjectFormatError(f"'{path}' is corrupted")
+        magic, count, name = _HEADER.unpack_from(mm, 0)
+        name = name.rstrip(b"\0").decode("ascii", "replace")
+        if magic != MAGIC or name not in _DIGEST_SIZES:
+            raise ObjectFormatError(f"'{path}' is corrupted")
+
+        tree = cls(None, None, None)
+        tree._mmap = mm
+        tree._oid_name = name
+        tree._digest_size = _DIGEST_SIZES[name]
+        tree._count = count
+        tree._stop = count
+        return tree
+
+    @classmethod
+    def path_for(cls, tmp_dir: str, hash_: str) -> str:
+        """Return path of the compact tree file for the specified hash."""
+        return os.path.join(tmp_dir, cls.TREES_DIR, hash_)
+
+    @classmethod
+    def load(cls, odb: "ObjectDB", hash_info: "HashInfo") -> "Tree":
+        """Load the specified tree from the local ODB.
+
+        A compact tree file is created in the ODB's tmp dir on first use.
+        Falls back to a regular `Tree` if the ODB is not local or if the
+        tree can't be stored in the compact format.
+        """
+        from dvc.scheme import Schemes
+
+        if odb.fs.scheme != Schemes.LOCAL or not odb.tmp_dir:
+            return Tree.load(odb, hash_info)
+
+        assert hash_info.value
+        path = cls.path_for(odb.tmp_dir, hash_info.value)
+        try:
+            tree = cls.open(path)
+        except (FileNotFoundError, ObjectFormatError):
+            obj = odb.get(hash_info)
+            try:
+                with obj.fs.open(obj.fs_path, "r") as fobj:
+                    raw = json.load(fobj)
+                write(path, raw)
+            except (ValueError, TypeError, KeyError, AttributeError):
+                return Tree.load(odb, hash_info)
+            tree = cls.open(path)
+
+        obj = odb.get(hash_info)
+        tree.fs_path = obj.fs_path
+        tree.fs = obj.fs
+        tree.hash_info = hash_info
+        return tree
+
+    def _view(self, start: int, stop: int) -> "CompactTree":
+        tree = CompactTree(self.fs_path, self.fs, self.hash_info)
+        tree._mmap = self._mmap
+        tree._oid_name = self._oid_name
+        tree._digest_size = self._digest_size
+        tree._count = self._count
+        tree._start = start
+        tree._stop = stop
+        return tree
+
+    def _offset(self, index: int) -> int:
+        return _OFFSET.unpack_from(
+            self._mmap, _HEADER.size + _OFFSET.size * index
+        )[0]
+
+    def _name(self, index: int) -> bytes:
+        assert self._mmap is not None
+        names = (
+            _HEADER.size
+            + _OFFSET.size * (self._count + 1)
+            + self._digest_size * self._count
+        )
+        start = self._offset(index)
+        stop = self._offset(index + 1)
+        return self._mmap[names + start : names + stop]
+
+    def _oid(self, index: int) -> "HashInfo":
+        from dvc.hash_info import HashInfo
+
+        assert self._mmap is not None
+        start = (
+            _HEADER.size
+            + _OFFSET.size * (self._count + 1)
+            + self._digest_size * index
+        )
+        digest = self._mmap[start : start + self._digest_size]
+        return HashInfo(self._oid_name, digest.hex())
+
+    def _bisect(self, name: bytes) -> int:
+        lo, hi = self._start, self._stop
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._name(mid) < name:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _find(self, key: Tuple[str, ...]) -> Optional[int]:
+        name = posixpath.sep.join(key).encode("utf-8")
+        index = self._bisect(name)
+        if index < self._stop and self._name(index) == name:
+            return index
+        return None
+
+    def _prefix_range(self, prefix: Tuple[str, ...]) -> Tuple[int, int]:
+        name = posixpath.sep.join(prefix).encode("utf-8")
+        return self._bisect(name + _SEP), self._bisect(name + _SEP_NEXT)
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __iter__(self) -> Iterator[Tuple[Tuple[str, ...], None, "HashInfo"]]:
+        for index in range(self._start, self._stop):
+            key = tuple(self._name(index).decode("utf-8").split(posixpath.sep))
+            yield key, None, self._oid(index)
+
+    def iter_sorted(self):
+        # entries are already stored in relpath order
+        return iter(self)
+
+    @property
+    def trie(self):
+        from pygtrie import Trie
+
+        return Trie(self.as_dict())
+
+    def add(self, key: Tuple[str], meta: "Meta", oid: "HashInfo"):
+        raise NotImplementedError("compact trees are read-only")
+
+    def as_dict(self):
+        return {key: (meta, oid) for key, meta, oid in self}
+
+    def get_oid(self, key: Tuple[str, ...]) -> Optional["HashInfo"]:
+        index = self._find(key)
+        if index is None:
+            return None
+        return self._oid(index)
+
+    def filter(self, prefix: Tuple[str]) -> Optional["Tree"]:
+        index = self._find(prefix)
+        if index is not None:
+            tree = Tree(self.fs_path, self.fs, self.hash_info)
+            tree.add(prefix, None, self._oid(index))
+            return tree
+        return self._view(*self._prefix_range(prefix))
+
+    def get(self, odb, prefix: Tuple[str]) -> Optional["HashFile"]:
+        oid = self.get_oid(prefix)
+        if oid:
+            return odb.get(oid)
+
+        start, stop = self._prefix_range(prefix)
+        if start == stop:
+            return None
+
+        tree = Tree(None, None, None)
+        depth = len(prefix)
+        for key, meta, entry_oid in self._view(start, stop):
+            tree.add(key[depth:], meta, entry_oid)
+        tree.digest()
+        return tree
@@ -1,9 +1,13 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from dvc.scheme import Schemes
 
 if TYPE_CHECKING:
-    from .index import ObjectDBIndexBase
+    from .index import (
+        ObjectDBIndexBase,
+        ObjectDBListingCheckpoint,
+        ObjectDBSnapshot,
+    )
 
 
 def get_odb(fs, fs_path, **config):
@@ -35,18 +39,36 @@ def _get_odb(repo, settings):
     return get_odb(cls(**config), fs_path, state=repo.state, **config)
 
 
-def get_index(odb) -> "ObjectDBIndexBase":
+def _index_name(odb) -> str:
     import hashlib
 
+    return hashlib.sha256(
+        odb.fs.unstrip_protocol(odb.fs_path).encode("utf-8")
+    ).hexdigest()
+
+
+def get_index(odb) -> "ObjectDBIndexBase":
     from .index import ObjectDBIndex, ObjectDBIndexNoop
 
     cls = ObjectDBIndex if odb.tmp_dir else ObjectDBIndexNoop
-    return cls(
-        odb.tmp_dir,
-        hashlib.sha256(
-            odb.fs.unstrip_protocol(odb.fs_path).encode("utf-8")
-        ).hexdigest(),
-    )
+    return cls(odb.tmp_dir, _index_name(odb))
+
+
+def get_snapshot(odb) -> Optional["ObjectDBSnapshot"]:
+    from .index import ObjectDBSnapshot
+
+    if not odb.tmp_dir:
+        return None
+    return ObjectDBSnapshot(odb.tmp_dir, _index_name(odb))
+
+
+def get_listing_checkpoint(odb) -> Optional["ObjectDBListingCheckpoint"]:
+    from .index import ObjectDBListingCheckpoint
+
+    # NOTE: local ODBs are cheap enough to list again from scratch
+    if not odb.tmp_dir or odb.fs.scheme == Schemes.LOCAL:
+        return None
+    return ObjectDBListingCheckpoint(odb.tmp_dir, _index_name(odb))
 
 
 class ODBManager:
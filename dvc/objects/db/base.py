@@ -1,10 +1,12 @@
 import itertools
 import logging
+import os
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from copy import copy
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Set
 
+from dvc.hash_info import DEFAULT_HASH_NAME
 from dvc.objects.errors import ObjectDBPermissionError, ObjectFormatError
 from dvc.objects.file import HashFile
 from dvc.progress import Tqdm
@@ -14,6 +16,8 @@ if TYPE_CHECKING:
     from dvc.hash_info import HashInfo
     from dvc.types import AnyPath
 
+    from ..gc import GCResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,10 +26,23 @@ class ObjectDB:
     DEFAULT_VERIFY = False
     DEFAULT_CACHE_TYPES = ["copy"]
     CACHE_MODE: Optional[int] = None
+    # number of objects removed at once by `gc`
+    GC_BATCH_SIZE = 1000
+    # packs with at least this fraction of unused objects are repacked
+    REPACK_RATIO = 0.5
+    # max number of entries expected in a single prefix when traversing
+    TRAVERSE_SPLIT_SIZE = 100_000
+    MAX_TRAVERSE_PREFIX_LEN = 6
+    # number of hashes passed at once from listing threads and max number
+    # of such batches waiting to be consumed
+    TRAVERSE_BATCH_SIZE = 1000
+    TRAVERSE_QUEUE_SIZE = 64
 
     def __init__(self, fs: "FileSystem", path: str, **config):
         from dvc.state import StateNoop
 
+        from .pack import PackIndex
+
         self.fs = fs
         self.fs_path = path
         self.state = config.get("state", StateNoop())
@@ -34,6 +51,10 @@ class ObjectDB:
         self.slow_link_warning = config.get("slow_link_warning", True)
         self.tmp_dir = config.get("tmp_dir")
         self.read_only = config.get("read_only", False)
+        self.chunk_threshold = config.get("chunk_threshold")
+        self.hash_name = config.get("hash") or DEFAULT_HASH_NAME
+        self.pack_threshold = config.get("pack_threshold")
+        self.packs = PackIndex(self)
 
     @property
     def config(self):
@@ -44,6 +65,9 @@ class ObjectDB:
             "slow_link_warning": self.slow_link_warning,
             "tmp_dir": self.tmp_dir,
             "read_only": self.read_only,
+            "chunk_threshold": self.chunk_threshold,
+            "hash": self.hash_name,
+            "pack_threshold": self.pack_threshold,
         }
 
     def __eq__(self, other):
@@ -57,7 +81,10 @@ class ObjectDB:
         return hash((self.fs.scheme, self.fs_path))
 
     def exists(self, hash_info: "HashInfo"):
-        return self.fs.exists(self.hash_to_path(hash_info.value))
+        return (
+            self.fs.exists(self.hash_to_path(hash_info.value))
+            or hash_info.value in self.packs
+        )
 
     def move(self, from_info, to_info):
         self.fs.move(from_info, to_info)
@@ -67,9 +94,11 @@ class ObjectDB:
 
     def get(self, hash_info: "HashInfo"):
         """get raw object"""
+        # NOTE: packed objects are read from their pack
+        fs = self.packs.fs if hash_info.value in self.packs else self.fs
         return HashFile(
             self.hash_to_path(hash_info.value),
-            self.fs,
+            fs,
             hash_info,
         )
 
@@ -276,8 +305,122 @@ class ObjectDB:
             logger.debug(f"Estimated remote size: {remote_size} files")
         return remote_size, remote_hashes
 
+    def _traverse_prefixes(self, remote_size):
+        """Split hashes into prefixes to be listed in parallel.
+
+        Every prefix is listed with a single `fs.find()`, which returns all
+        of its entries at once, so for large remotes (if the fs is able to
+        list by arbitrary prefixes) prefixes are made longer until each of
+        them is expected to have at most `TRAVERSE_SPLIT_SIZE` entries.
+
+        Hashes from the prefix used for the remote size estimation are
+        already known, so it is excluded.
+        """
+        estimation_prefix = "0" * self.fs.TRAVERSE_PREFIX_LEN
+        length = 2
+        if self.fs.TRAVERSE_PREFIX_LEN > 2:
+            while (
+                length < self.MAX_TRAVERSE_PREFIX_LEN
+                and remote_size / pow(16, length) > self.TRAVERSE_SPLIT_SIZE
+            ):
+                length += 1
+
+        prefixes = [
+            prefix
+            for prefix in (
+                "{0:0{1}x}".format(i, length) for i in range(16 ** length)
+            )
+            if not prefix.startswith(estimation_prefix)
+            and not estimation_prefix.startswith(prefix)
+        ]
+        # cover the rest of the prefix which the estimation prefix is in
+        for i in range(length, len(estimation_prefix)):
+            prefixes.extend(
+                estimation_prefix[:i] + f"{j:x}" for j in range(1, 16)
+            )
+        return prefixes
+
+    def _list_prefix_batches(
+        self, prefix, stop, progress_callback=None, checkpoint=None
+    ):
+        """Iterate over batches of hashes from `prefix`, until `stop` is
+        set. Listed hashes are saved to `checkpoint` (if specified)."""
+        from funcy import chunks
+
+        if checkpoint:
+            checkpoint.reset_prefix(prefix)
+        hashes = self._list_hashes(
+            prefix=prefix, progress_callback=progress_callback
+        )
+        for batch in chunks(self.TRAVERSE_BATCH_SIZE, hashes):
+            if stop.is_set():
+                return
+            if checkpoint:
+                checkpoint.add(prefix, batch)
+            yield batch
+        if checkpoint:
+            checkpoint.finish_prefix(prefix)
+
+    @staticmethod
+    def _iter_batches(results, count):
+        """Iterate over hashes from the batches in `results`, until `count`
+        listings are finished. Errors from the listings are re-raised."""
+        while count:
+            item = results.get()
+            if item is None:
+                count -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield from item
+
+    def _list_prefixes(
+        self, prefixes, jobs=None, progress_callback=None, checkpoint=None
+    ):
+        """Iterate over hashes from all `prefixes`, listed in parallel.
+
+        Hashes are passed from the listing threads in batches through a
+        bounded queue, so that listing doesn't get too far ahead of the
+        consumer. Listed hashes are saved to `checkpoint` (if specified).
+        """
+        import queue
+        import threading
+
+        results: "queue.Queue" = queue.Queue(maxsize=self.TRAVERSE_QUEUE_SIZE)
+        stop = threading.Event()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def list_prefix(prefix):
+            if stop.is_set():
+                return
+            try:
+                for batch in self._list_prefix_batches(
+                    prefix, stop, progress_callback, checkpoint
+                ):
+                    put(batch)
+            except Exception as exc:  # noqa, pylint: disable=broad-except
+                put(exc)
+            finally:
+                put(None)
+
+        with ThreadPoolExecutor(max_workers=jobs or self.fs.jobs) as executor:
+            for prefix in prefixes:
+                executor.submit(list_prefix, prefix)
+
+            try:
+                yield from self._iter_batches(results, len(prefixes))
+            finally:
+                stop.set()
+
     def _list_hashes_traverse(
-        self, remote_size, remote_hashes, jobs=None, name=None
+        self, remote_size, remote_hashes, jobs=None, name=None, resume=False
     ):
         """Iterate over all hashes found in this fs.
         Hashes are fetched in parallel according to prefix, except in
@@ -292,8 +435,18 @@ class ObjectDB:
         and we don't really need all of it at the same time, so it makes
         sense to use a generator to gradually iterate over it, without
         keeping all of it in memory.
+
+        With `resume`, progress of a parallel listing is saved to a
+        checkpoint, so that an interrupted listing can be resumed later,
+        see `ObjectDBListingCheckpoint`. Hashes from a resumed listing
+        might no longer exist, so it must not be used to check whether
+        objects exist.
         """
+        from . import get_listing_checkpoint
+
         num_pages = remote_size / self.fs.LIST_OBJECT_PAGE_SIZE
+        checkpoint = None
+        done: Set[str] = set()
         if num_pages < 256 / self.fs.jobs:
             # Fetching prefixes in parallel requires at least 255 more
             # requests, for small enough remotes it will be faster to fetch
@@ -306,38 +459,47 @@ class ObjectDB:
         else:
             yield from remote_hashes
             initial = len(remote_hashes)
-            traverse_prefixes = [f"{i:02x}" for i in range(1, 256)]
-            if self.fs.TRAVERSE_PREFIX_LEN > 2:
-                traverse_prefixes += [
-                    "{0:0{1}x}".format(i, self.fs.TRAVERSE_PREFIX_LEN)
-                    for i in range(1, pow(16, self.fs.TRAVERSE_PREFIX_LEN - 2))
-                ]
-        with Tqdm(
-            desc="Querying "
-            + (f"cache in '{name}'" if name else "remote cache"),
-            total=remote_size,
-            initial=initial,
-            unit="file",
-        ) as pbar:
-
-            def list_with_update(prefix):
-                return list(
-                    self._list_hashes(
-                        prefix=prefix, progress_callback=pbar.update
-                    )
+            traverse_prefixes = self._traverse_prefixes(remote_size)
+            checkpoint = get_listing_checkpoint(self) if resume else None
+            if checkpoint:
+                traverse_prefixes, done = checkpoint.start(traverse_prefixes)
+        try:
+            with Tqdm(
+                desc="Querying "
+                + (f"cache in '{name}'" if name else "remote cache"),
+                total=remote_size,
+                initial=initial,
+                unit="file",
+            ) as pbar:
+                for prefix in traverse_prefixes:
+                    if prefix in done:
+                        hashes = checkpoint.hashes(prefix)
+                        pbar.update(len(hashes))
+                        yield from hashes
+
+                yield from self._list_prefixes(
+                    [
+                        prefix
+                        for prefix in traverse_prefixes
+                        if prefix not in done
+                    ],
+                    jobs=jobs,
+                    progress_callback=pbar.update,
+                    checkpoint=checkpoint,
                 )
+            if checkpoint:
+                checkpoint.clear()
+        finally:
+            if checkpoint:
+                checkpoint.close()
 
-            with ThreadPoolExecutor(
-                max_workers=jobs or self.fs.jobs
-            ) as executor:
-                in_remote = executor.map(list_with_update, traverse_prefixes)
-                yield from itertools.chain.from_iterable(in_remote)
-
-    def all(self, jobs=None, name=None):
+    def all(self, jobs=None, name=None, resume=False):
         """Iterate over all hashes in this fs.
 
         Hashes will be fetched in parallel threads according to prefix
         (except for small remotes) and a progress bar will be displayed.
+        With `resume`, an interrupted listing is resumed (see
+        `_list_hashes_traverse`).
         """
         logger.debug(
             "Fetching all hashes from '{}'".format(
@@ -350,56 +512,204 @@ class ObjectDB:
 
         remote_size, remote_hashes = self._estimate_remote_size(name=name)
         return self._list_hashes_traverse(
-            remote_size, remote_hashes, jobs, name
+            remote_size, remote_hashes, jobs, name, resume=resume
         )
 
     def _remove_unpacked_dir(self, hash_):
         pass
 
-    def gc(self, used, jobs=None, cache_odb=None, shallow=True):
+    def _remove_compact_tree(self, hash_):
+        from ..compact_tree import CompactTree
+
+        if not self.tmp_dir:
+            return
+        with suppress(FileNotFoundError):
+            os.remove(CompactTree.path_for(self.tmp_dir, hash_))
+
+    def _clear_listing_checkpoint(self):
+        from . import get_listing_checkpoint
+
+        checkpoint = get_listing_checkpoint(self)
+        if checkpoint:
+            checkpoint.clear()
+            checkpoint.close()
+
+    def _gc_remove(self, hashes, jobs=None, dry_run=False) -> int:
+        """Remove the specified hashes, return their total size on dry
+        runs (and 0 otherwise)."""
+        from dvc.hash_info import HASH_DIR_SUFFIX
+
+        fs_paths = [self.hash_to_path(hash_) for hash_ in hashes]
+        if dry_run:
+            with ThreadPoolExecutor(
+                max_workers=jobs or self.fs.jobs
+            ) as executor:
+                return sum(
+                    size or 0
+                    for size in executor.map(self.fs.getsize, fs_paths)
+                )
+
+        for hash_ in hashes:
+            if hash_.endswith(HASH_DIR_SUFFIX):
+                # backward compatibility
+                # pylint: disable=protected-access
+                self._remove_unpacked_dir(hash_)
+                self._remove_compact_tree(hash_)
+        self.fs.remove(fs_paths)
+        return 0
+
+    @staticmethod
+    def _gc_expand_used(used, cache_odb, shallow=True):
+        """Add entries of the expandable objects in `used` to it."""
+        from ..chunked import ChunkedFile
         from ..tree import Tree
 
-        if self.read_only:
-            raise ObjectDBPermissionError("Cannot gc read-only ODB")
-        if not cache_odb:
-            cache_odb = self
-        used_hashes = set()
-        for hash_info in used:
-            used_hashes.add(hash_info.value)
+        for hash_info in list(used.expandable):
             if hash_info.isdir and not shallow:
                 tree = Tree.load(cache_odb, hash_info)
-                used_hashes.update(
+                used.update_values(
                     entry_obj.hash_info.value for _, entry_obj in tree
                 )
+            elif hash_info.ischunked:
+                # chunks are never listed separately, so they must always
+                # be collected from the manifest
+                with suppress(FileNotFoundError, ObjectFormatError):
+                    obj = ChunkedFile.load(cache_odb, hash_info)
+                    used.update_values(oid.value for _, _, oid in obj)
+
+    def _gc_sweep(self, used, remove, jobs=None):
+        """List the ODB and pass batches of unused hashes to `remove`.
+
+        Unused `.dir` hashes are passed right away, all others are spooled
+        to a temporary file until the listing is finished.
+        """
+        import tempfile
+
+        from funcy import chunks
+
+        from dvc.hash_info import HASH_DIR_SUFFIX
+
+        with tempfile.TemporaryFile("w+") as spool:
+            dir_hashes = []
+            for hash_ in self.all(jobs, self.fs_path, resume=True):
+                if hash_ in used:
+                    continue
+                if hash_.endswith(HASH_DIR_SUFFIX):
+                    dir_hashes.append(hash_)
+                    if len(dir_hashes) >= self.GC_BATCH_SIZE:
+                        remove(dir_hashes)
+                        dir_hashes = []
+                else:
+                    spool.write(hash_ + "\n")
+            if dir_hashes:
+                remove(dir_hashes)
+
+            spool.seek(0)
+            for hashes in chunks(
+                self.GC_BATCH_SIZE, (line.rstrip("\n") for line in spool)
+            ):
+                remove(hashes)
+
+    def gc(
+        self, used, jobs=None, cache_odb=None, shallow=True, dry_run=False
+    ) -> "GCResult":
+        """Remove all objects which are not in `used`.
+
+        `used` could be either an iterable of `HashInfo`s or `UsedHashes`.
+
+        Objects are checked against `used` while the ODB is being listed
+        and are removed in batches of `GC_BATCH_SIZE`. Unused `.dir`
+        objects are removed right away, while all other unused objects are
+        spooled to a temporary file and removed once listing is finished,
+        so that directories are always removed before their entries.
+
+        With `dry_run` nothing is removed and the total size of the unused
+        objects is returned instead.
+        """
+        from ..gc import GCResult, UsedHashes
 
-        def _is_dir_hash(_hash):
-            from dvc.hash_info import HASH_DIR_SUFFIX
-
-            return _hash.endswith(HASH_DIR_SUFFIX)
-
-        removed = False
-        # hashes must be sorted to ensure we always remove .dir files first
-        for hash_ in sorted(
-            self.all(jobs, self.fs_path),
-            key=_is_dir_hash,
-            reverse=True,
-        ):
-            if hash_ in used_hashes:
-                continue
-            fs_path = self.hash_to_path(hash_)
-            if _is_dir_hash(hash_):
-                # backward compatibility
-                # pylint: disable=protected-access
-                self._remove_unpacked_dir(hash_)
-            self.fs.remove(fs_path)
-            removed = True
+        if self.read_only and not dry_run:
+            raise ObjectDBPermissionError("Cannot gc read-only ODB")
+        if not cache_odb:
+            cache_odb = self
+        if not isinstance(used, UsedHashes):
+            used = UsedHashes(used)
+        self._gc_expand_used(used, cache_odb, shallow=shallow)
+
+        count = size = 0
+
+        def _remove(hashes):
+            nonlocal count, size
+            count += len(hashes)
+            size += self._gc_remove(hashes, jobs=jobs, dry_run=dry_run)
 
-        return removed
+        try:
+            self._gc_sweep(used, _remove, jobs=jobs)
+        finally:
+            if count and not dry_run:
+                # NOTE: an unfinished listing would still contain the
+                # removed objects
+                self._clear_listing_checkpoint()
+
+        for pack_path, hashes in self.packs.packs().items():
+            unused = [hash_ for hash_ in hashes if hash_ not in used]
+            if self._gc_pack(pack_path, hashes, unused, dry_run=dry_run):
+                count += len(unused)
+                if dry_run:
+                    size += sum(self.packs.get(hash_)[2] for hash_ in unused)
+
+        return GCResult(count, size if dry_run else None)
+
+    def _gc_pack(self, pack_path, hashes, unused, dry_run=False) -> bool:
+        """Remove unused objects from a pack, return whether they were (or
+        would be) removed.
+
+        Packs without used objects are removed, and packs which are mostly
+        unused (see `REPACK_RATIO`) are repacked with only the used ones.
+        Others are left as they are, as rewriting them isn't worth it.
+        """
+        from dvc.hash_info import HashInfo
+
+        from .pack import pack
+
+        if not unused:
+            return False
+        if len(unused) < len(hashes) * self.REPACK_RATIO:
+            logger.debug(
+                "keeping %d unused objects in '%s'", len(unused), pack_path
+            )
+            return False
+        if dry_run:
+            return True
+
+        if len(unused) < len(hashes):
+            if not self.tmp_dir:
+                logger.warning(
+                    "can't repack '%s' without a tmp dir, keeping its "
+                    "%d unused objects",
+                    pack_path,
+                    len(unused),
+                )
+                return False
+            keep = [
+                HashInfo(self.hash_name, hash_)
+                for hash_ in sorted(set(hashes).difference(unused))
+            ]
+            if pack(self, self, keep, os.path.join(self.tmp_dir, "packs")):
+                return False
+        self.packs.remove(pack_path)
+        return True
 
     def list_hashes_exists(self, hashes, jobs=None, name=None):
         """Return list of the specified hashes which exist in this fs.
         Hashes will be queried individually.
         """
+        packed = self.packs.intersection(hashes)
+        if packed:
+            return list(packed) + self.list_hashes_exists(
+                [hash_ for hash_ in hashes if hash_ not in packed], jobs, name
+            )
+
         logger.debug(f"Querying {len(hashes)} hashes via object_exists")
         with Tqdm(
             desc="Querying "
@@ -421,7 +731,9 @@ class ObjectDB:
                 ret = list(itertools.compress(hashes, in_remote))
                 return ret
 
-    def hashes_exist(self, hashes, jobs=None, name=None):
+    def hashes_exist(
+        self, hashes, jobs=None, name=None, hash_names=None
+    ):  # pylint: disable=unused-argument
         """Check if the given hashes are stored in the remote.
 
         There are two ways of performing this check:
@@ -464,6 +776,12 @@ class ObjectDB:
         always_traverse = getattr(self.fs, "_ALWAYS_TRAVERSE", False)
 
         hashes = set(hashes)
+        packed = self.packs.intersection(hashes)
+        if packed:
+            return list(packed) + self.hashes_exist(
+                hashes - packed, jobs, name, hash_names
+            )
+
         if (
             len(hashes) == 1 or not self.fs.CAN_TRAVERSE
         ) and not always_traverse:
@@ -1,7 +1,7 @@
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Iterable, Set
+from typing import TYPE_CHECKING, Iterable, List, Optional, Set, Tuple
 
 from ..errors import ObjectDBError
 
@@ -10,6 +10,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# keep well below SQLITE_MAX_VARIABLE_NUMBER (999 on older sqlite builds)
+_QUERY_BATCH_SIZE = 900
+
 
 class ObjectDBIndexBase(ABC):
     @abstractmethod
@@ -134,3 +137,332 @@ class ObjectDBIndex(ObjectDBIndexBase):
     def intersection(self, hashes: Set[str]):
         """Iterate over values from `hashes` which exist in the index."""
         yield from hashes.intersection(self.index.keys())
+
+
+class ObjectDBSnapshot:
+    """Snapshot of all hashes known to exist in an ODB.
+
+    Hashes are stored in a sorted sqlite table, along with the time since
+    which each 2-character hash prefix has been tracked (i.e. when it was
+    last listed from the ODB, or when the snapshot was created). Hashes
+    found while querying or pushing to the ODB are added as they are seen,
+    and refreshing replaces the snapshot one prefix at a time, so that an
+    interrupted refresh doesn't lose the prefixes which were already
+    listed. Prefixes older than `MAX_AGE` seconds are refreshed before the
+    snapshot is used, as objects might have been removed from the ODB by
+    someone else since.
+    """
+
+    SNAPSHOT_SUFFIX = ".snapshot"
+    INDEX_DIR = "index"
+    PREFIXES = [f"{i:02x}" for i in range(256)]
+    MAX_AGE = 7 * 24 * 60 * 60
+
+    def __init__(
+        self,
+        tmp_dir: "StrPath",
+        name: str,
+    ):
+        import threading
+
+        from dvc.utils.fs import makedirs
+
+        index_dir = os.path.join(tmp_dir, self.INDEX_DIR)
+        makedirs(index_dir, exist_ok=True)
+        self.path = os.path.join(index_dir, name + self.SNAPSHOT_SUFFIX)
+        # NOTE: the connection is shared by transfer threads
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            import sqlite3
+
+            conn = sqlite3.connect(
+                self.path, timeout=60, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS hashes "
+                    "(hash TEXT PRIMARY KEY) WITHOUT ROWID"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS prefixes "
+                    "(prefix TEXT PRIMARY KEY, timestamp REAL NOT NULL) "
+                    "WITHOUT ROWID"
+                )
+                self._reset_prefixes(conn, replace=False)
+            self._conn = conn
+        return self._conn
+
+    def _reset_prefixes(self, conn, replace=True):
+        import time
+
+        timestamp = time.time()
+        conn.executemany(
+            "INSERT OR {} INTO prefixes (prefix, timestamp) "
+            "VALUES (?, ?)".format("REPLACE" if replace else "IGNORE"),
+            ((prefix, timestamp) for prefix in self.PREFIXES),
+        )
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __iter__(self):
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT hash FROM hashes ORDER BY hash"
+            ).fetchall()
+        for (hash_,) in rows:
+            yield hash_
+
+    def __contains__(self, hash_):
+        with self._lock:
+            return bool(
+                self.conn.execute(
+                    "SELECT 1 FROM hashes WHERE hash = ?", (hash_,)
+                ).fetchone()
+            )
+
+    def __len__(self):
+        with self._lock:
+            (count,) = self.conn.execute(
+                "SELECT COUNT(*) FROM hashes"
+            ).fetchone()
+        return count
+
+    def stale_prefixes(self, max_age: Optional[float] = None) -> List[str]:
+        """Return prefixes which were tracked for more than `max_age`."""
+        import time
+
+        if max_age is None:
+            max_age = self.MAX_AGE
+        with self._lock:
+            return [
+                prefix
+                for (prefix,) in self.conn.execute(
+                    "SELECT prefix FROM prefixes WHERE timestamp < ? "
+                    "ORDER BY prefix",
+                    (time.time() - max_age,),
+                )
+            ]
+
+    def intersection(self, hashes: Set[str]):
+        """Iterate over values from `hashes` which exist in the snapshot."""
+        from funcy import chunks
+
+        for batch in chunks(_QUERY_BATCH_SIZE, sorted(hashes)):
+            query = "SELECT hash FROM hashes WHERE hash IN ({})".format(
+                ",".join("?" * len(batch))
+            )
+            with self._lock:
+                rows = self.conn.execute(query, batch).fetchall()
+            for (hash_,) in rows:
+                yield hash_
+
+    def add(self, hashes: Iterable[str]):
+        """Add hashes which are known to exist in the ODB."""
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO hashes (hash) VALUES (?)",
+                ((hash_,) for hash_ in hashes),
+            )
+
+    def clear(self):
+        """Clear this snapshot (to force re-listing later)."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM hashes")
+            self._reset_prefixes(self.conn)
+
+    def update_prefix(self, prefix: str, hashes: Iterable[str]):
+        """Replace all hashes starting with `prefix`."""
+        import time
+
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        with self._lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM hashes WHERE hash >= ? AND hash < ?",
+                (prefix, upper),
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO hashes (hash) VALUES (?)",
+                ((hash_,) for hash_ in hashes),
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO prefixes (prefix, timestamp) "
+                "VALUES (?, ?)",
+                (prefix, time.time()),
+            )
+
+    def refresh(self, odb, jobs=None, name=None, max_age=None):
+        """List hash prefixes in `odb` and update the snapshot.
+
+        If `max_age` is set, only prefixes which were tracked for longer
+        than that are listed, otherwise all of them are.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from dvc.progress import Tqdm
+
+        prefixes = self.stale_prefixes(0 if max_age is None else max_age)
+        if not prefixes:
+            return
+
+        if not odb.fs.CAN_TRAVERSE:
+            self.clear()
+            return
+
+        def list_prefix(prefix):
+            # pylint: disable=protected-access
+            return prefix, list(odb._list_hashes(prefix))
+
+        with Tqdm(
+            desc="Indexing "
+            + (f"cache in '{name}'" if name else "remote cache"),
+            total=len(prefixes),
+            unit="prefix",
+        ) as pbar:
+            with ThreadPoolExecutor(
+                max_workers=jobs or odb.fs.jobs
+            ) as executor:
+                for prefix, hashes in executor.map(list_prefix, prefixes):
+                    self.update_prefix(prefix, hashes)
+                    pbar.update()
+
+
+class ObjectDBListingCheckpoint:
+    """Progress of an unfinished listing of an ODB.
+
+    Hashes listed from each traversal prefix are stored as soon as they
+    are listed, and the prefix is marked as done once it has been fully
+    listed. If a listing is interrupted, the next one reuses the same
+    prefixes, takes the hashes of the finished ones from the checkpoint
+    and only lists the rest. Checkpoints are discarded once a listing is
+    finished, when they are older than `MAX_AGE` seconds or when `gc`
+    removes objects from the ODB.
+
+    Hashes from a resumed listing might have been removed since, so only
+    `gc` resumes listings.
+    """
+
+    CHECKPOINT_SUFFIX = ".listing"
+    INDEX_DIR = "index"
+    MAX_AGE = 24 * 60 * 60
+
+    def __init__(
+        self,
+        tmp_dir: "StrPath",
+        name: str,
+    ):
+        import threading
+
+        from dvc.utils.fs import makedirs
+
+        index_dir = os.path.join(tmp_dir, self.INDEX_DIR)
+        makedirs(index_dir, exist_ok=True)
+        self.path = os.path.join(index_dir, name + self.CHECKPOINT_SUFFIX)
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            import sqlite3
+
+            conn = sqlite3.connect(
+                self.path, timeout=60, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS prefixes "
+                    "(position INTEGER PRIMARY KEY, prefix TEXT NOT NULL, "
+                    "done INTEGER NOT NULL, timestamp REAL NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS hashes "
+                    "(prefix TEXT NOT NULL, hash TEXT NOT NULL, "
+                    "PRIMARY KEY (prefix, hash)) WITHOUT ROWID"
+                )
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def start(self, prefixes: List[str]) -> Tuple[List[str], Set[str]]:
+        """Start listing `prefixes` or resume an unfinished listing.
+
+        Returns prefixes to be listed (which are the ones from the
+        unfinished listing, if there is one) and the ones which are done.
+        """
+        import time
+
+        with self._lock, self.conn:
+            rows = self.conn.execute(
+                "SELECT prefix, done, timestamp FROM prefixes "
+                "ORDER BY position"
+            ).fetchall()
+            if rows and rows[0][2] >= time.time() - self.MAX_AGE:
+                logger.debug("Resuming listing from '%s'", self.path)
+                return (
+                    [prefix for prefix, _, _ in rows],
+                    {prefix for prefix, done, _ in rows if done},
+                )
+
+            self.conn.execute("DELETE FROM prefixes")
+            self.conn.execute("DELETE FROM hashes")
+            timestamp = time.time()
+            self.conn.executemany(
+                "INSERT INTO prefixes (position, prefix, done, timestamp) "
+                "VALUES (?, ?, 0, ?)",
+                (
+                    (position, prefix, timestamp)
+                    for position, prefix in enumerate(prefixes)
+                ),
+            )
+        return list(prefixes), set()
+
+    def hashes(self, prefix: str) -> List[str]:
+        """Return hashes listed from `prefix`."""
+        with self._lock:
+            return [
+                hash_
+                for (hash_,) in self.conn.execute(
+                    "SELECT hash FROM hashes WHERE prefix = ?", (prefix,)
+                )
+            ]
+
+    def reset_prefix(self, prefix: str):
+        """Discard hashes from an unfinished listing of `prefix`."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM hashes WHERE prefix = ?", (prefix,))
+
+    def add(self, prefix: str, hashes: Iterable[str]):
+        """Add hashes listed from `prefix`."""
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO hashes (prefix, hash) VALUES (?, ?)",
+                ((prefix, hash_) for hash_ in hashes),
+            )
+
+    def finish_prefix(self, prefix: str):
+        """Mark `prefix` as fully listed."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE prefixes SET done = 1 WHERE prefix = ?", (prefix,)
+            )
+
+    def clear(self):
+        """Discard the checkpoint, once listing is finished."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM prefixes")
+            self.conn.execute("DELETE FROM hashes")
@@ -1,6 +1,7 @@
 import logging
 import os
 import stat
+from collections import defaultdict
 
 from funcy import cached_property
 from shortuuid import uuid
@@ -20,6 +21,9 @@ class LocalObjectDB(ObjectDB):
     DEFAULT_CACHE_TYPES = ["reflink", "copy"]
     CACHE_MODE = 0o444
     UNPACKED_DIR_SUFFIX = ".unpacked"
+    # minimal number of hashes in a shard to list it instead of checking
+    # the hashes separately
+    SCANDIR_THRESHOLD = 16
 
     def __init__(self, fs, fs_path, **config):
         super().__init__(fs, fs_path, **config)
@@ -60,24 +64,102 @@ class LocalObjectDB(ObjectDB):
         # being ~5.5 times faster.
         return f"{self.cache_path}{os.sep}{hash_[0:2]}{os.sep}{hash_[2:]}"
 
+    def _scandir_shard(self, prefix):
+        try:
+            with os.scandir(os.path.join(self.cache_path, prefix)) as it:
+                return {prefix + entry.name for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
+
+    def _verify_hashes(self, hashes, hash_names):
+        """Verify the contents of the specified existing cache files.
+
+        Protected files and files with an up-to-date `State` entry are
+        trusted, only the rest of them are rehashed with the hash that they
+        are addressed by (see `hash_names`). Files which are only known by
+        their value are trusted as well, as the value alone doesn't tell
+        which hash it was computed with.
+        """
+        ret = []
+        unprotected = {}
+        for hash_ in hashes:
+            fs_path = self.hash_to_path(hash_)
+            try:
+                mode = os.stat(fs_path).st_mode
+            except FileNotFoundError:
+                continue
+            if (
+                stat.S_IMODE(mode) == self.CACHE_MODE
+                or hash_ not in hash_names
+            ):
+                ret.append(hash_)
+            else:
+                unprotected[fs_path] = hash_
+
+        by_name = defaultdict(dict)
+        for fs_path, hash_ in unprotected.items():
+            by_name[hash_names[hash_]][fs_path] = hash_
+
+        for name, paths in by_name.items():
+            entries = self.state.get_many(paths, self.fs, name=name)
+            for fs_path, _, hash_info in entries:
+                hash_ = paths[fs_path]
+                if hash_info and hash_info.value == hash_:
+                    self.protect(fs_path)
+                    ret.append(hash_)
+                    continue
+                try:
+                    self.check(HashInfo(name, hash_))
+                    ret.append(hash_)
+                except (FileNotFoundError, ObjectFormatError):
+                    pass
+        return ret
+
     def hashes_exist(
-        self, hashes, jobs=None, name=None
+        self, hashes, jobs=None, name=None, verify=True, hash_names=None
     ):  # pylint: disable=unused-argument
-        ret = []
+        """Return the hashes which exist in this cache.
+
+        Instead of checking every hash separately, the shard directories that
+        the hashes belong to are listed once with `os.scandir`. If `verify`
+        is set, the contents of found cache files are verified as well, using
+        the names of the hashes from `hash_names` (value -> name).
+        """
+        hashes = set(hashes)
+        packed = self.packs.intersection(hashes)
+        if packed:
+            return list(packed) + self.hashes_exist(
+                hashes - packed, jobs, name, verify, hash_names
+            )
+
+        shards = defaultdict(list)
+        for hash_ in hashes:
+            shards[hash_[:2]].append(hash_)
 
-        for hash_ in Tqdm(
-            hashes,
+        found = []
+        with Tqdm(
+            total=len(hashes),
             unit="file",
             desc="Querying " + ("cache in " + name if name else "local cache"),
-        ):
-            hash_info = HashInfo(self.fs.PARAM_CHECKSUM, hash_)
-            try:
-                self.check(hash_info)
-                ret.append(hash_)
-            except (FileNotFoundError, ObjectFormatError):
-                pass
-
-        return ret
+        ) as pbar:
+            for prefix, shard_hashes in shards.items():
+                # NOTE: listing a whole shard to look up a couple of hashes
+                # in a large cache is slower than checking them one by one
+                if len(shard_hashes) < self.SCANDIR_THRESHOLD:
+                    found.extend(
+                        hash_
+                        for hash_ in shard_hashes
+                        if os.path.lexists(self.hash_to_path(hash_))
+                    )
+                else:
+                    found.extend(
+                        self._scandir_shard(prefix).intersection(shard_hashes)
+                    )
+                pbar.update(len(shard_hashes))
+
+        if not verify:
+            return found
+        return self._verify_hashes(found, hash_names or {})
 
     def _list_paths(self, prefix=None, progress_callback=None):
         assert self.fs_path is not None
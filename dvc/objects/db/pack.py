@@ -0,0 +1,428 @@
+"""Packs of small objects.
+
+Storing every object as a separate file is expensive for remotes with a
+high per-request latency or per-object cost, when there are many small
+objects. Such objects can be grouped into pack files instead:
+
+    <odb>/packs/<pack id>.pack  - concatenated contents of the objects
+    <odb>/packs/<pack id>.idx   - {"objects": {hash: [offset, size]}}
+
+Packed objects are read with ranged reads from the pack file. Loose
+objects are still stored and looked up at `hash_to_path`, so ODBs with
+and without packs are fully compatible.
+"""
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from dvc.fs.base import FileSystem
+
+if TYPE_CHECKING:
+    from dvc.hash_info import HashInfo
+
+    from .base import ObjectDB
+
+logger = logging.getLogger(__name__)
+
+PACKS_DIR = "packs"
+PACK_SUFFIX = ".pack"
+INDEX_SUFFIX = ".idx"
+PACK_SIZE = 64 * 1024 * 1024  # 64 MiB
+
+# (pack path, offset, size)
+PackEntry = Tuple[str, int, int]
+
+
+class PackedFileSystem(FileSystem):
+    """Read-only filesystem exposing packed objects at their usual paths.
+
+    Object contents are read from the pack files on the underlying
+    filesystem with ranged reads.
+    """
+
+    scheme = "pack"
+    PARAM_CHECKSUM = "md5"
+
+    def __init__(self, fs: "FileSystem", index: "PackIndex"):
+        super().__init__()
+        self.sep = fs.sep
+        self.fs = fs
+        self.index = index
+
+    def _entry(self, path: str) -> PackEntry:
+        entry = self.index.find(path)
+        if entry is None:
+            raise FileNotFoundError(path)
+        return entry
+
+    def exists(self, path) -> bool:
+        return self.index.find(path) is not None
+
+    def info(self, path):
+        _, _, size = self._entry(path)
+        return {"name": path, "size": size, "type": "file"}
+
+    def cat(self, path) -> bytes:
+        with self.open(path, "rb") as fobj:
+            return fobj.read()
+
+    def open(self, path, mode: str = "r", encoding: str = None, **kwargs):
+        assert mode in ("r", "rb")
+        fobj = io.BufferedReader(
+            _PackedObjectReader(self.fs, *self._entry(path))
+        )
+        if mode == "rb":
+            return fobj
+        return io.TextIOWrapper(fobj, encoding=encoding)
+
+    def get_file(self, from_info, to_file, callback=None, **kwargs):
+        from dvc.utils import LOCAL_CHUNK_SIZE
+
+        _, _, size = self._entry(from_info)
+        if callback:
+            callback.set_size(size)
+        with self.open(from_info, "rb") as fsrc:
+            with open(to_file, "wb") as fdest:
+                while True:
+                    data = fsrc.read(LOCAL_CHUNK_SIZE)
+                    if not data:
+                        break
+                    fdest.write(data)
+                    if callback:
+                        callback.relative_update(len(data))
+
+
+class _PackedObjectReader(io.RawIOBase):
+    """Seekable reader of a single object stored in a pack.
+
+    The pack is only opened on the first read, and only the range of the
+    object is ever read from it.
+    """
+
+    def __init__(
+        self, fs: "FileSystem", pack_path: str, offset: int, size: int
+    ):
+        super().__init__()
+        self._fs = fs
+        self._pack_path = pack_path
+        self._offset = offset
+        self._size = size
+        self._pos = 0
+        self._fobj = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, b):
+        count = min(len(b), self._size - self._pos)
+        if count <= 0:
+            return 0
+
+        if self._fobj is None:
+            self._fobj = self._fs.open(self._pack_path, "rb")
+        self._fobj.seek(self._offset + self._pos)
+        data = self._fobj.read(count)
+        if not data:
+            raise EOFError(f"'{self._pack_path}' is truncated")
+        b[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+    def close(self):
+        if self._fobj is not None:
+            self._fobj.close()
+            self._fobj = None
+        super().close()
+
+
+class PackIndex:
+    """Index of the objects stored in the packs of an ODB.
+
+    Pack indexes are listed and loaded on first use, regardless of
+    `pack_threshold` (which only controls writing packs), as packs might
+    have been written by someone else. ODBs without packs only pay for a
+    single `exists` check of the packs dir. Pack indexes are immutable, so
+    downloaded ones are cached in the ODB's `tmp_dir`.
+    """
+
+    CACHE_SUFFIX = ".packs"
+
+    def __init__(self, odb: "ObjectDB"):
+        self.odb = odb
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, PackEntry]] = None
+        self._fs: Optional[PackedFileSystem] = None
+
+    @property
+    def path(self) -> str:
+        return self.odb.fs.path.join(self.odb.fs_path, PACKS_DIR)
+
+    @property
+    def fs(self) -> PackedFileSystem:
+        if self._fs is None:
+            self._fs = PackedFileSystem(self.odb.fs, self)
+        return self._fs
+
+    @property
+    def cache_dir(self) -> Optional[str]:
+        from . import _index_name
+        from .index import ObjectDBSnapshot
+
+        if not self.odb.tmp_dir:
+            return None
+        return os.path.join(
+            self.odb.tmp_dir,
+            ObjectDBSnapshot.INDEX_DIR,
+            _index_name(self.odb) + self.CACHE_SUFFIX,
+        )
+
+    def _cache_path(self, index_path: str) -> Optional[str]:
+        cache_dir = self.cache_dir
+        if not cache_dir:
+            return None
+        return os.path.join(cache_dir, self.odb.fs.path.name(index_path))
+
+    def _read_index(self, index_path: str) -> dict:
+        cache_path = self._cache_path(index_path)
+        if cache_path is None:
+            with self.odb.fs.open(index_path, "r") as fobj:
+                return json.load(fobj)
+
+        try:
+            with open(cache_path, encoding="utf-8") as fobj:
+                return json.load(fobj)
+        except (FileNotFoundError, ValueError):
+            pass
+
+        with self.odb.fs.open(index_path, "r") as fobj:
+            raw = json.load(fobj)
+        self._save_index(cache_path, raw)
+        return raw
+
+    @staticmethod
+    def _save_index(cache_path: str, raw: dict):
+        from dvc.utils import tmp_fname
+        from dvc.utils.fs import makedirs
+
+        makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp = tmp_fname(cache_path)
+        with open(tmp, "w", encoding="utf-8") as fobj:
+            json.dump(raw, fobj, sort_keys=True)
+        os.replace(tmp, cache_path)
+
+    def _load_index(self, index_path: str) -> Dict[str, PackEntry]:
+        pack_path = index_path[: -len(INDEX_SUFFIX)] + PACK_SUFFIX
+        try:
+            raw = self._read_index(index_path)
+            return {
+                hash_: (pack_path, offset, size)
+                for hash_, (offset, size) in raw["objects"].items()
+            }
+        except (ValueError, TypeError, KeyError):
+            logger.warning("ignoring corrupted pack index '%s'", index_path)
+            return {}
+
+    @property
+    def entries(self) -> Dict[str, PackEntry]:
+        with self._lock:
+            if self._entries is None:
+                entries: Dict[str, PackEntry] = {}
+                for index_path in self._list_indexes():
+                    entries.update(self._load_index(index_path))
+                self._entries = entries
+            return self._entries
+
+    def _list_indexes(self) -> Iterator[str]:
+        if not self.odb.fs_path:
+            return
+        try:
+            if not self.odb.fs.exists(self.path):
+                return
+            paths = list(self.odb.fs.find(self.path))
+        except (FileNotFoundError, NotImplementedError):
+            return
+        yield from (path for path in paths if path.endswith(INDEX_SUFFIX))
+
+    def __contains__(self, hash_: str) -> bool:
+        return hash_ in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __bool__(self) -> bool:
+        return bool(self.entries)
+
+    def intersection(self, hashes: Iterable[str]) -> Set[str]:
+        return set(hashes).intersection(self.entries)
+
+    def get(self, hash_: str) -> Optional[PackEntry]:
+        return self.entries.get(hash_)
+
+    def find(self, path: str) -> Optional[PackEntry]:
+        """Find the entry of a packed object by its `hash_to_path` path."""
+        parts = self.odb.fs.path.parts(path)[-2:]
+        return self.get("".join(parts))
+
+    def packs(self) -> Dict[str, Set[str]]:
+        """Return hashes stored in each of the packs."""
+        ret: Dict[str, Set[str]] = {}
+        for hash_, (pack_path, _, _) in self.entries.items():
+            ret.setdefault(pack_path, set()).add(hash_)
+        return ret
+
+    def add(self, pack_path: str, objects: Dict[str, Tuple[int, int]]):
+        entries = self.entries
+        index_path = pack_path[: -len(PACK_SUFFIX)] + INDEX_SUFFIX
+        cache_path = self._cache_path(index_path)
+        if cache_path:
+            self._save_index(cache_path, {"objects": objects})
+        with self._lock:
+            for hash_, (offset, size) in objects.items():
+                entries[hash_] = (pack_path, offset, size)
+
+    def remove(self, pack_path: str):
+        """Remove the specified pack and its index from the ODB."""
+        index_path = pack_path[: -len(PACK_SUFFIX)] + INDEX_SUFFIX
+        # NOTE: index goes first, so that there are no entries pointing to a
+        # missing pack
+        self.odb.fs.remove(index_path)
+        self.odb.fs.remove(pack_path)
+        cache_path = self._cache_path(index_path)
+        if cache_path and os.path.exists(cache_path):
+            os.remove(cache_path)
+        entries = self.entries
+        with self._lock:
+            for hash_ in [
+                hash_
+                for hash_, (path, _, _) in entries.items()
+                if path == pack_path
+            ]:
+                del entries[hash_]
+
+
+# (hash, fs, fs_path, size) of an object to pack
+_PackItem = Tuple["HashInfo", "FileSystem", str, int]
+
+
+def _iter_batches(
+    items: Iterable[_PackItem], pack_size: int
+) -> Iterator[List[_PackItem]]:
+    batch: List[_PackItem] = []
+    total = 0
+    for item in items:
+        size = item[3]
+        if batch and total + size > pack_size:
+            yield batch
+            batch, total = [], 0
+        batch.append(item)
+        total += size
+    if batch:
+        yield batch
+
+
+def _write_pack(
+    batch: List[_PackItem], dest: "ObjectDB", tmp_dir: str
+) -> Tuple[str, Dict[str, Tuple[int, int]]]:
+    from dvc.fs.local import localfs
+    from dvc.utils import tmp_fname
+
+    objects: Dict[str, Tuple[int, int]] = {}
+    digest = hashlib.md5()
+    tmp_pack = tmp_fname(os.path.join(tmp_dir, "pack"))
+    tmp_index = tmp_fname(os.path.join(tmp_dir, "idx"))
+    try:
+        offset = 0
+        with open(tmp_pack, "wb") as fobj:
+            for hash_info, fs, fs_path, _ in batch:
+                with fs.open(fs_path, "rb") as src_fobj:
+                    data = src_fobj.read()
+                fobj.write(data)
+                digest.update(data)
+                assert hash_info.value
+                objects[hash_info.value] = (offset, len(data))
+                offset += len(data)
+
+        with open(tmp_index, "w", encoding="utf-8") as fobj:
+            json.dump({"objects": objects}, fobj, sort_keys=True)
+
+        pack_id = digest.hexdigest()
+        packs_dir = dest.packs.path
+        pack_path = dest.fs.path.join(packs_dir, pack_id + PACK_SUFFIX)
+        index_path = dest.fs.path.join(packs_dir, pack_id + INDEX_SUFFIX)
+        dest.makedirs(packs_dir)
+        # NOTE: index is uploaded last, so that objects only become visible
+        # once the whole pack is available
+        dest.fs.upload(tmp_pack, pack_path, no_progress_bar=True)
+        dest.fs.upload(tmp_index, index_path, no_progress_bar=True)
+    finally:
+        for path in (tmp_pack, tmp_index):
+            if localfs.exists(path):
+                localfs.remove(path)
+    return pack_path, objects
+
+
+def pack(
+    src: "ObjectDB",
+    dest: "ObjectDB",
+    objs: Iterable["HashInfo"],
+    tmp_dir: str,
+    pack_size: Optional[int] = None,
+    progress_callback=None,
+) -> int:
+    """Pack the specified objects from `src` and upload them to `dest`.
+
+    Returns the number of objects which failed to be packed.
+    """
+    from dvc.utils.fs import makedirs
+
+    makedirs(tmp_dir, exist_ok=True)
+    items = []
+    for hash_info in objs:
+        obj = src.get(hash_info)
+        size = obj.fs.getsize(obj.fs_path) or 0
+        items.append((hash_info, obj.fs, obj.fs_path, size))
+
+    fails = 0
+    for batch in _iter_batches(items, pack_size or PACK_SIZE):
+        try:
+            pack_path, packed = _write_pack(batch, dest, tmp_dir)
+            dest.packs.add(pack_path, packed)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("failed to upload pack to '%s'", dest.fs_path)
+            fails += len(batch)
+        if progress_callback:
+            progress_callback(len(batch))
+    return fails
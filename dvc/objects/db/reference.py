@@ -21,7 +21,8 @@ class ReferenceObjectDB(ObjectDB):
     """Reference ODB.
 
     File objects are stored as ReferenceHashFiles which reference paths outside
-    of the staging ODB fs. Tree objects are stored natively.
+    of the staging ODB fs. Tree and chunked file manifests are stored
+    natively.
     """
 
     def __init__(self, *args, **kwargs):
@@ -30,7 +31,7 @@ class ReferenceObjectDB(ObjectDB):
         self._obj_cache: Dict["HashInfo", "ReferenceHashFile"] = {}
 
     def get(self, hash_info: "HashInfo"):
-        if hash_info.isdir:
+        if hash_info.isdir or hash_info.ischunked:
             return super().get(hash_info)
         try:
             return self._obj_cache[hash_info]
@@ -61,7 +62,7 @@ class ReferenceObjectDB(ObjectDB):
         hardlink: bool = False,
     ):
         self.makedirs(self.fs.path.parent(to_info))
-        if hash_info.isdir:
+        if hash_info.isdir or hash_info.ischunked:
             return super()._add_file(
                 from_fs,
                 from_info,
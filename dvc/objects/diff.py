@@ -1,5 +1,15 @@
+import posixpath
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 if TYPE_CHECKING:
     from dvc.hash_info import HashInfo
@@ -69,48 +79,120 @@ class DiffResult:
 
 ROOT = ("",)
 
+# NOTE: checking a handful of hashes one by one is cheaper than listing
+# the cache shards they are in
+_LIST_CACHE_THRESHOLD = 256
+
+
+def _in_cache(oid, cache):
+    from .errors import ObjectFormatError
+
+    if not oid:
+        return False
+
+    try:
+        cache.check(oid)
+        return True
+    except (FileNotFoundError, ObjectFormatError):
+        return False
+
+
+def _cached_hashes(oids: Iterable["HashInfo"], cache) -> Set[str]:
+    """Return the values of the specified hashes which exist in cache.
+
+    For a large number of hashes this lists the cache shards they belong to
+    (one directory listing per shard) instead of checking every hash.
+    """
+    from dvc.scheme import Schemes
+
+    oids = set(oids)
+    if len(oids) < _LIST_CACHE_THRESHOLD or cache.fs.scheme != Schemes.LOCAL:
+        return {oid.value for oid in oids if _in_cache(oid, cache)}
+
+    hashes = {oid.value for oid in oids}
+
+    ret: Set[str] = set()
+    for prefix in sorted({hash_[:2] for hash_ in hashes}):
+        # pylint: disable=protected-access
+        ret.update(hashes.intersection(cache._list_hashes(prefix)))
+    return ret
+
+
+def _iter_entries(obj) -> Iterator[Tuple[str, Tuple[str], "HashInfo"]]:
+    from .tree import Tree
+
+    if not isinstance(obj, Tree):
+        return
+    for key, _, oid in obj.iter_sorted():
+        yield posixpath.sep.join(key), key, oid
+
+
+def _merge_entries(old, new):
+    """Merge-join sorted entries of two trees.
+
+    Yields (key, old_oid, new_oid) tuples for all keys which are present
+    in any of the trees.
+    """
+    old_entries = _iter_entries(old)
+    new_entries = _iter_entries(new)
+    old_entry = next(old_entries, None)
+    new_entry = next(new_entries, None)
+    while old_entry or new_entry:
+        if new_entry is None or (old_entry and old_entry[0] < new_entry[0]):
+            yield old_entry[1], old_entry[2], None
+            old_entry = next(old_entries, None)
+        elif old_entry is None or new_entry[0] < old_entry[0]:
+            yield new_entry[1], None, new_entry[2]
+            new_entry = next(new_entries, None)
+        else:
+            yield new_entry[1], old_entry[2], new_entry[2]
+            old_entry = next(old_entries, None)
+            new_entry = next(new_entries, None)
+
 
 def diff(
     old: Optional["HashFile"], new: Optional["HashFile"], cache
 ) -> DiffResult:
+    """Compare two objects.
+
+    Tree entries are compared by merging both (sorted) listings, so only
+    changed entries are checked individually in the cache. Existence of
+    unchanged entries is checked in bulk.
+    """
     from .tree import Tree
 
     if old is None and new is None:
         return DiffResult()
 
-    def _get_keys(obj):
-        if not obj:
-            return []
-        return [ROOT] + (
-            [key for key, _, _ in obj] if isinstance(obj, Tree) else []
-        )
-
-    old_keys = set(_get_keys(old))
-    new_keys = set(_get_keys(new))
-
-    def _get_oid(obj, key):
-        if not obj or key == ROOT:
-            return obj.hash_info if obj else None
-
+    def _get_dir_oid(obj, key):
+        # NOTE: key might be a directory in this tree (e.g. if it was
+        # replaced with a file in the other one)
+        if not isinstance(obj, Tree):
+            return None
         entry_obj = obj.get(cache, key)
         return entry_obj.hash_info if entry_obj else None
 
-    def _in_cache(oid, cache):
-        from .errors import ObjectFormatError
-
-        if not oid:
-            return False
-
-        try:
-            cache.check(oid)
-            return True
-        except (FileNotFoundError, ObjectFormatError):
-            return False
-
     ret = DiffResult()
-    for key in old_keys | new_keys:
-        old_oid = _get_oid(old, key)
-        new_oid = _get_oid(new, key)
+    unchanged = []
+    entries = chain(
+        [
+            (
+                ROOT,
+                old.hash_info if old else None,
+                new.hash_info if new else None,
+            )
+        ],
+        _merge_entries(old, new),
+    )
+    for key, old_oid, new_oid in entries:
+        if old_oid is None:
+            old_oid = _get_dir_oid(old, key)
+        elif new_oid is None:
+            new_oid = _get_dir_oid(new, key)
+
+        if key != ROOT and old_oid and old_oid == new_oid:
+            unchanged.append((key, new_oid))
+            continue
 
         change = Change(
             old=TreeEntry(_in_cache(old_oid, cache), key, old_oid),
@@ -131,4 +213,16 @@ def diff(
                 ret.modified.append(change)
             else:
                 ret.unchanged.append(change)
+
+    cached = _cached_hashes((oid for _, oid in unchanged), cache)
+    for key, oid in unchanged:
+        in_cache = oid.value in cached
+        change = Change(
+            old=TreeEntry(in_cache, key, oid),
+            new=TreeEntry(in_cache, key, oid),
+        )
+        if in_cache:
+            ret.unchanged.append(change)
+        else:
+            ret.modified.append(change)
     return ret
@@ -82,5 +82,21 @@ class HashFile:
         )
 
         assert actual.name == self.hash_info.name
-        if actual.value.split(".")[0] != self.hash_info.value.split(".")[0]:
+        expected = self.hash_info.value.split(".")[0]
+        if actual.value.split(".")[0] == expected:
+            return
+        # NOTE: chunks of chunked files are addressed by the md5 of their
+        # raw contents, which only differs from `file_md5` for text files
+        # with CRLFs (see `dvc.objects.chunked`)
+        if actual.name != "md5" or self._raw_md5() != expected:
             raise ObjectFormatError(f"{self} is corrupted")
+
+    def _raw_md5(self):
+        import hashlib
+
+        from dvc.utils import _fobj_hash
+
+        hash_md5 = hashlib.md5()
+        with self.fs.open(self.fs_path, "rb") as fobj:
+            _fobj_hash(fobj, hash_md5, binary=True)
+        return hash_md5.hexdigest()
@@ -0,0 +1,134 @@
+import logging
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Iterable, List, NamedTuple, Optional, Set
+
+from dvc.hash_info import HASH_CHUNKS_SUFFIX, HASH_DIR_SUFFIX
+
+if TYPE_CHECKING:
+    from dvc.hash_info import HashInfo
+
+logger = logging.getLogger(__name__)
+
+
+class GCResult(NamedTuple):
+    count: int
+    # NOTE: only computed on dry runs, as it requires the size of every
+    # object and removal doesn't need it
+    size: Optional[int] = None
+
+    def __bool__(self):
+        return bool(self.count)
+
+
+class UsedHashes:
+    """Compact set of used hash values.
+
+    `gc` needs to check every object in an ODB against the hashes used by
+    the repo, which for large remotes means tens of millions of values.
+    Keeping them as `str` in a `set` takes ~100 bytes per hash, so md5
+    values (the default, optionally with a `.dir` or `.chunks` suffix)
+    are instead packed into 17 bytes each (16 digest bytes + 1 suffix
+    byte) and kept in buckets by their first byte. On the first lookup
+    after a change, a bucket is sorted and split into an `array` of the
+    first 8 bytes of the digests, which is searched with `bisect`, and
+    the remaining bytes. Other values are kept as they are in a `set`.
+
+    `HashInfo`s of directories and chunked files are remembered, as their
+    entries need to be marked as used separately (see `ObjectDB.gc()`).
+    """
+
+    SUFFIXES = ("", HASH_DIR_SUFFIX, HASH_CHUNKS_SUFFIX)
+    DIGEST_SIZE = 16
+    KEY_SIZE = 8
+    REST_SIZE = DIGEST_SIZE - KEY_SIZE + 1
+
+    def __init__(self, hash_infos: Optional[Iterable["HashInfo"]] = None):
+        self._pending: List[bytearray] = [bytearray() for _ in range(256)]
+        self._keys: List["array[int]"] = [array("Q") for _ in range(256)]
+        self._rest: List[bytes] = [b""] * 256
+        self._other: Set[str] = set()
+        self.expandable: Set["HashInfo"] = set()
+        if hash_infos is not None:
+            self.update(hash_infos)
+
+    @classmethod
+    def _encode(cls, value: str) -> Optional[bytes]:
+        code, digest = 0, value
+        for i, suffix in enumerate(cls.SUFFIXES[1:], start=1):
+            if value.endswith(suffix):
+                code, digest = i, value[: -len(suffix)]
+                break
+        # NOTE: only lowercase hex digests survive the round trip
+        if len(digest) != 2 * cls.DIGEST_SIZE or digest != digest.lower():
+            return None
+        try:
+            return bytes.fromhex(digest) + bytes((code,))
+        except ValueError:
+            return None
+
+    def add(self, value: str):
+        record = self._encode(value)
+        if record is None:
+            self._other.add(value)
+        else:
+            self._pending[record[0]] += record
+
+    def update(self, hash_infos: Iterable["HashInfo"]):
+        for hash_info in hash_infos:
+            self.add(hash_info.value)
+            if hash_info.isdir or hash_info.ischunked:
+                self.expandable.add(hash_info)
+
+    def update_values(self, values: Iterable[str]):
+        for value in values:
+            self.add(value)
+
+    def _sort(self, index: int):
+        key_size, rest_size = self.KEY_SIZE, self.REST_SIZE
+        record_size = key_size + rest_size
+        pending = self._pending[index]
+        keys, rest = self._keys[index], self._rest[index]
+
+        records = {
+            bytes(pending[i : i + record_size])
+            for i in range(0, len(pending), record_size)
+        }
+        records.update(
+            key.to_bytes(key_size, "big") + rest[i : i + rest_size]
+            for key, i in zip(keys, range(0, len(rest), rest_size))
+        )
+        records = sorted(records)
+
+        self._keys[index] = array(
+            "Q", (int.from_bytes(r[:key_size], "big") for r in records)
+        )
+        self._rest[index] = b"".join(r[key_size:] for r in records)
+        self._pending[index] = bytearray()
+
+    def __contains__(self, value: str) -> bool:
+        record = self._encode(value)
+        if record is None:
+            return value in self._other
+
+        index = record[0]
+        if self._pending[index]:
+            self._sort(index)
+        keys, rest = self._keys[index], self._rest[index]
+        key_size, rest_size = self.KEY_SIZE, self.REST_SIZE
+        key = int.from_bytes(record[:key_size], "big")
+        i = bisect_left(keys, key)
+        while i < len(keys) and keys[i] == key:
+            if rest[i * rest_size : (i + 1) * rest_size] == record[key_size:]:
+                return True
+            i += 1
+        return False
+
+    def __len__(self) -> int:
+        for index, pending in enumerate(self._pending):
+            if pending:
+                self._sort(index)
+        return sum(len(keys) for keys in self._keys) + len(self._other)
+
+    def isdisjoint(self, values: Iterable[str]) -> bool:
+        return not any(value in self for value in values)
@@ -1,15 +1,15 @@
 import hashlib
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
 from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 from dvc.exceptions import DvcIgnoreInCollectedDirError
-from dvc.hash_info import HashInfo
+from dvc.hash_info import DEFAULT_HASH_NAME, HASH_NAMES, HashInfo
 from dvc.ignore import DvcIgnore
 from dvc.progress import Tqdm
-from dvc.utils import file_md5
+from dvc.utils import file_hash
 
 from .db.reference import ReferenceObjectDB
 from .file import HashFile
@@ -25,16 +25,18 @@ logger = logging.getLogger(__name__)
 
 
 _STAGING_MEMFS_PATH = "dvc-staging"
+# number of files sent to a hashing worker process at once
+_HASH_BATCH_SIZE = 256
 
 
-def _upload_file(from_fs_path, fs, odb, upload_odb):
+def _upload_file(from_fs_path, fs, name, odb, upload_odb):
     from dvc.utils import tmp_fname
     from dvc.utils.stream import HashedStreamReader
 
     fs_path = upload_odb.fs.path
     tmp_info = fs_path.join(upload_odb.fs_path, tmp_fname())
     with fs.open(from_fs_path, mode="rb", chunk_size=fs.CHUNK_SIZE) as stream:
-        stream = HashedStreamReader(stream)
+        stream = HashedStreamReader(stream, name=name)
         size = fs.getsize(from_fs_path)
         upload_odb.fs.upload(
             stream, tmp_info, desc=fs_path.name(from_fs_path), total=size
@@ -59,8 +61,11 @@ def _adapt_info(info, scheme):
     return info
 
 
-def _get_file_hash(fs_path, fs, name):
-    info = _adapt_info(fs.info(fs_path), fs.scheme)
+def _get_file_hash(fs_path, fs, name, stat=None):
+    if stat is not None:
+        info = {"size": stat.size}
+    else:
+        info = _adapt_info(fs.info(fs_path), fs.scheme)
 
     if name in info:
         assert not info[name].endswith(".dir")
@@ -68,8 +73,8 @@ def _get_file_hash(fs_path, fs, name):
     elif hasattr(fs, name):
         func = getattr(fs, name)
         hash_value = func(fs_path)
-    elif name == "md5":
-        hash_value = file_md5(fs_path, fs)
+    elif name in HASH_NAMES:
+        hash_value = file_hash(fs_path, fs, name)
     else:
         raise NotImplementedError
 
@@ -78,29 +83,33 @@ def _get_file_hash(fs_path, fs, name):
     return meta, hash_info
 
 
-def get_file_hash(fs_path, fs, name, state=None):
+def get_file_hash(fs_path, fs, name, state=None, stat=None):
     if state:
         meta, hash_info = state.get(  # pylint: disable=assignment-from-none
-            fs_path, fs
+            fs_path, fs, stat=stat, name=name
         )
-        if hash_info:
+        # NOTE: chunked hashes are only valid for chunked objects, which are
+        # staged separately (see `_stage_chunked`)
+        if hash_info and not hash_info.ischunked:
             return meta, hash_info
 
-    meta, hash_info = _get_file_hash(fs_path, fs, name)
+    meta, hash_info = _get_file_hash(fs_path, fs, name, stat=stat)
 
     if state:
         assert ".dir" not in hash_info.value
-        state.save(fs_path, fs, hash_info)
+        state.save(fs_path, fs, hash_info, stat=stat)
 
     return meta, hash_info
 
 
-def _stage_file(fs_path, fs, name, odb=None, upload_odb=None, dry_run=False):
+def _stage_file(
+    fs_path, fs, name, odb=None, upload_odb=None, dry_run=False, stat=None
+):
     state = odb.state if odb else None
-    meta, hash_info = get_file_hash(fs_path, fs, name, state=state)
+    meta, hash_info = get_file_hash(fs_path, fs, name, state=state, stat=stat)
     if upload_odb and not dry_run:
-        assert odb and name == "md5"
-        return _upload_file(fs_path, fs, odb, upload_odb)
+        assert odb and name in HASH_NAMES
+        return _upload_file(fs_path, fs, name, odb, upload_odb)
 
     if dry_run:
         obj = HashFile(fs_path, fs, hash_info)
@@ -111,6 +120,115 @@ def _stage_file(fs_path, fs, name, odb=None, upload_odb=None, dry_run=False):
     return fs_path, meta, obj
 
 
+def _hash_files(entries, name):
+    """Compute hashes for a batch of local files.
+
+    Runs inside of a worker process, so it should only operate on picklable
+    arguments and return values.
+    """
+    from dvc.fs.local import localfs
+
+    return [
+        (fs_path, *_get_file_hash(fs_path, localfs, name, stat=stat))
+        for fs_path, stat in entries
+    ]
+
+
+def _use_process_backend(fs, name, upload_odb=None, **kwargs):
+    from dvc.fs.local import LocalFileSystem
+
+    return (
+        fs.hash_backend == "process"
+        and isinstance(fs, LocalFileSystem)
+        and name in HASH_NAMES
+        and not upload_odb
+    )
+
+
+def _build_objects_in_processes(
+    walk_iterator, fs, name, pbar, jobs=None, odb=None, dry_run=False
+):
+    from collections import deque
+
+    from funcy import chunks
+
+    state = odb.state if odb else None
+    if jobs is None:
+        # hashing in processes is not limited by the GIL, so unless
+        # `checksum_jobs` was set explicitly we can use all of the cores.
+        jobs = fs.config.get("checksum_jobs") or os.cpu_count()
+
+    def _stage(fs_path, meta, hash_info):
+        pbar.update()
+        if dry_run:
+            return fs_path, meta, HashFile(fs_path, fs, hash_info)
+        odb.add(fs_path, fs, hash_info, hardlink=False)
+        return fs_path, meta, odb.get(hash_info)
+
+    def _collect(future, stats):
+        results = future.result()
+        if state:
+            state.save_many(
+                ((fs_path, hash_info) for fs_path, _, hash_info in results),
+                fs,
+                stats=stats,
+            )
+        return [_stage(*entry) for entry in results]
+
+    futures: deque = deque()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for batch in chunks(_HASH_BATCH_SIZE, walk_iterator):
+            stats = dict(batch)
+            pending = []
+            if state:
+                entries = state.get_many(stats, fs, stats=stats, name=name)
+            else:
+                entries = ((fs_path, None, None) for fs_path in stats)
+            for fs_path, meta, hash_info in entries:
+                if hash_info:
+                    yield _stage(fs_path, meta, hash_info)
+                else:
+                    pending.append((fs_path, stats[fs_path]))
+
+            if pending:
+                futures.append(
+                    (executor.submit(_hash_files, pending, name), stats)
+                )
+            # keep a bounded number of batches in flight
+            while len(futures) > 2 * jobs:
+                yield from _collect(*futures.popleft())
+
+        while futures:
+            yield from _collect(*futures.popleft())
+
+
+def _walk_files(fs_path, fs, dvcignore=None):
+    """Yield (path, stat) pairs for the files in a directory.
+
+    On the local filesystem, stat results of the files are collected while
+    walking the directory and reused later for the state lookups and
+    hashing, instead of stat-ing each file again. Other filesystems don't
+    provide them and yield None instead.
+    """
+    from dvc.fs.local import LocalFileSystem
+
+    if isinstance(fs, LocalFileSystem):
+        if dvcignore:
+            entries = dvcignore.scan(fs, fs_path)
+        else:
+            entries = fs.scan(fs_path)
+        for entry in entries:
+            yield entry.path, entry
+        return
+
+    if dvcignore:
+        walk_iterator = dvcignore.find(fs, fs_path)
+    else:
+        walk_iterator = fs.find(fs_path)
+    for file_path in walk_iterator:
+        yield file_path, None
+
+
 def _build_objects(
     fs_path,
     fs,
@@ -120,15 +238,24 @@ def _build_objects(
     no_progress_bar=False,
     **kwargs,
 ):
-    if dvcignore:
-        walk_iterator = dvcignore.find(fs, fs_path)
-    else:
-        walk_iterator = fs.find(fs_path)
+    walk_iterator = _walk_files(fs_path, fs, dvcignore)
     with Tqdm(
-        unit="md5",
+        unit=name,
         desc="Computing file/dir hashes (only done once)",
         disable=no_progress_bar,
     ) as pbar:
+        if _use_process_backend(fs, name, **kwargs):
+            yield from _build_objects_in_processes(
+                walk_iterator,
+                fs,
+                name,
+                pbar,
+                jobs=jobs,
+                odb=kwargs.get("odb"),
+                dry_run=kwargs.get("dry_run", False),
+            )
+            return
+
         worker = pbar.wrap_fn(
             partial(
                 _stage_file,
@@ -140,7 +267,9 @@ def _build_objects(
         with ThreadPoolExecutor(
             max_workers=jobs if jobs is not None else fs.hash_jobs
         ) as executor:
-            yield from executor.map(worker, walk_iterator)
+            yield from executor.map(
+                lambda entry: worker(entry[0], stat=entry[1]), walk_iterator
+            )
 
 
 def _iter_objects(fs_path, fs, name, **kwargs):
@@ -188,13 +317,16 @@ def _stage_tree(fs_path, fs, fs_info, name, odb=None, **kwargs):
             pass
 
     meta, tree = _build_tree(fs_path, fs, name, odb=odb, **kwargs)
+    # NOTE: trees of external outputs are digested with the default hash
+    # first and then rehashed in the ODB, see `_stage_external_tree_info`
+    tree_name = name if name in HASH_NAMES else DEFAULT_HASH_NAME
     state = odb.state if odb and odb.state else None
     hash_info = None
     if state:
         _, hash_info = state.get(  # pylint: disable=assignment-from-none
-            fs_path, fs
+            fs_path, fs, name=tree_name
         )
-    tree.digest(hash_info=hash_info)
+    tree.digest(hash_info=hash_info, name=tree_name)
     odb.add(tree.fs_path, tree.fs, tree.hash_info, hardlink=False)
     raw = odb.get(tree.hash_info)
     # cleanup unneeded memfs tmpfile and return tree based on the
@@ -206,6 +338,44 @@ def _stage_tree(fs_path, fs, fs_info, name, odb=None, **kwargs):
     return meta, tree
 
 
+def _should_chunk(odb, fs, name, details, upload=False):
+    from dvc.fs.local import LocalFileSystem
+
+    threshold = odb.chunk_threshold if odb else None
+    return (
+        threshold is not None
+        and isinstance(fs, LocalFileSystem)
+        and name in HASH_NAMES
+        and not upload
+        and details["size"] >= threshold
+    )
+
+
+def _stage_chunked(fs_path, fs, odb, staging, name, dry_run=False):
+    """Stage a large file as a chunked object.
+
+    Unlike regular files, which are only referenced from the staging ODB,
+    chunks are written to the destination ODB right away (similar to
+    `upload`), as they can't be referenced without copying the file.
+    """
+    from .chunked import ChunkedFile
+
+    obj = ChunkedFile.from_file(
+        fs_path, fs, odb=None if dry_run else odb, name=name
+    )
+    obj.digest(name=name)
+    meta = Meta(size=obj.size)
+    if dry_run:
+        return meta, obj
+
+    staging.add(obj.fs_path, obj.fs, obj.hash_info, hardlink=False)
+    raw = staging.get(obj.hash_info)
+    obj.fs.remove(obj.fs_path)
+    obj.fs = raw.fs
+    obj.fs_path = raw.fs_path
+    return meta, obj
+
+
 _url_cache: Dict[str, str] = {}
 
 
@@ -250,7 +420,7 @@ def _load_from_state(odb, staging, fs_path, fs, name):
     from .tree import Tree
 
     state = odb.state
-    meta, hash_info = state.get(fs_path, fs)
+    meta, hash_info = state.get(fs_path, fs, name=name)
     if hash_info:
         for odb_ in (odb, staging):
             if odb_.exists(hash_info):
@@ -271,7 +441,7 @@ def _stage_external_tree_info(odb, tree, name):
     # able to validate .dir files right in the workspace (e.g. check s3
     # etag), but could be dropped for manual validation with regular md5,
     # that would be universal for all clouds.
-    assert odb and name != "md5"
+    assert odb and name not in HASH_NAMES
 
     odb.add(tree.fs_path, tree.fs, tree.hash_info)
     raw = odb.get(tree.hash_info)
@@ -330,8 +500,13 @@ def stage(
             **kwargs,
         )
         logger.debug("staged tree '%s'", obj)
-        if name != "md5":
+        if name not in HASH_NAMES:
             obj = _stage_external_tree_info(odb, obj, name)
+    elif _should_chunk(odb, fs, name, details, upload=upload):
+        meta, obj = _stage_chunked(
+            fs_path, fs, odb, staging, name, dry_run=dry_run
+        )
+        logger.debug("staged chunked file '%s'", obj)
     else:
         _, meta, obj = _stage_file(
             fs_path,
@@ -4,15 +4,20 @@ from typing import TYPE_CHECKING, Dict, Iterable, NamedTuple, Optional, Set
 from dvc.hash_info import HashInfo
 from dvc.scheme import Schemes
 
+from .chunked import ChunkedFile
 from .tree import Tree
 
 if TYPE_CHECKING:
     from .db.base import ObjectDB
-    from .db.index import ObjectDBIndexBase
+    from .db.index import ObjectDBIndexBase, ObjectDBSnapshot
     from .file import HashFile
 
 logger = logging.getLogger(__name__)
 
+# number of snapshot hits which are verified to still exist in the ODB
+# before the snapshot is trusted
+SNAPSHOT_VERIFY_SIZE = 16
+
 
 class StatusResult(NamedTuple):
     exists: Set["HashInfo"]
@@ -68,6 +73,51 @@ def _indexed_dir_hashes(odb, index, dir_objs, name, cache_odb):
         yield tree.hash_info.value
 
 
+def _snapshot_hashes(odb, snapshot, hashes):
+    import random
+
+    found = set(snapshot.intersection(hashes))
+    if not found:
+        return found
+
+    # Validate our snapshot by verifying that some of the hashes it
+    # contains still exist on the remote
+    sample = random.sample(
+        sorted(found), min(len(found), SNAPSHOT_VERIFY_SIZE)
+    )
+    if len(odb.list_hashes_exists(sample)) != len(sample):
+        logger.debug(
+            "Remote cache missing hashes from snapshot, "
+            "clearing remote snapshot"
+        )
+        snapshot.clear()
+        return set()
+    return found
+
+
+def _odb_hashes(odb, snapshot, hashes, **kwargs):
+    if snapshot is None:
+        return odb.hashes_exist(hashes, name=odb.fs_path, **kwargs)
+
+    exists = _snapshot_hashes(odb, snapshot, hashes)
+    if exists == hashes:
+        return exists
+    found = odb.hashes_exist(hashes - exists, name=odb.fs_path, **kwargs)
+    snapshot.add(found)
+    return exists.union(found)
+
+
+def _load_chunked(odbs, hash_info):
+    from .errors import ObjectFormatError
+
+    for odb in odbs:
+        try:
+            return ChunkedFile.load(odb, hash_info)
+        except (FileNotFoundError, ObjectFormatError):
+            pass
+    return None
+
+
 def status(
     odb: "ObjectDB",
     obj_ids: Iterable["HashInfo"],
@@ -75,6 +125,7 @@ def status(
     index: Optional["ObjectDBIndexBase"] = None,
     cache_odb: Optional["ObjectDB"] = None,
     shallow: bool = True,
+    snapshot: Optional["ObjectDBSnapshot"] = None,
     **kwargs,
 ) -> "StatusResult":
     """Return status of whether or not the specified objects exist odb.
@@ -82,6 +133,10 @@ def status(
     If cache_odb is set, trees will be loaded from cache_odb instead of odb
     when needed.
 
+    If snapshot is set, hashes found in it are assumed to exist in odb
+    (after verifying a small sample of them), and hashes found by querying
+    odb are added to it.
+
     Status is returned as a tuple of:
         exists: objs that exist in odb
         missing: objs that do not exist in ODB
@@ -107,6 +162,12 @@ def status(
                     hash_infos[oid.value] = oid
             if index:
                 dir_objs[hash_info.value] = tree
+        elif hash_info.ischunked:
+            # chunks are never listed separately, so we always need to
+            # expand chunked objects regardless of `shallow`
+            obj = _load_chunked([cache_odb, odb], hash_info)
+            for _, _, oid in obj or []:
+                hash_infos[oid.value] = oid
         hash_infos[hash_info.value] = hash_info
 
     if odb.fs.scheme == Schemes.MEMORY:
@@ -128,7 +189,10 @@ def status(
             hashes.difference_update(exists)
 
     if hashes:
-        exists.update(odb.hashes_exist(hashes, name=odb.fs_path, **kwargs))
+        hash_names = {hash_: hash_infos[hash_].name for hash_ in hashes}
+        exists.update(
+            _odb_hashes(odb, snapshot, hashes, hash_names=hash_names, **kwargs)
+        )
     return StatusResult(
         {hash_infos[hash_] for hash_ in exists},
         {hash_infos[hash_] for hash_ in (hashes - exists)},
@@ -143,6 +207,8 @@ def compare_status(
     check_deleted: bool = True,
     src_index: Optional["ObjectDBIndexBase"] = None,
     dest_index: Optional["ObjectDBIndexBase"] = None,
+    src_snapshot: Optional["ObjectDBSnapshot"] = None,
+    dest_snapshot: Optional["ObjectDBSnapshot"] = None,
     **kwargs,
 ) -> "CompareStatusResult":
     """Compare status for the specified objects between two ODBs.
@@ -156,13 +222,13 @@ def compare_status(
     if "cache_odb" not in kwargs:
         kwargs["cache_odb"] = src
     dest_exists, dest_missing = status(
-        dest, obj_ids, index=dest_index, **kwargs
+        dest, obj_ids, index=dest_index, snapshot=dest_snapshot, **kwargs
     )
     # for transfer operations we can skip src status check when all objects
     # already exist in dest
     if dest_missing or check_deleted:
         src_exists, src_missing = status(
-            src, obj_ids, index=src_index, **kwargs
+            src, obj_ids, index=src_index, snapshot=src_snapshot, **kwargs
         )
     else:
         src_exists = dest_exists
@@ -1,7 +1,16 @@
 import errno
 import logging
 from functools import partial, wraps
-from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
 
 from funcy import split
 
@@ -9,15 +18,27 @@ from dvc.progress import Tqdm
 from dvc.utils.threadpool import ThreadPoolExecutor
 
 if TYPE_CHECKING:
+    from dvc.fs.fsspec_wrapper import FSSpecWrapper
     from dvc.hash_info import HashInfo
 
+    from .chunked import ChunkedFile
     from .db.base import ObjectDB
-    from .db.index import ObjectDBIndexBase
+    from .db.index import ObjectDBIndexBase, ObjectDBSnapshot
     from .tree import Tree
 
 logger = logging.getLogger(__name__)
 
 
+def _log_exception(fs_path, exc):
+    # NOTE: this means we ran out of file descriptors and there is no
+    # reason to try to proceed, as we will hit this error anyways.
+    # pylint: disable=no-member
+    if isinstance(exc, OSError) and exc.errno == errno.EMFILE:
+        raise exc
+
+    logger.error("failed to transfer '%s'", fs_path, exc_info=exc)
+
+
 def _log_exceptions(func):
     @wraps(func)
     def wrapper(fs_path, *args, **kwargs):
@@ -25,28 +46,149 @@ def _log_exceptions(func):
             func(fs_path, *args, **kwargs)
             return 0
         except Exception as exc:  # pylint: disable=broad-except
-            # NOTE: this means we ran out of file descriptors and there is no
-            # reason to try to proceed, as we will hit this error anyways.
-            # pylint: disable=no-member
-            if isinstance(exc, OSError) and exc.errno == errno.EMFILE:
-                raise
-
-            logger.exception("failed to transfer '%s'", fs_path)
+            _log_exception(fs_path, exc)
             return 1
 
     return wrapper
 
 
+def _get_async_fs(
+    src: "ObjectDB", dest: "ObjectDB", verify: bool
+) -> Optional["FSSpecWrapper"]:
+    """Return the remote filesystem if objects can be transferred using
+    its async fsspec implementation instead of a thread pool.
+    """
+    from dvc.fs.fsspec_wrapper import FSSpecWrapper
+    from dvc.fs.local import LocalFileSystem
+
+    from .db.base import ObjectDB
+
+    # NOTE: verification, read-only checks and ODBs that don't store objects
+    # as plain files (e.g. references) need to go through `dest.add()`.
+    if verify or dest.read_only:
+        return None
+    if type(src).get is not ObjectDB.get:
+        return None
+    if type(dest)._add_file is not ObjectDB._add_file:
+        return None
+
+    if isinstance(src.fs, LocalFileSystem):
+        fs = dest.fs
+    elif isinstance(dest.fs, LocalFileSystem):
+        fs = src.fs
+    else:
+        return None
+
+    if isinstance(fs, FSSpecWrapper) and fs.async_impl:
+        return fs
+    return None
+
+
+def _async_processor(
+    src: "ObjectDB",
+    dest: "ObjectDB",
+    fs: "FSSpecWrapper",
+    jobs: int,
+    pbar: "Tqdm",
+    fallback: Callable[["HashInfo"], int],
+) -> Callable:
+    def process(hash_infos: Iterable["HashInfo"]) -> List[int]:
+        fails = []
+        paths = {}
+        for hash_info in hash_infos:
+            obj = src.get(hash_info)
+            if obj.fs is not src.fs:
+                # e.g. packed objects, which are read from their pack
+                fails.append(fallback(hash_info))
+                continue
+            to_path = dest.hash_to_path(hash_info.value)
+            paths[obj.fs_path, to_path] = hash_info
+
+        # NOTE: create all parent directories beforehand, so that workers
+        # don't need to do it for every object
+        for parent in {dest.fs.path.parent(to) for _, to in paths}:
+            dest.makedirs(parent)
+
+        added = []
+
+        def callback(from_path, to_path, exc):
+            pbar.update()
+            if exc is None:
+                added.append((to_path, paths[from_path, to_path]))
+            else:
+                fails.append(1)
+                _log_exception(from_path, exc)
+
+        if fs is dest.fs:
+            fs.put_many(paths, jobs=jobs, callback=callback)
+        else:
+            fs.get_many(paths, jobs=jobs, callback=callback)
+
+        for to_path, _ in added:
+            dest.protect(to_path)
+        dest.state.save_many(added, dest.fs)
+        return fails
+
+    return process
+
+
+def _get_pack_tmp_dir(src: "ObjectDB", dest: "ObjectDB") -> Optional[str]:
+    import os
+
+    from dvc.fs.local import LocalFileSystem
+
+    if not dest.pack_threshold or not isinstance(src.fs, LocalFileSystem):
+        return None
+    tmp_dir = dest.tmp_dir or src.tmp_dir
+    if not tmp_dir:
+        return None
+    return os.path.join(tmp_dir, "packs")
+
+
+def _pack_processor(
+    src: "ObjectDB",
+    dest: "ObjectDB",
+    processor: Callable,
+    tmp_dir: str,
+    pbar: "Tqdm",
+) -> Callable:
+    from .db.pack import pack
+
+    def _is_small(hash_info: "HashInfo") -> bool:
+        obj = src.get(hash_info)
+        try:
+            return obj.fs.getsize(obj.fs_path) < dest.pack_threshold
+        except FileNotFoundError:
+            return False
+
+    def process(hash_infos: Iterable["HashInfo"]) -> List[int]:
+        small, rest = split(_is_small, hash_infos)
+        small = list(small)
+        if len(small) < 2:
+            # not worth a pack
+            rest = chain(rest, small)
+            small = []
+
+        fails = list(processor(rest))
+        if small:
+            fails.append(
+                pack(src, dest, small, tmp_dir, progress_callback=pbar.update)
+            )
+        return fails
+
+    return process
+
+
 def find_tree_by_obj_id(
     odbs: Iterable[Optional["ObjectDB"]], obj_id: "HashInfo"
-) -> Optional["Tree"]:
+) -> Optional[Union["Tree", "ChunkedFile"]]:
+    from . import load
     from .errors import ObjectFormatError
-    from .tree import Tree
 
     for odb in odbs:
         if odb is not None:
             try:
-                return Tree.load(odb, obj_id)
+                return load(odb, obj_id)
             except (FileNotFoundError, ObjectFormatError):
                 pass
     return None
@@ -61,13 +203,20 @@ def _do_transfer(
     src_index: Optional["ObjectDBIndexBase"] = None,
     dest_index: Optional["ObjectDBIndexBase"] = None,
     cache_odb: Optional["ObjectDB"] = None,
+    src_snapshot: Optional["ObjectDBSnapshot"] = None,
+    dest_snapshot: Optional["ObjectDBSnapshot"] = None,
     **kwargs: Any,
 ):
     from dvc.exceptions import FileTransferError
 
-    dir_ids, file_ids = split(lambda hash_info: hash_info.isdir, obj_ids)
+    # NOTE: chunked file manifests are handled the same way as trees, they
+    # are only transferred after all of their chunks
+    dir_ids, file_ids = split(
+        lambda hash_info: hash_info.isdir or hash_info.ischunked, obj_ids
+    )
     total_fails = 0
     succeeded_dir_objs = []
+    skipped_dir_ids = set()
     all_file_ids = set(file_ids)
 
     for dir_hash in dir_ids:
@@ -101,10 +250,11 @@ def _do_transfer(
                 "skipping .dir file upload",
                 dir_obj.name,
             )
+            skipped_dir_ids.add(dir_hash)
         else:
             is_dir_failed = sum(processor([dir_obj.hash_info]))
             total_fails += is_dir_failed
-            if not is_dir_failed:
+            if not is_dir_failed and dir_obj.hash_info.isdir:
                 succeeded_dir_objs.append(dir_obj)
 
     # insert the rest
@@ -112,8 +262,17 @@ def _do_transfer(
     if total_fails:
         if src_index:
             src_index.clear()
+        if src_snapshot is not None:
+            src_snapshot.clear()
         raise FileTransferError(total_fails)
 
+    if dest_snapshot is not None:
+        dest_snapshot.add(
+            hash_info.value
+            for hash_info in obj_ids
+            if hash_info not in skipped_dir_ids
+        )
+
     # index successfully pushed dirs
     if dest_index:
         for dir_obj in succeeded_dir_objs:
@@ -166,10 +325,21 @@ def transfer(
 
     total = len(status.new)
     jobs = jobs or dest.fs.jobs
+    async_fs = _get_async_fs(src, dest, verify)
+    pack_tmp_dir = _get_pack_tmp_dir(src, dest)
     with Tqdm(total=total, unit="file", desc="Transferring") as pbar:
         with ThreadPoolExecutor(max_workers=jobs) as executor:
             wrapped_func = pbar.wrap_fn(_log_exceptions(func))
-            processor = partial(executor.imap_unordered, wrapped_func)
+            if async_fs is not None:
+                processor = _async_processor(
+                    src, dest, async_fs, jobs, pbar, wrapped_func
+                )
+            else:
+                processor = partial(executor.imap_unordered, wrapped_func)
+            if pack_tmp_dir:
+                processor = _pack_processor(
+                    src, dest, processor, pack_tmp_dir, pbar
+                )
             _do_transfer(
                 src, dest, status.new, status.missing, processor, **kwargs
             )
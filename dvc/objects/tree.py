@@ -34,7 +34,9 @@ class Tree(HashFile):
         self.__dict__.pop("trie", None)
         self._dict[key] = (meta, oid)
 
-    def digest(self, hash_info: Optional["HashInfo"] = None):
+    def digest(
+        self, hash_info: Optional["HashInfo"] = None, name: str = "md5"
+    ):
         from dvc.fs.memory import MemoryFileSystem
         from dvc.utils import tmp_fname
 
@@ -47,10 +49,19 @@ class Tree(HashFile):
         if hash_info:
             self.hash_info = hash_info
         else:
-            _, self.hash_info = get_file_hash(fs_path, memfs, "md5")
+            _, self.hash_info = get_file_hash(fs_path, memfs, name)
             assert self.hash_info.value
             self.hash_info.value += ".dir"
 
+    @property
+    def _hash_name(self) -> str:
+        """Content hash to digest trees derived from this one with."""
+        from dvc.hash_info import DEFAULT_HASH_NAME, HASH_NAMES
+
+        if self.hash_info and self.hash_info.name in HASH_NAMES:
+            return self.hash_info.name
+        return DEFAULT_HASH_NAME
+
     def __len__(self):
         return len(self._dict)
 
@@ -59,6 +70,16 @@ class Tree(HashFile):
             (key, value[0], value[1]) for key, value in self._dict.items()
         )
 
+    def iter_sorted(self):
+        """Iterate over entries in the order of their relpaths."""
+        yield from (
+            (key, value[0], value[1])
+            for key, value in sorted(
+                self._dict.items(),
+                key=lambda item: posixpath.sep.join(item[0]),
+            )
+        )
+
     def as_dict(self):
         return self._dict.copy()
 
@@ -136,6 +157,14 @@ class Tree(HashFile):
             pass
         return tree
 
+    def get_oid(self, key: Tuple[str]) -> Optional["HashInfo"]:
+        """Return hash info of the entry at the specified key in this tree.
+
+        Returns None if no entry exists at the specified key.
+        """
+        _, oid = self._dict.get(key) or (None, None)
+        return oid
+
     def get(self, odb, prefix: Tuple[str]) -> Optional[HashFile]:
         """Return object at the specified prefix in this tree.
 
@@ -152,15 +181,17 @@ class Tree(HashFile):
                 tree.add(key[depth:], meta, entry_oid)
         except KeyError:
             return None
-        tree.digest()
+        tree.digest(name=self._hash_name)
         return tree
 
 
 def du(odb, tree):
+    def _getsize(oid):
+        obj = odb.get(oid)
+        return obj.fs.getsize(obj.fs_path)
+
     try:
-        return sum(
-            odb.fs.getsize(odb.hash_to_path(oid.value)) for _, _, oid in tree
-        )
+        return sum(_getsize(oid) for _, _, oid in tree)
     except FileNotFoundError:
         return None
 
@@ -222,6 +253,6 @@ def merge(odb, ancestor_info, our_info, their_info):
     merged = Tree(None, None, None)
     for key, (meta, oid) in merged_dict.items():
         merged.add(key, meta, oid)
-    merged.digest()
+    merged.digest(name=our._hash_name)
 
     return merged
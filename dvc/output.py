@@ -19,9 +19,8 @@ from dvc.objects.checkout import checkout
 
 from .fs import get_cloud_fs
 from .fs.hdfs import HDFSFileSystem
-from .fs.local import LocalFileSystem
 from .fs.s3 import S3FileSystem
-from .hash_info import HashInfo
+from .hash_info import HASH_NAMES, HashInfo
 from .istextfile import istextfile
 from .objects import Tree
 from .objects.errors import ObjectFormatError
@@ -52,14 +51,14 @@ CASE_SENSITIVE_CHECKSUM_SCHEMA = Any(
 
 # NOTE: currently there are only 3 possible checksum names:
 #
-#    1) md5 (LOCAL, SSH);
+#    1) md5 (LOCAL, SSH), or sha256/blake3 if configured in `cache.hash`;
 #    2) etag (S3, GS, OSS, AZURE, HTTP);
 #    3) checksum (HDFS);
 #
 # so when a few types of outputs share the same name, we only need
 # specify it once.
 CHECKSUMS_SCHEMA = {
-    LocalFileSystem.PARAM_CHECKSUM: CHECKSUM_SCHEMA,
+    **{name: CHECKSUM_SCHEMA for name in HASH_NAMES},
     HDFSFileSystem.PARAM_CHECKSUM: CHECKSUM_SCHEMA,
     S3FileSystem.PARAM_CHECKSUM: CASE_SENSITIVE_CHECKSUM_SCHEMA,
 }
@@ -410,13 +409,28 @@ class Output:
             self.odb.hash_to_path(self.hash_info.value)
         )
 
+    def get_hash_name(self, odb, fs, saved=True):
+        """Name of the hash to compute for the output.
+
+        Content hashes can be computed for any file, so (unless `saved` is
+        False) the output keeps the hash it was saved with, instead of
+        looking modified after `cache.hash` changes. Otherwise, the hash
+        configured for the cache is used.
+        """
+        name = fs.PARAM_CHECKSUM
+        if name not in HASH_NAMES:
+            return name
+        if saved and self.hash_info.name in HASH_NAMES:
+            return self.hash_info.name
+        return odb.hash_name if odb else name
+
     def get_hash(self):
         if self.use_cache:
             odb = self.odb
-            name = self.odb.fs.PARAM_CHECKSUM
+            name = self.get_hash_name(odb, odb.fs)
         else:
             odb = self.repo.odb.local
-            name = self.fs.PARAM_CHECKSUM
+            name = self.get_hash_name(odb, self.fs)
         _, _, obj = ostage(
             odb,
             self.fs_path,
@@ -543,7 +557,7 @@ class Output:
                 self.repo.odb.local,
                 self.fs_path,
                 self.fs,
-                self.fs.PARAM_CHECKSUM,
+                self.get_hash_name(self.repo.odb.local, self.fs, saved=False),
                 dvcignore=self.dvcignore,
                 dry_run=True,
             )
@@ -560,7 +574,7 @@ class Output:
             self.odb,
             self.fs_path,
             self.fs,
-            self.odb.fs.PARAM_CHECKSUM,
+            self.get_hash_name(self.odb, self.odb.fs, saved=False),
             dvcignore=self.dvcignore,
         )
         self.hash_info = self.obj.hash_info
@@ -589,7 +603,7 @@ class Output:
                     self.odb,
                     filter_info or self.fs_path,
                     self.fs,
-                    self.odb.fs.PARAM_CHECKSUM,
+                    self.get_hash_name(self.odb, self.odb.fs),
                     dvcignore=self.dvcignore,
                 )
                 otransfer(
@@ -618,7 +632,7 @@ class Output:
             self.odb,
             self.fs_path,
             self.fs,
-            self.odb.fs.PARAM_CHECKSUM,
+            self.get_hash_name(self.odb, self.odb.fs),
             dvcignore=self.dvcignore,
         )
         save_obj = save_obj.filter(prefix)
@@ -705,12 +719,21 @@ class Output:
     def download(self, to, jobs=None):
         self.fs.download(self.fs_path, to.fs_path, jobs=jobs)
 
+    def _load_obj(self):
+        from dvc.objects.compact_tree import CompactTree
+
+        if self.hash_info.isdir:
+            # NOTE: objects from `get_obj` are only read (e.g. to check,
+            # diff or checkout them), so directories can be memory-mapped
+            return CompactTree.load(self.odb, self.hash_info)
+        return objects.load(self.odb, self.hash_info)
+
     def get_obj(self, filter_info=None, **kwargs):
         if self.obj:
             obj = self.obj
         elif self.hash_info:
             try:
-                obj = objects.load(self.odb, self.hash_info)
+                obj = self._load_obj()
             except FileNotFoundError:
                 return None
         else:
@@ -817,7 +840,7 @@ class Output:
             odb,
             from_info,
             from_fs,
-            "md5",
+            self.get_hash_name(self.odb, self.fs, saved=False),
             upload=upload,
             jobs=jobs,
             no_progress_bar=no_progress_bar,
@@ -993,6 +1016,7 @@ class Output:
 
         ignored = [
             self.fs.PARAM_CHECKSUM,
+            *HASH_NAMES,
             Meta.PARAM_SIZE,
             Meta.PARAM_NFILES,
         ]
@@ -165,11 +165,14 @@ class Repo:
         from dvc.fs.local import LocalFileSystem
         from dvc.lock import LockNoop, make_lock
         from dvc.objects.db import ODBManager
+        from dvc.repo.index_cache import IndexCache
         from dvc.repo.live import Live
         from dvc.repo.metrics import Metrics
         from dvc.repo.params import Params
+        from dvc.repo.parse_cache import ParseCache
         from dvc.repo.plots import Plots
         from dvc.repo.stage import StageLoad
+        from dvc.repo.used_cache import UsedCache
         from dvc.scm import SCM, Git
         from dvc.stage.cache import StageCache
         from dvc.state import State, StateNoop
@@ -204,6 +207,9 @@ class Repo:
             self.lock = LockNoop()
             self.state = StateNoop()
             self.odb = ODBManager(self)
+            self.index_cache = IndexCache(self)
+            self.parse_cache = ParseCache()
+            self.used_cache = UsedCache()
         else:
             self.lock = make_lock(
                 os.path.join(self.tmp_dir, "lock"),
@@ -213,10 +219,20 @@ class Repo:
             )
 
             state_db_dir = self._get_database_dir("state")
-            self.state = State(self.root_dir, state_db_dir, self.dvcignore)
+            self.state = State(
+                self.root_dir,
+                state_db_dir,
+                self.dvcignore,
+                trust_dir_mtime=self.config["state"].get(
+                    "trust_dir_mtime", False
+                ),
+            )
             self.odb = ODBManager(self)
 
             self.stage_cache = StageCache(self)
+            self.index_cache = IndexCache(self, self.tmp_dir)
+            self.parse_cache = ParseCache(self.tmp_dir)
+            self.used_cache = UsedCache(self.tmp_dir)
 
             self._ignore()
 
@@ -428,7 +444,7 @@ class Repo:
             all_commits=all_commits,
             all_experiments=all_experiments,
         ):
-            for odb, objs in self.index.used_objs(
+            for odb, objs in self._used_objs(
                 targets,
                 remote=remote,
                 force=force,
@@ -448,6 +464,49 @@ class Repo:
 
         return used
 
+    def _used_objs(self, targets=None, **kwargs):
+        """Return objects used by the index of the current revision.
+
+        For git revisions, results are looked up in `used_cache` by the
+        tree of the revision and by `Index.identifier`, see `UsedCache`.
+        """
+        from dvc.fs.git import GitFileSystem
+
+        if (
+            targets
+            or not self.used_cache.enabled
+            or not isinstance(self.fs, GitFileSystem)
+        ):
+            return self.index.used_objs(targets, **kwargs)
+
+        tree = self.fs.info(self.root_dir)["sha"]
+        identifier = self.used_cache.get_identifier(tree)
+        if identifier is None:
+            identifier = self.index.identifier
+            self.used_cache.set_identifier(tree, identifier)
+
+        used = self.used_cache.get_used(identifier)
+        if used is not None:
+            return {None: used} if used else {}
+
+        used = self.index.used_objs(**kwargs)
+        if self._is_used_complete(used):
+            self.used_cache.set_used(identifier, used.get(None, set()))
+        return used
+
+    def _is_used_complete(self, used) -> bool:
+        # NOTE: only cache results which don't depend on the state of the
+        # cache or on the config, i.e. which don't have outputs with
+        # missing dir cache, or pushed to/imported from other remotes.
+        if set(used) - {None}:
+            return False
+        objs = used.get(None, set())
+        return all(
+            out.hash_info in objs
+            for out in self.index.outs
+            if out.use_cache and out.hash_info
+        )
+
     @property
     def stages(self):  # obsolete, only for backward-compatibility
         return self.index.stages
@@ -519,6 +578,13 @@ class Repo:
     def close(self):
         self.scm.close()
         self.state.close()
+        self.parse_cache.close()
+        self.used_cache.close()
+        self.cloud.close()
+        if "stage_cache" in self.__dict__:
+            self.stage_cache.close()
+        if "experiments" in self.__dict__:
+            self.experiments.close()
 
     def _reset(self):
         self.state.close()
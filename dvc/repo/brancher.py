@@ -1,7 +1,52 @@
+import logging
 from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Tuple
 
 from funcy import group_by
 
+if TYPE_CHECKING:
+    from dvc.repo import Repo
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve_revs(
+    scm,
+    revs=None,
+    all_branches=False,
+    all_tags=False,
+    all_commits=False,
+    all_experiments=False,
+) -> Dict[str, List[str]]:
+    """Resolve revisions to their SHAs.
+
+    Returns a dict mapping each SHA to the names it was specified with,
+    in the order of the revisions.
+    """
+    from dvc.scm import resolve_rev
+
+    revs = revs.copy() if revs else []
+    if "workspace" in revs:
+        revs.remove("workspace")
+
+    if all_commits:
+        revs = scm.list_all_commits()
+    else:
+        if all_branches:
+            revs.extend(scm.list_branches())
+
+        if all_tags:
+            revs.extend(scm.list_tags())
+
+    if all_experiments:
+        from dvc.repo.experiments.utils import exp_commits
+
+        revs.extend(exp_commits(scm))
+
+    if not revs:
+        return {}
+    return group_by(partial(resolve_rev, scm), revs)
+
 
 def brancher(  # noqa: E302
     self,
@@ -34,38 +79,24 @@ def brancher(  # noqa: E302
     from dvc.fs.local import LocalFileSystem
 
     saved_fs = self.fs
-    revs = revs.copy() if revs else []
-
-    scm = self.scm
 
     self.fs = LocalFileSystem(url=self.root_dir)
     yield "workspace"
 
-    if revs and "workspace" in revs:
-        revs.remove("workspace")
-
-    if all_commits:
-        revs = scm.list_all_commits()
-    else:
-        if all_branches:
-            revs.extend(scm.list_branches())
-
-        if all_tags:
-            revs.extend(scm.list_tags())
-
-    if all_experiments:
-        from dvc.repo.experiments.utils import exp_commits
-
-        revs.extend(exp_commits(scm))
-
     try:
-        if revs:
+        resolved = _resolve_revs(
+            self.scm,
+            revs=revs,
+            all_branches=all_branches,
+            all_tags=all_tags,
+            all_commits=all_commits,
+            all_experiments=all_experiments,
+        )
+        if resolved:
             from dvc.fs.git import GitFileSystem
-            from dvc.scm import resolve_rev
 
-            rev_resolver = partial(resolve_rev, scm)
-            for sha, names in group_by(rev_resolver, revs).items():
-                self.fs = GitFileSystem(scm=scm, rev=sha)
+            for sha, names in resolved.items():
+                self.fs = GitFileSystem(scm=self.scm, rev=sha)
                 # ignore revs that don't contain repo root
                 # (i.e. revs from before a subdir=True repo was init'ed)
                 if self.fs.exists(self.root_dir):
@@ -75,3 +106,171 @@ def brancher(  # noqa: E302
                         yield ", ".join(names)
     finally:
         self.fs = saved_fs
+
+
+# NOTE: each worker process opens its own instance of the repo once and
+# reuses it for all of the tasks it runs.
+_worker_repo = None
+
+
+def _init_worker(root_dir: str):
+    from dvc.repo import Repo
+
+    global _worker_repo  # pylint: disable=global-statement
+    _worker_repo = Repo(root_dir)
+
+
+def _run_in_worker(func: Callable, args: tuple, kwargs: dict):
+    import pickle
+
+    result = func(_worker_repo, *args, **kwargs)
+    try:
+        # results can contain arbitrary exceptions collected by `onerror`,
+        # which are not guaranteed to survive pickling
+        pickle.loads(pickle.dumps(result))
+    except Exception:  # pylint: disable=broad-except
+        logger.debug("failed to pickle result of '%s'", func, exc_info=True)
+        return False, None
+    return True, result
+
+
+def _can_fork(repo: "Repo", func: Callable, kwargs: dict) -> bool:
+    import pickle
+
+    from dvc.scm import Git
+
+    # workers open the repo from its root dir, which wouldn't have the same
+    # config and filesystem as erepos, or repos opened at a revision.
+    # pylint: disable=protected-access
+    if repo.url or repo._fs_conf.get("repo_factory") or not repo.dvc_dir:
+        return False
+    if not isinstance(repo.scm, Git):
+        return False
+    try:
+        pickle.dumps((func, kwargs))
+    except Exception:  # pylint: disable=broad-except
+        return False
+    return True
+
+
+def parallel_map(
+    repo: "Repo",
+    func: Callable,
+    args_list: Sequence[tuple],
+    jobs: int = None,
+    **kwargs: Any,
+) -> List[Any]:
+    """Return `[func(repo, *args, **kwargs) for args in args_list]`.
+
+    With more than one job, calls are distributed between worker processes,
+    each with its own instance of the repo, so `func` and its arguments
+    must be picklable and `func` must not depend on the state of `repo`
+    in this process. Results which can't be pickled are computed again in
+    this process.
+    """
+    if (
+        not jobs
+        or jobs <= 1
+        or len(args_list) <= 1
+        or not _can_fork(repo, func, kwargs)
+    ):
+        return [func(repo, *args, **kwargs) for args in args_list]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = min(jobs, len(args_list))
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(repo.root_dir,)
+    ) as executor:
+        results = list(
+            executor.map(
+                partial(_run_in_worker, func, kwargs=kwargs),
+                args_list,
+                chunksize=max(1, len(args_list) // (4 * jobs)),
+            )
+        )
+
+    return [
+        result if ok else func(repo, *args, **kwargs)
+        for (ok, result), args in zip(results, args_list)
+    ]
+
+
+def _in_rev(
+    repo: "Repo", sha: str, name: str, rev_func: Callable, rev_kwargs: dict
+):
+    from dvc.fs.git import GitFileSystem
+
+    saved_fs = repo.fs
+    repo.fs = GitFileSystem(scm=repo.scm, rev=sha)
+    try:
+        # ignore revs that don't contain repo root
+        if not repo.fs.exists(repo.root_dir):
+            return False, None
+        return True, rev_func(repo, name, **rev_kwargs)
+    finally:
+        repo.fs = saved_fs
+
+
+def map_revs(
+    repo: "Repo",
+    func: Callable,
+    jobs: int = None,
+    revs=None,
+    all_branches=False,
+    all_tags=False,
+    all_commits=False,
+    all_experiments=False,
+    sha_only=False,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Call `func(repo, rev, **kwargs)` for every revision that `brancher`
+    iterates over.
+
+    Returns a dict mapping revision names to results, in the same order as
+    `brancher` would yield them. Git revisions are collected in parallel
+    with more than one job (see `parallel_map`).
+    """
+    if not jobs or jobs <= 1:
+        return {
+            rev: func(repo, rev, **kwargs)
+            for rev in repo.brancher(
+                revs=revs,
+                all_branches=all_branches,
+                all_tags=all_tags,
+                all_commits=all_commits,
+                all_experiments=all_experiments,
+                sha_only=sha_only,
+            )
+        }
+
+    if not any([revs, all_branches, all_tags, all_commits, all_experiments]):
+        return {"": func(repo, "", **kwargs)}
+
+    res = {}
+    for rev in repo.brancher(revs=["workspace"]):
+        res[rev] = func(repo, rev, **kwargs)
+
+    resolved: List[Tuple[str, str]] = [
+        (sha, sha if sha_only else ", ".join(names))
+        for sha, names in _resolve_revs(
+            repo.scm,
+            revs=revs,
+            all_branches=all_branches,
+            all_tags=all_tags,
+            all_commits=all_commits,
+            all_experiments=all_experiments,
+        ).items()
+    ]
+    results = parallel_map(
+        repo,
+        _in_rev,
+        resolved,
+        jobs=jobs,
+        rev_func=func,
+        rev_kwargs=kwargs,
+    )
+    for (_, name), (exists, result) in zip(resolved, results):
+        if exists:
+            res[name] = result
+    return res
@@ -142,7 +142,7 @@ def _output_paths(repo, targets):
                     repo.odb.local,
                     output.fs_path,
                     repo.odb.local.fs,
-                    "md5",
+                    output.get_hash_name(repo.odb.local, repo.odb.local.fs),
                     dry_run=True,
                     dvcignore=output.dvcignore,
                 )
@@ -116,6 +116,16 @@ class Experiments:
 
         return os.path.join(self.repo.tmp_dir, BaseExecutor.PACKED_ARGS_FILE)
 
+    @cached_property
+    def table_cache(self):
+        from .table_cache import ExpTableCache
+
+        return ExpTableCache(self.repo.tmp_dir)
+
+    def close(self):
+        if "table_cache" in self.__dict__:
+            self.table_cache.close()
+
     @cached_property
     def stash(self):
         from scmrepo.git import Stash
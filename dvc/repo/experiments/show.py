@@ -1,7 +1,7 @@
 import logging
 from collections import OrderedDict, defaultdict
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from dvc.exceptions import InvalidArgumentError
 from dvc.repo import locked
@@ -15,16 +15,55 @@ from dvc.utils import error_handler, onerror_collect
 logger = logging.getLogger(__name__)
 
 
-@error_handler
-def _collect_experiment_commit(
-    repo,
-    exp_rev,
-    stash=False,
-    sha_only=True,
-    param_deps=False,
-    running=None,
-    onerror: Optional[Callable] = None,
-):
+def _get_names(
+    repo, resolved: Optional[Dict[str, str]] = None
+) -> Dict[str, str]:
+    """Return the preferred names of revisions, see `get_exact_name()`.
+
+    Same as calling `scm.describe()` for each revision, but iterates over
+    the refs only once, instead of once per revision. `resolved` can map
+    refs to the revisions they point to, if they were already read.
+    """
+    from fnmatch import fnmatch
+
+    from dvc.repo.experiments.base import EXEC_NAMESPACE, EXPS_NAMESPACE
+
+    scm = repo.scm
+
+    def _describe(base, exclude=None):
+        refs: Dict[str, str] = {}
+        for ref in scm.iter_refs(base=base):
+            if exclude and fnmatch(ref, exclude):
+                continue
+            rev = resolved.get(ref) if resolved else None
+            if rev is None:
+                rev = scm.get_ref(ref, follow=False)
+            refs.setdefault(rev, ref)
+        return refs
+
+    names = {
+        rev: entry.name
+        for rev, entry in repo.experiments.stash_revs.items()
+        if entry.name
+    }
+    exps = _describe(EXPS_NAMESPACE, exclude=f"{EXEC_NAMESPACE}/*")
+    for rev, ref in exps.items():
+        name = ExpRefInfo.from_ref(ref).name
+        if name:
+            names[rev] = name
+
+    heads = _describe("refs/heads")
+    head = scm.get_ref("HEAD", follow=False)
+    if head and head.startswith("refs/heads"):
+        head_rev = scm.get_ref(head)
+        if head_rev:
+            heads[head_rev] = head
+    names.update(heads)
+    names.update(_describe("refs/tags"))
+    return {rev: name.rsplit("/")[-1] for rev, name in names.items()}
+
+
+def _collect_commit(repo, exp_rev, stash, param_deps, onerror):
     res: Dict[str, Optional[Any]] = defaultdict(dict)
     for rev in repo.brancher(revs=[exp_rev]):
         if rev == "workspace":
@@ -42,44 +81,74 @@ def _collect_experiment_commit(
             res["params"] = params
 
         res["queued"] = stash
-        if running is not None and exp_rev in running:
-            res["running"] = True
-            res["executor"] = running[exp_rev].get(ExecutorInfo.PARAM_LOCATION)
-        else:
-            res["running"] = False
-            res["executor"] = None
         if not stash:
             vals = _gather_metrics(
                 repo, targets=None, rev=rev, recursive=False, onerror=onerror
             )
             res["metrics"] = vals
+    return res
 
-        if not sha_only and rev != "workspace":
-            for refspec in ["refs/tags", "refs/heads"]:
-                name = repo.scm.describe(rev, base=refspec)
-                if name:
-                    break
-            if not name:
-                name = repo.experiments.get_exact_name(rev)
-            if name:
-                name = name.rsplit("/")[-1]
-                res["name"] = name
+
+@error_handler
+def _collect_experiment_commit(
+    repo,
+    exp_rev,
+    stash=False,
+    sha_only=True,
+    param_deps=False,
+    running=None,
+    onerror: Optional[Callable] = None,
+    names: Optional[Dict[str, str]] = None,
+):
+    from dvc.utils.collections import nested_contains
+
+    # NOTE: data collected from a commit never changes, except for queued
+    # experiments, whose metrics are not collected, and for errors.
+    cacheable = exp_rev != "workspace" and not stash
+    table_cache = repo.experiments.table_cache
+    res = table_cache.get_commit(exp_rev, param_deps) if cacheable else None
+    if res is None:
+        res = _collect_commit(repo, exp_rev, stash, param_deps, onerror)
+        if cacheable and res and not nested_contains(res, "error"):
+            table_cache.set_commit(exp_rev, param_deps, dict(res))
+    if not res:
+        return res
+
+    if running is not None and exp_rev in running:
+        res["running"] = True
+        res["executor"] = running[exp_rev].get(ExecutorInfo.PARAM_LOCATION)
+    else:
+        res["running"] = False
+        res["executor"] = None
+
+    if not sha_only and exp_rev != "workspace":
+        if names is None:
+            names = _get_names(repo)
+        name = names.get(exp_rev)
+        if name:
+            res["name"] = name
 
     return res
 
 
 def _collect_experiment_branch(
-    res, repo, branch, baseline, onerror: Optional[Callable] = None, **kwargs
+    res,
+    repo,
+    revs,
+    baseline,
+    onerror: Optional[Callable] = None,
+    collected: Optional[Dict[str, Dict]] = None,
+    **kwargs,
 ):
-    from dvc.scm import resolve_rev
-
-    exp_rev = resolve_rev(repo.scm, branch)
+    exp_rev = revs[0]
     prev = None
-    revs = list(repo.scm.branch_revs(exp_rev, baseline))
     for rev in revs:
-        collected_exp = _collect_experiment_commit(
-            repo, rev, onerror=onerror, **kwargs
-        )
+        if collected is not None and rev in collected:
+            collected_exp = collected[rev]
+        else:
+            collected_exp = _collect_experiment_commit(
+                repo, rev, onerror=onerror, **kwargs
+            )
         if len(revs) > 1:
             exp = {"checkpoint_tip": exp_rev}
             if prev:
@@ -101,6 +170,76 @@ def _collect_experiment_branch(
     return res
 
 
+def _collect_experiment_branches(res, repo, exp_refs, baseline, **kwargs):
+    for exp_ref, branch_revs in exp_refs:
+        ref_info = ExpRefInfo.from_ref(exp_ref)
+        assert ref_info.baseline_sha == baseline
+        _collect_experiment_branch(res, repo, branch_revs, baseline, **kwargs)
+    return res
+
+
+def _get_commit_revs(revs, exp_refs) -> List[str]:
+    """Return baselines and experiment commits, except for the workspace."""
+    exp_revs = [rev for rev in revs if rev != "workspace"]
+    for branches in exp_refs.values():
+        for _, branch_revs in branches:
+            exp_revs.extend(branch_revs)
+    return list(OrderedDict.fromkeys(exp_revs))
+
+
+def _collect_experiment_commits(repo, revs, exp_refs, jobs, **kwargs):
+    """Collect baselines and experiment commits in parallel."""
+    from dvc.repo.brancher import parallel_map
+
+    if not jobs or jobs <= 1:
+        return {}
+
+    # NOTE: the workspace is collected in this process, see `brancher`.
+    exp_revs = _get_commit_revs(revs, exp_refs)
+
+    results = parallel_map(
+        repo,
+        _collect_experiment_commit,
+        [(rev,) for rev in exp_revs],
+        jobs=jobs,
+        **kwargs,
+    )
+    return dict(zip(exp_revs, results))
+
+
+def _get_exp_branches(
+    repo, baseline: str, exp_tips: Dict[str, str]
+) -> List[Tuple[str, List[str]]]:
+    """Return experiment refs of `baseline` along with their commits.
+
+    Refs are sorted from the most recent one, and their tips are added
+    to `exp_tips`.
+    """
+    # NOTE: experiment branches are looked up by the SHAs of their tips in
+    # the table cache, so only the refs which were updated since the last
+    # call need to be walked.
+    table_cache = repo.experiments.table_cache
+    ref_info = ExpRefInfo(baseline_sha=baseline)
+    cached = table_cache.get_branches(baseline)
+    branches = []
+    for ref in repo.scm.iter_refs(base=str(ref_info)):
+        tip = repo.scm.get_ref(ref, follow=False)
+        exp_tips[ref] = tip
+        if tip not in cached:
+            commit_time = repo.scm.resolve_commit(tip).commit_time
+            branch_revs = list(repo.scm.branch_revs(tip, baseline))
+            table_cache.set_branch(tip, baseline, commit_time, branch_revs)
+            cached[tip] = (commit_time, branch_revs)
+        commit_time, branch_revs = cached[tip]
+        branches.append((commit_time, ref, branch_revs))
+    return [
+        (exp_ref, branch_revs)
+        for _, exp_ref, branch_revs in sorted(
+            branches, key=lambda x: x[0], reverse=True
+        )
+    ]
+
+
 @locked
 def show(
     repo,
@@ -112,6 +251,7 @@ def show(
     num=1,
     param_deps=False,
     onerror: Optional[Callable] = None,
+    jobs: Optional[int] = None,
 ):
     if onerror is None:
         onerror = onerror_collect
@@ -146,39 +286,58 @@ def show(
 
     running = repo.experiments.get_running_exps()
 
+    exp_refs: Dict[str, List[Tuple[str, List[str]]]] = {}
+    exp_tips: Dict[str, str] = {}
     for rev in revs:
-        res[rev]["baseline"] = _collect_experiment_commit(
-            repo,
-            rev,
-            sha_only=sha_only,
-            param_deps=param_deps,
-            running=running,
-            onerror=onerror,
-        )
+        if rev != "workspace":
+            exp_refs[rev] = _get_exp_branches(repo, rev, exp_tips)
 
-        if rev == "workspace":
-            continue
+    names = None if sha_only else _get_names(repo, exp_tips)
+    repo.experiments.table_cache.prefetch_commits(
+        _get_commit_revs(revs, exp_refs), param_deps
+    )
 
-        ref_info = ExpRefInfo(baseline_sha=rev)
-        commits = [
-            (ref, repo.scm.resolve_commit(ref))
-            for ref in repo.scm.iter_refs(base=str(ref_info))
-        ]
-        for exp_ref, _ in sorted(
-            commits, key=lambda x: x[1].commit_time, reverse=True
-        ):
-            ref_info = ExpRefInfo.from_ref(exp_ref)
-            assert ref_info.baseline_sha == rev
-            _collect_experiment_branch(
-                res[rev],
+    collected = _collect_experiment_commits(
+        repo,
+        revs,
+        exp_refs,
+        jobs,
+        sha_only=sha_only,
+        param_deps=param_deps,
+        running=running,
+        onerror=onerror,
+        names=names,
+    )
+
+    for rev in revs:
+        if rev in collected:
+            res[rev]["baseline"] = collected[rev]
+        else:
+            res[rev]["baseline"] = _collect_experiment_commit(
                 repo,
-                exp_ref,
                 rev,
                 sha_only=sha_only,
                 param_deps=param_deps,
                 running=running,
                 onerror=onerror,
+                names=names,
             )
+
+        if rev == "workspace":
+            continue
+
+        _collect_experiment_branches(
+            res[rev],
+            repo,
+            exp_refs[rev],
+            rev,
+            collected=collected,
+            sha_only=sha_only,
+            param_deps=param_deps,
+            running=running,
+            onerror=onerror,
+            names=names,
+        )
         # collect queued (not yet reproduced) experiments
         for stash_rev, entry in repo.experiments.stash_revs.items():
             if entry.baseline_rev in revs:
@@ -193,6 +352,7 @@ def show(
                         param_deps=param_deps,
                         running=running,
                         onerror=onerror,
+                        names=names,
                     )
                     res[entry.baseline_rev][stash_rev] = experiment
     return res
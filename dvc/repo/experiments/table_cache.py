@@ -0,0 +1,194 @@
+"""Persistent cache of the experiments table.
+
+Git commits are immutable, so everything `exp show` collects for a commit
+(its params and metrics), as well as the revisions of an experiment
+branch (which are defined by its tip and its baseline), can be reused
+across invocations. Entries are kept in a sqlite database in `.dvc/tmp`,
+so that only the experiments whose tips have changed since the last
+invocation need to be collected again.
+"""
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ExpTableCache:
+    DB_FILE = "exps_table.db"
+    # NOTE: bump if the format of any of the cached data changes
+    VERSION = 1
+    MAX_ENTRIES = 100_000
+    # NOTE: sqlite limits the number of variables in a query
+    CHUNK_SIZE = 500
+
+    def __init__(self, tmp_dir: Optional[str] = None):
+        self.path = os.path.join(tmp_dir, self.DB_FILE) if tmp_dir else None
+        self._lock = threading.Lock()
+        self._conn = None
+        self._prefetched: Dict[Tuple[str, bool], bytes] = {}
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            import sqlite3
+
+            conn = sqlite3.connect(
+                self.path, timeout=60, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            with conn:
+                if version != self.VERSION:
+                    conn.execute("DROP TABLE IF EXISTS commits")
+                    conn.execute("DROP TABLE IF EXISTS branches")
+                    conn.execute(f"PRAGMA user_version = {self.VERSION}")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS commits "
+                    "(rev TEXT NOT NULL, param_deps INTEGER NOT NULL, "
+                    "timestamp REAL NOT NULL, data BLOB NOT NULL, "
+                    "PRIMARY KEY (rev, param_deps)) WITHOUT ROWID"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS branches "
+                    "(baseline TEXT NOT NULL, tip TEXT NOT NULL, "
+                    "timestamp REAL NOT NULL, commit_time INTEGER NOT NULL, "
+                    "revs TEXT NOT NULL, "
+                    "PRIMARY KEY (baseline, tip)) WITHOUT ROWID"
+                )
+            self._conn = conn
+            self._prune()
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _prune(self):
+        for table in ("commits", "branches"):
+            (count,) = self._conn.execute(
+                f"SELECT COUNT(*) FROM {table}"
+            ).fetchone()
+            if count <= self.MAX_ENTRIES:
+                continue
+
+            with self._conn:
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE timestamp <= ("
+                    f"SELECT timestamp FROM {table} ORDER BY timestamp "
+                    "LIMIT 1 OFFSET ?)",
+                    (count - self.MAX_ENTRIES,),
+                )
+
+    def _query(self, sql: str, args: tuple) -> Optional[tuple]:
+        import sqlite3
+
+        if not self.path:
+            return None
+        try:
+            with self._lock:
+                return self.conn.execute(sql, args).fetchone()
+        except sqlite3.Error:
+            logger.debug("failed to query '%s'", self.path, exc_info=True)
+            return None
+
+    def _insert(self, sql: str, args: tuple):
+        import sqlite3
+
+        if not self.path:
+            return
+        try:
+            with self._lock, self.conn:
+                self.conn.execute(sql, args)
+        except sqlite3.Error:
+            logger.debug("failed to update '%s'", self.path, exc_info=True)
+
+    def prefetch_commits(self, revs: Iterable[str], param_deps: bool):
+        """Load cached data for multiple commits at once."""
+        import sqlite3
+
+        if not self.path:
+            return
+        revs = list(revs)
+        try:
+            with self._lock:
+                for i in range(0, len(revs), self.CHUNK_SIZE):
+                    chunk = revs[i : i + self.CHUNK_SIZE]
+                    placeholders = ", ".join("?" * len(chunk))
+                    rows = self.conn.execute(
+                        "SELECT rev, data FROM commits "
+                        f"WHERE param_deps = ? AND rev IN ({placeholders})",
+                        (int(param_deps), *chunk),
+                    )
+                    for rev, data in rows:
+                        self._prefetched[(rev, bool(param_deps))] = data
+        except sqlite3.Error:
+            logger.debug("failed to query '%s'", self.path, exc_info=True)
+
+    def get_commit(self, rev: str, param_deps: bool) -> Optional[Dict]:
+        """Return the data collected for the commit, if it is cached."""
+        data = self._prefetched.pop((rev, bool(param_deps)), None)
+        if data is None:
+            row = self._query(
+                "SELECT data FROM commits WHERE rev = ? AND param_deps = ?",
+                (rev, int(param_deps)),
+            )
+            if not row:
+                return None
+            data = row[0]
+        # NOTE: stored pickled, so that every load returns a new copy
+        # that callers are free to modify
+        return pickle.loads(data)
+
+    def set_commit(self, rev: str, param_deps: bool, data: Dict[str, Any]):
+        try:
+            blob = pickle.dumps(data, protocol=4)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.debug("failed to pickle data for '%s'", rev, exc_info=True)
+            return
+        self._insert(
+            "INSERT OR REPLACE INTO commits "
+            "(rev, param_deps, timestamp, data) VALUES (?, ?, ?, ?)",
+            (rev, int(param_deps), time.time(), blob),
+        )
+
+    def get_branches(self, baseline: str) -> Dict[str, Tuple[int, List[str]]]:
+        """Return cached experiment branches based on `baseline`.
+
+        Maps the tip of each branch to its commit time and to the list of
+        revisions from the tip to the baseline (see `Git.branch_revs()`).
+        """
+        import sqlite3
+
+        if not self.path:
+            return {}
+        try:
+            with self._lock:
+                rows = self.conn.execute(
+                    "SELECT tip, commit_time, revs FROM branches "
+                    "WHERE baseline = ?",
+                    (baseline,),
+                ).fetchall()
+        except sqlite3.Error:
+            logger.debug("failed to query '%s'", self.path, exc_info=True)
+            return {}
+        return {
+            tip: (commit_time, json.loads(revs))
+            for tip, commit_time, revs in rows
+        }
+
+    def set_branch(
+        self, tip: str, baseline: str, commit_time: int, revs: List[str]
+    ):
+        self._insert(
+            "INSERT OR REPLACE INTO branches "
+            "(tip, baseline, timestamp, commit_time, revs) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (tip, baseline, time.time(), commit_time, json.dumps(revs)),
+        )
@@ -15,6 +15,15 @@ def _raise_error_if_all_disabled(**kwargs):
         )
 
 
+def _log_dry_run(result, name):
+    from dvc.progress import Tqdm
+
+    size = Tqdm.format_sizeof(result.size, "B", 1024)
+    logger.info(
+        f"Would remove {result.count} unused objects ({size}) from {name}."
+    )
+
+
 @locked
 def gc(
     self,
@@ -29,6 +38,7 @@ def gc(
     jobs=None,
     repos=None,
     workspace=False,
+    dry_run=False,
 ):
 
     # require `workspace` to be true to come into effect.
@@ -44,14 +54,15 @@ def gc(
 
     from contextlib import ExitStack
 
-    from dvc.objects.db import get_index
+    from dvc.objects.db import get_index, get_snapshot
+    from dvc.objects.gc import UsedHashes
     from dvc.repo import Repo
 
     if not repos:
         repos = []
     all_repos = [Repo(path) for path in repos]
 
-    used_obj_ids = set()
+    used_obj_ids = UsedHashes()
     with ExitStack() as stack:
         for repo in all_repos:
             stack.enter_context(repo.lock)
@@ -73,16 +84,24 @@ def gc(
         if not odb:
             continue
 
-        removed = odb.gc(used_obj_ids, jobs=jobs)
+        removed = odb.gc(used_obj_ids, jobs=jobs, dry_run=dry_run)
         if not removed:
             logger.info(f"No unused '{scheme}' cache to remove.")
+        elif dry_run:
+            _log_dry_run(removed, f"'{scheme}' cache")
 
     if not cloud:
         return
 
     odb = self.cloud.get_remote_odb(remote, "gc -c")
-    removed = odb.gc(used_obj_ids)
-    if removed:
+    removed = odb.gc(used_obj_ids, dry_run=dry_run)
+    if removed and dry_run:
+        _log_dry_run(removed, "remote")
+    elif removed:
         get_index(odb).clear()
+        snapshot = get_snapshot(odb)
+        if snapshot is not None:
+            snapshot.clear()
+            snapshot.close()
     else:
         logger.info("No unused cache to remove from remote.")
@@ -0,0 +1,226 @@
+"""Persistent cache of the data used to build the workspace `Index`.
+
+Collecting stages requires walking the whole workspace to find dvcfiles
+and parsing and validating each of them, which is slow for big repos. The
+results are kept in `.dvc/tmp` between runs:
+
+* parsed contents of dvcfiles and lockfiles, keyed by their stat
+  (inode, mtime, size) with a fallback to the md5 of their contents, so
+  that only changed files are parsed again;
+* the list of dvcfiles found during the last walk, which is reused as
+  long as none of the walked directories, dvcignore/gitignore files and
+  dvcfiles (which define outputs that are not walked into) have changed.
+
+Only the workspace is cached, git revisions are always collected from
+scratch.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from dvc.repo import Repo
+
+logger = logging.getLogger(__name__)
+
+# (inode, mtime, size)
+Stat = Tuple[int, int, int]
+
+IGNORE_FILES = (".dvcignore", ".gitignore")
+
+# NOTE: filesystems update mtimes with a coarse granularity, so a file
+# modified shortly after it was cached could keep the same stat. Like git's
+# "racy" index entries, stats that are too close to the time they were
+# recorded are not trusted.
+RACY_WINDOW_NS = 2 * 10 ** 9
+
+
+def _stat(path: str) -> Optional[Stat]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _is_racy(stat: Optional[Stat], time_ns: int) -> bool:
+    return stat is not None and stat[1] >= time_ns - RACY_WINDOW_NS
+
+
+def _md5(text: str) -> str:
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+class IndexCache:
+    INDEX_FILE = "index.pickle"
+    VERSION = 1
+
+    def __init__(self, repo: "Repo", tmp_dir: Optional[str] = None):
+        self.repo = repo
+        self.path = os.path.join(tmp_dir, self.INDEX_FILE) if tmp_dir else None
+        self._lock = threading.RLock()
+        self._files: Optional[Dict[str, Dict[str, Any]]] = None
+        self._walk: Optional[Dict[str, Any]] = None
+        self._used: set = set()
+        self._dirty = False
+
+    @property
+    def enabled(self) -> bool:
+        from dvc.fs.local import LocalFileSystem
+
+        return bool(self.path) and isinstance(self.repo.fs, LocalFileSystem)
+
+    def _relpath(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.repo.root_dir)
+
+    def _abspath(self, relpath: str) -> str:
+        return os.path.join(self.repo.root_dir, relpath)
+
+    def _load(self):
+        if self._files is not None:
+            return
+
+        self._files, self._walk = {}, None
+        try:
+            with open(self.path, "rb") as fobj:
+                data = pickle.load(fobj)
+            if data.get("version") == self.VERSION:
+                self._files = data["files"]
+                self._walk = data["walk"]
+        except FileNotFoundError:
+            pass
+        except Exception:  # pylint: disable=broad-except
+            logger.debug("ignoring corrupted '%s'", self.path, exc_info=True)
+
+    def flush(self):
+        """Persist the cache, dropping entries for the files that were not
+        used since it was loaded."""
+        from dvc.utils import tmp_fname
+
+        with self._lock:
+            if not self._dirty or self._files is None:
+                return
+
+            files = {
+                relpath: entry
+                for relpath, entry in self._files.items()
+                if relpath in self._used
+            }
+            data = {
+                "version": self.VERSION,
+                "files": files,
+                "walk": self._walk,
+            }
+            tmp_path = tmp_fname(self.path)
+            try:
+                with open(tmp_path, "wb") as fobj:
+                    pickle.dump(data, fobj, protocol=4)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                logger.debug("failed to save '%s'", self.path, exc_info=True)
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                return
+            self._files = files
+            self._dirty = False
+
+    def load_yaml(
+        self, path: str, loader: Callable[[], Tuple[Any, str]]
+    ) -> Tuple[Any, str]:
+        """Return the parsed contents of a dvcfile or a lockfile.
+
+        `loader` is called to parse and validate the file if it is not in
+        the cache or has been modified.
+        """
+        if not self.enabled:
+            return loader()
+
+        relpath = self._relpath(path)
+        stat = _stat(path)
+        with self._lock:
+            self._load()
+            assert self._files is not None
+            self._used.add(relpath)
+            entry = self._files.get(relpath)
+
+        if (
+            entry
+            and stat
+            and entry["stat"] == stat
+            and not _is_racy(stat, entry["time"])
+        ):
+            return pickle.loads(entry["data"]), entry["text"]
+
+        if entry and stat:
+            # the file might have been touched without being modified
+            try:
+                with open(path, encoding="utf-8") as fobj:
+                    text = fobj.read()
+            except (OSError, UnicodeDecodeError):
+                text = None
+            if text is not None and _md5(text) == entry["md5"]:
+                with self._lock:
+                    entry["stat"] = stat
+                    entry["time"] = time.time_ns()
+                    self._dirty = True
+                return pickle.loads(entry["data"]), text
+
+        data, text = loader()
+        if stat and stat == _stat(path):
+            with self._lock:
+                self._files[relpath] = {
+                    "stat": stat,
+                    "time": time.time_ns(),
+                    "md5": _md5(text),
+                    # NOTE: stored pickled, so that every load returns
+                    # a new copy that callers are free to modify
+                    "data": pickle.dumps(data, protocol=4),
+                    "text": text,
+                }
+                self._dirty = True
+        return data, text
+
+    def get_dvcfiles(self) -> Optional[List[str]]:
+        """Return dvcfiles found during the last walk of the workspace, or
+        None if the workspace may have changed since then."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._load()
+            walk = self._walk
+        if not walk:
+            return None
+
+        for relpath, stat in walk["stats"].items():
+            if _is_racy(stat, walk["time"]) or (
+                _stat(self._abspath(relpath)) != stat
+            ):
+                logger.trace(  # type: ignore[attr-defined]
+                    "'%s' has changed, walking the workspace", relpath
+                )
+                return None
+        return [self._abspath(relpath) for relpath in walk["dvcfiles"]]
+
+    def save_dvcfiles(self, dirs: List[str], dvcfiles: List[str]):
+        """Save the dvcfiles found while walking `dirs` in the workspace."""
+        if not self.enabled:
+            return
+
+        paths = list(dirs) + list(dvcfiles)
+        paths.extend(
+            os.path.join(root, name) for root in dirs for name in IGNORE_FILES
+        )
+        stats = {self._relpath(path): _stat(path) for path in paths}
+        with self._lock:
+            self._load()
+            self._walk = {
+                "time": time.time_ns(),
+                "stats": stats,
+                "dvcfiles": [self._relpath(path) for path in dvcfiles],
+            }
+            self._dirty = True
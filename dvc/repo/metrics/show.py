@@ -1,5 +1,6 @@
 import logging
 import os
+from functools import partial
 from typing import List
 
 from dvc.fs.repo import RepoFileSystem
@@ -66,13 +67,19 @@ def _extract_metrics(metrics, path, rev):
     return ret
 
 
-@error_handler
-def _read_metric(path, fs, rev, **kwargs):
+def _load_metric(path, fs, rev):
     val = load_yaml(path, fs=fs)
     val = _extract_metrics(val, path, rev)
     return val or {}
 
 
+@error_handler
+def _read_metric(repo, path, fs, rev, **kwargs):
+    return repo.parse_cache.load(
+        fs, path, "metric", partial(_load_metric, path, fs, rev)
+    )
+
+
 def _read_metrics(repo, metrics, rev, onerror=None):
     fs = RepoFileSystem(repo)
 
@@ -82,7 +89,7 @@ def _read_metrics(repo, metrics, rev, onerror=None):
             continue
 
         res[fs.path.relpath(metric, os.getcwd())] = _read_metric(
-            metric, fs, rev, onerror=onerror
+            repo, metric, fs, rev, onerror=onerror
         )
 
     return res
@@ -93,6 +100,12 @@ def _gather_metrics(repo, targets, rev, recursive, onerror=None):
     return _read_metrics(repo, metrics, rev, onerror=onerror)
 
 
+def _gather_rev_metrics(repo, rev, targets, recursive, onerror=None):
+    return error_handler(_gather_metrics)(
+        repo, targets, rev, recursive, onerror=onerror
+    )
+
+
 @locked
 def show(
     repo,
@@ -103,20 +116,25 @@ def show(
     revs=None,
     all_commits=False,
     onerror=None,
+    jobs=None,
 ):
+    from dvc.repo.brancher import map_revs
+
     if onerror is None:
         onerror = onerror_collect
 
-    res = {}
-    for rev in repo.brancher(
+    res = map_revs(
+        repo,
+        _gather_rev_metrics,
+        jobs=jobs,
         revs=revs,
         all_branches=all_branches,
         all_tags=all_tags,
         all_commits=all_commits,
-    ):
-        res[rev] = error_handler(_gather_metrics)(
-            repo, targets, rev, recursive, onerror=onerror
-        )
+        targets=targets,
+        recursive=recursive,
+        onerror=onerror,
+    )
 
     # Hide workspace metrics if they are the same as in the active branch
     try:
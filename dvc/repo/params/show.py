@@ -2,6 +2,7 @@ import logging
 import os
 from collections import defaultdict
 from copy import copy
+from functools import partial
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 from dvc.dependency.param import ParamsDependency
@@ -48,10 +49,12 @@ def _collect_configs(
 
 
 @error_handler
-def _read_fs_path(fs, fs_path, **kwargs):
+def _read_fs_path(repo, fs, fs_path, **kwargs):
     suffix = fs.path.suffix(fs_path).lower()
     loader = LOADERS[suffix]
-    return loader(fs_path, fs=fs)
+    return repo.parse_cache.load(
+        fs, fs_path, f"params{suffix}", partial(loader, fs_path, fs=fs)
+    )
 
 
 def _read_params(
@@ -75,7 +78,7 @@ def _read_params(
         fs_paths += [param.fs_path for param in params]
 
     for fs_path in fs_paths:
-        from_path = _read_fs_path(repo.fs, fs_path, onerror=onerror)
+        from_path = _read_fs_path(repo, repo.fs, fs_path, onerror=onerror)
         if from_path:
             res[repo.fs.path.relpath(fs_path, os.getcwd())] = from_path
 
@@ -98,17 +101,20 @@ def _collect_vars(repo, params) -> Dict:
 
 @locked
 def show(repo, revs=None, targets=None, deps=False, onerror: Callable = None):
+    from dvc.repo.brancher import map_revs
+
     if onerror is None:
         onerror = onerror_collect
-    res = {}
-
-    for branch in repo.brancher(revs=revs):
-        params = error_handler(_gather_params)(
-            repo=repo, rev=branch, targets=targets, deps=deps, onerror=onerror
-        )
 
-        if params:
-            res[branch] = params
+    res = map_revs(
+        repo,
+        _gather_rev_params,
+        revs=revs,
+        targets=targets,
+        deps=deps,
+        onerror=onerror,
+    )
+    res = {branch: params for branch, params in res.items() if params}
 
     # Hide workspace params if they are the same as in the active branch
     try:
@@ -147,3 +153,9 @@ def _gather_params(repo, rev, targets=None, deps=False, onerror=None):
     for key, vals in vars_params.items():
         params[key]["data"] = vals
     return params
+
+
+def _gather_rev_params(repo, rev, targets=None, deps=False, onerror=None):
+    return error_handler(_gather_params)(
+        repo=repo, rev=rev, targets=targets, deps=deps, onerror=onerror
+    )
@@ -0,0 +1,147 @@
+"""Persistent cache of parsed files from git revisions and DVC outputs.
+
+Commands that iterate over revisions (`metrics show`, `params show`,
+`plots diff`, `exp show`) parse the same dvcfiles, metrics, params and
+plots files for every revision, even though most of them are identical
+between commits. Parsed data is kept in a sqlite database in `.dvc/tmp`,
+keyed by the id of the contents of the file:
+
+* git blob id for files read from a git revision;
+* hash of the output for files read from the DVC cache.
+
+Files read from the workspace don't have such ids and are always parsed.
+"""
+import logging
+import os
+import pickle
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from dvc.hash_info import HASH_NAMES
+
+if TYPE_CHECKING:
+    from dvc.fs.base import FileSystem
+
+logger = logging.getLogger(__name__)
+
+
+def _get_oid(fs: "FileSystem", path: str) -> Optional[str]:
+    try:
+        info = fs.info(path)
+    except (OSError, ValueError):
+        return None
+
+    if info.get("type") != "file":
+        return None
+    # NOTE: `sha` is only set for git blobs and content hashes are only
+    # set for outputs read from the cache, see `RepoFileSystem.info()`.
+    if info.get("sha"):
+        return "git:{}".format(info["sha"])
+    for name in HASH_NAMES:
+        if info.get(name):
+            return "{}:{}".format(name, info[name])
+    return None
+
+
+class ParseCache:
+    DB_FILE = "parse.db"
+    # NOTE: bump if the format of any of the cached data changes
+    VERSION = 1
+    MAX_ENTRIES = 100_000
+
+    def __init__(self, tmp_dir: Optional[str] = None):
+        self.path = os.path.join(tmp_dir, self.DB_FILE) if tmp_dir else None
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            import sqlite3
+
+            conn = sqlite3.connect(
+                self.path, timeout=60, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            with conn:
+                if version != self.VERSION:
+                    conn.execute("DROP TABLE IF EXISTS entries")
+                    conn.execute(f"PRAGMA user_version = {self.VERSION}")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS entries "
+                    "(oid TEXT NOT NULL, kind TEXT NOT NULL, "
+                    "timestamp REAL NOT NULL, data BLOB NOT NULL, "
+                    "PRIMARY KEY (oid, kind)) WITHOUT ROWID"
+                )
+            self._conn = conn
+            self._prune()
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _prune(self):
+        (count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM entries"
+        ).fetchone()
+        if count <= self.MAX_ENTRIES:
+            return
+
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM entries WHERE timestamp <= ("
+                "SELECT timestamp FROM entries ORDER BY timestamp "
+                "LIMIT 1 OFFSET ?)",
+                (count - self.MAX_ENTRIES,),
+            )
+
+    def load(
+        self,
+        fs: "FileSystem",
+        path: str,
+        kind: str,
+        loader: Callable[[], Any],
+    ) -> Any:
+        """Return the data parsed from a file.
+
+        `loader` is called to parse the file if it is not in the cache.
+        `kind` identifies the parser, as the same contents could be
+        parsed differently depending on the file (e.g. its extension).
+        """
+        import sqlite3
+        import time
+
+        oid = _get_oid(fs, path) if self.path else None
+        if oid is None:
+            return loader()
+
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    "SELECT data FROM entries WHERE oid = ? AND kind = ?",
+                    (oid, kind),
+                ).fetchone()
+        except sqlite3.Error:
+            logger.debug("failed to query '%s'", self.path, exc_info=True)
+            return loader()
+
+        if row:
+            # NOTE: stored pickled, so that every load returns a new copy
+            # that callers are free to modify
+            return pickle.loads(row[0])
+
+        data = loader()
+        try:
+            with self._lock, self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(oid, kind, timestamp, data) VALUES (?, ?, ?, ?)",
+                    (oid, kind, time.time(), pickle.dumps(data, protocol=4)),
+                )
+        except (sqlite3.Error, pickle.PicklingError, TypeError):
+            logger.debug("failed to save '%s'", path, exc_info=True)
+        return data
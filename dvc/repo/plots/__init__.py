@@ -125,6 +125,7 @@ class Plots:
                             path,
                             props=joined_props,
                             onerror=onerror,
+                            parse_cache=self.repo.parse_cache,
                         )
                     }
                 )
@@ -137,22 +138,23 @@ class Plots:
         props=None,
         recursive=False,
         onerror=None,
+        jobs=None,
     ):
         if onerror is None:
             onerror = onerror_collect
 
         result: Dict[str, Dict] = {}
-        for data in self.collect(
-            targets, revs, recursive, onerror=onerror, props=props
-        ):
-            assert len(data) == 1
-            revision_data = first(data.values())
-            if "data" in revision_data:
-                for path_data in revision_data["data"].values():
-                    result_source = path_data.pop("data_source", None)
-                    if result_source:
-                        path_data.update(result_source())
-            result.update(data)
+        if jobs and jobs > 1:
+            result = self._show_revisions(
+                targets, revs, recursive, onerror, props, jobs
+            )
+        else:
+            for data in self.collect(
+                targets, revs, recursive, onerror=onerror, props=props
+            ):
+                assert len(data) == 1
+                _load_data_sources(first(data.values()))
+                result.update(data)
 
         errored = errored_revisions(result)
         if errored:
@@ -165,6 +167,27 @@ class Plots:
 
         return result
 
+    def _show_revisions(self, targets, revs, recursive, onerror, props, jobs):
+        from dvc.repo.brancher import map_revs
+        from dvc.utils.collections import ensure_list
+
+        result = map_revs(
+            self.repo,
+            _show_revision,
+            jobs=jobs,
+            revs=revs,
+            targets=ensure_list(targets),
+            recursive=recursive,
+            onerror=onerror,
+            props=props,
+        )
+        # .brancher() adds unwanted workspace
+        return {
+            rev or "workspace": data
+            for rev, data in result.items()
+            if revs is None or rev in revs
+        }
+
     def diff(self, *args, **kwargs):
         from .diff import diff
 
@@ -243,9 +266,44 @@ def _collect_plots(
     return result
 
 
+def _load_data_sources(revision_data):
+    if "data" in revision_data:
+        for path_data in revision_data["data"].values():
+            result_source = path_data.pop("data_source", None)
+            if result_source:
+                path_data.update(result_source())
+
+
+def _show_revision(repo, rev, targets, recursive, onerror, props):
+    # pylint: disable=protected-access
+    data = repo.plots._collect_from_revision(
+        revision=rev or "workspace",
+        targets=targets,
+        recursive=recursive,
+        onerror=onerror,
+        props=props,
+    )
+    _load_data_sources(data)
+    return data
+
+
+_IMAGE_EXTENSIONS = (".jpeg", ".jpg", ".gif", ".png")
+
+
 @error_handler
-def parse(fs, path, props=None, **kwargs):
+def parse(fs, path, props=None, parse_cache=None, **kwargs):
     props = props or {}
+    _, extension = os.path.splitext(path)
+    if parse_cache is None or extension in _IMAGE_EXTENSIONS:
+        return _parse(fs, path, props)
+
+    kind = f"plot{extension}"
+    if extension in (".tsv", ".csv") and not props.get("header", True):
+        kind += ":noheader"
+    return parse_cache.load(fs, path, kind, partial(_parse, fs, path, props))
+
+
+def _parse(fs, path, props):
     _, extension = os.path.splitext(path)
     if extension in (".tsv", ".csv"):
         header = props.get("header", True)
@@ -254,7 +312,7 @@ def parse(fs, path, props=None, **kwargs):
         return _load_sv(path=path, fs=fs, delimiter="\t", header=header)
     if extension in LOADERS or extension in (".yml", ".yaml"):
         return LOADERS[extension](path=path, fs=fs)
-    if extension in (".jpeg", ".jpg", ".gif", ".png"):
+    if extension in _IMAGE_EXTENSIONS:
         with fs.open(path, "rb") as fd:
             return fd.read()
     raise PlotMetricTypeError(path)
@@ -24,9 +24,10 @@ def push(
     revs=None,
     glob=False,
     odb: Optional["ObjectDB"] = None,
+    refresh_remote_index=False,
 ):
     used_run_cache = (
-        self.stage_cache.push(remote, odb=odb) if run_cache else []
+        self.stage_cache.push(remote, odb=odb, jobs=jobs) if run_cache else []
     )
 
     if isinstance(targets, str):
@@ -49,13 +50,22 @@ def push(
     )
 
     pushed = len(used_run_cache)
+    # NOTE: several groups of objects might be pushed to the same remote,
+    # which only needs to be re-listed once
+    refreshed = set()
     for dest_odb, obj_ids in used.items():
         if dest_odb and dest_odb.read_only:
             continue
+        target = odb or dest_odb
         try:
             pushed += self.cloud.push(
-                obj_ids, jobs, remote=remote, odb=odb or dest_odb
+                obj_ids,
+                jobs,
+                remote=remote,
+                odb=target,
+                refresh_index=refresh_remote_index and target not in refreshed,
             )
+            refreshed.add(target)
         except FileTransferError as exc:
             raise UploadError(exc.amount)
     return pushed
@@ -144,7 +144,13 @@ def reproduce(
 
 
 def _reproduce_stages(
-    G, stages, downstream=False, single_item=False, on_unchanged=None, **kwargs
+    G,
+    stages,
+    downstream=False,
+    single_item=False,
+    on_unchanged=None,
+    jobs=None,
+    **kwargs,
 ):
     r"""Derive the evaluation of the given node for the given graph.
 
@@ -180,9 +186,30 @@ def _reproduce_stages(
                  A                                       E
 
     The derived evaluation of _downstream_ B would be: [B, D, E]
+
+    With `jobs` > 1, independent stages are reproduced in parallel (see
+    `_reproduce_steps_parallel`).
     """
     steps = _get_steps(G, stages, downstream, single_item)
 
+    if (
+        jobs
+        and jobs > 1
+        and len(steps) > 1
+        and not single_item
+        and not kwargs.get("interactive")
+        and not kwargs.get("checkpoint_func")
+    ):
+        result, unchanged = _reproduce_steps_parallel(
+            _get_active_graph(G, single_item).subgraph(steps),
+            steps,
+            jobs,
+            **kwargs,
+        )
+        if on_unchanged is not None:
+            on_unchanged(unchanged)
+        return result
+
     force_downstream = kwargs.pop("force_downstream", False)
     result = []
     unchanged = []
@@ -225,9 +252,107 @@ def _reproduce_stages(
     return result
 
 
-def _get_steps(G, stages, downstream, single_item):
-    import networkx as nx
+def _reproduce_steps_parallel(G, steps, jobs, **kwargs):
+    """Reproduce stages in parallel, as soon as all of the stages they
+    depend on are reproduced.
+
+    `G` is the graph of the `steps`, where stages point to the ones they
+    depend on. Only stage commands are run concurrently, everything else
+    (checking for changes, saving outputs, writing dvc.lock and the
+    run-cache) is serialized with a mutex shared by the workers.
+    """
+    import threading
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    from dvc.stage.decorators import shared_repo
+
+    force_downstream = kwargs.pop("force_downstream", False)
+    mutex = threading.RLock()
+
+    def _run(stage, force):
+        with shared_repo(mutex):
+            stage_kwargs = dict(kwargs)
+            if force:
+                stage_kwargs["force"] = True
+            try:
+                return _reproduce_stage(stage, **stage_kwargs)
+            except Exception as exc:
+                raise ReproductionError(stage.relpath) from exc
+
+    pending = {stage: set(G.successors(stage)) for stage in steps}
+    reproduced = {}
+    unchanged = []
+    forced = set()
+    futures = {}
+    error = None
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        while pending or futures:
+            if error is None:
+                _submit_ready(executor, _run, steps, pending, forced, futures)
+            elif not futures:
+                break
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            done_error = _collect_done(
+                G,
+                done,
+                futures,
+                pending,
+                reproduced,
+                unchanged,
+                forced if force_downstream else None,
+            )
+            error = error or done_error
+
+    if error is not None:
+        raise error
+
+    result = []
+    for stage in steps:
+        result.extend(reproduced.get(stage, []))
+    return result, unchanged
 
+
+def _submit_ready(executor, run, steps, pending, forced, futures):
+    # NOTE: submitted in the order of steps, so that independent stages
+    # start in the same order as with `jobs=1`
+    ready = [stage for stage in steps if pending.get(stage) == set()]
+    for stage in ready:
+        del pending[stage]
+        futures[executor.submit(run, stage, stage in forced)] = stage
+
+
+def _collect_done(G, done, futures, pending, reproduced, unchanged, forced):
+    """Record results of the `done` futures and unblock their dependents.
+
+    Stages depending on a reproduced stage are added to `forced`, unless
+    it is None. Returns the first error raised by the stages, if any.
+    """
+    error = None
+    for future in done:
+        stage = futures.pop(future)
+        try:
+            ret = future.result()
+        except Exception as exc:  # pylint: disable=broad-except
+            # NOTE: let running stages finish, but don't start new
+            error = error or exc
+            continue
+
+        if ret:
+            reproduced[stage] = ret
+            if forced is not None:
+                # NOTE: unlike with `jobs=1`, only stages that depend on
+                # the reproduced one are forced
+                forced.update(G.predecessors(stage))
+        else:
+            unchanged.append(stage)
+        for dependent in G.predecessors(stage):
+            if dependent in pending:
+                pending[dependent].discard(stage)
+    return error
+
+
+def _get_active_graph(G, single_item):
     active = G.copy()
     if not single_item:
         # NOTE: frozen stages don't matter for single_item
@@ -235,6 +360,13 @@ def _get_steps(G, stages, downstream, single_item):
             if stage.frozen:
                 # NOTE: disconnect frozen stage from its dependencies
                 active.remove_edges_from(G.out_edges(stage))
+    return active
+
+
+def _get_steps(G, stages, downstream, single_item):
+    import networkx as nx
+
+    active = _get_active_graph(G, single_item)
 
     all_pipelines = []
     for stage in stages:
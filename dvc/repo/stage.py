@@ -470,20 +470,38 @@ class StageLoad:
             # trailing slash needed to check if a directory is gitignored
             return dir_path in outs or is_ignored(f"{dir_path}{sep}")
 
+        def load(file_path):
+            try:
+                return self.load_file(file_path)
+            except DvcException as exc:
+                if onerror:
+                    onerror(relpath(file_path), exc)
+                    return []
+                raise
+
+        index_cache = self.repo.index_cache
+        cached = (
+            index_cache.get_dvcfiles() if self.fs is self.repo.fs else None
+        )
+        if cached is not None:
+            for file_path in cached:
+                root, file = os.path.split(file_path)
+                if is_dvcfile_and_not_ignored(root, file):
+                    yield from load(file_path)
+            index_cache.flush()
+            return
+
+        walked: List[str] = []
+        dvcfiles: List[str] = []
         for root, dirs, files in self.repo.dvcignore.walk(
             self.fs, self.repo.root_dir
         ):
+            walked.append(root)
             dvcfile_filter = partial(is_dvcfile_and_not_ignored, root)
             for file in filter(dvcfile_filter, files):
                 file_path = os.path.join(root, file)
-                try:
-                    new_stages = self.load_file(file_path)
-                except DvcException as exc:
-                    if onerror:
-                        onerror(relpath(file_path), exc)
-                        continue
-                    raise
-
+                dvcfiles.append(file_path)
+                new_stages = load(file_path)
                 yield from new_stages
                 outs.update(
                     out.fspath
@@ -493,5 +511,9 @@ class StageLoad:
                 )
             dirs[:] = [d for d in dirs if not is_out_or_ignored(root, d)]
 
+        if self.fs is self.repo.fs:
+            index_cache.save_dvcfiles(walked, dvcfiles)
+            index_cache.flush()
+
     def collect_repo(self, onerror: Callable[[str, Exception], None] = None):
         return list(self._collect_repo(onerror))
@@ -48,6 +48,7 @@ def _cloud_status(
     all_tags=False,
     recursive=False,
     all_commits=False,
+    refresh_remote_index=False,
 ):
     """Returns a dictionary with the files that are new or deleted.
 
@@ -94,7 +95,11 @@ def _cloud_status(
             # ignore imported objects
             continue
         status_info = self.cloud.status(
-            obj_ids, jobs, remote=remote, log_missing=False
+            obj_ids,
+            jobs,
+            remote=remote,
+            log_missing=False,
+            refresh_index=refresh_remote_index,
         )
         for status_ in ("deleted", "new", "missing"):
             for hash_info in getattr(status_info, status_, []):
@@ -115,6 +120,7 @@ def status(
     all_tags=False,
     all_commits=False,
     recursive=False,
+    refresh_remote_index=False,
 ):
     if isinstance(targets, str):
         targets = [targets]
@@ -130,6 +136,7 @@ def status(
             all_tags=all_tags,
             all_commits=all_commits,
             recursive=True,
+            refresh_remote_index=refresh_remote_index,
         )
 
     ignored = list(
@@ -0,0 +1,158 @@
+"""Persistent cache of the objects used by git revisions.
+
+`used_objs` with `--all-commits`/`--all-branches` has to collect the
+`Index` of every revision and the objects used by each of its outputs
+(which for directories means loading `.dir` objects from the cache),
+although most of the revisions have exactly the same dvcfiles. Results
+are kept in a sqlite database in `.dvc/tmp`, in two tables:
+
+* tree id of the repo root in a revision -> `Index.identifier`, so that
+  already seen revisions don't need to be collected at all;
+* `Index.identifier` -> used objects, so that revisions with the same
+  dvcfiles only need to be collected once.
+"""
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, Set
+
+if TYPE_CHECKING:
+    from dvc.hash_info import HashInfo
+
+logger = logging.getLogger(__name__)
+
+
+class UsedCache:
+    DB_FILE = "used.db"
+    # NOTE: bump if the format of any of the cached data changes
+    VERSION = 1
+    MAX_ENTRIES = 100_000
+
+    def __init__(self, tmp_dir: Optional[str] = None):
+        self.path = os.path.join(tmp_dir, self.DB_FILE) if tmp_dir else None
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            import sqlite3
+
+            conn = sqlite3.connect(
+                self.path, timeout=60, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            with conn:
+                if version != self.VERSION:
+                    conn.execute("DROP TABLE IF EXISTS trees")
+                    conn.execute("DROP TABLE IF EXISTS used")
+                    conn.execute(f"PRAGMA user_version = {self.VERSION}")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS trees "
+                    "(tree TEXT PRIMARY KEY NOT NULL, "
+                    "identifier TEXT NOT NULL, "
+                    "timestamp REAL NOT NULL) WITHOUT ROWID"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS used "
+                    "(identifier TEXT PRIMARY KEY NOT NULL, "
+                    "timestamp REAL NOT NULL, data BLOB NOT NULL) "
+                    "WITHOUT ROWID"
+                )
+            self._conn = conn
+            self._prune()
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _prune(self):
+        for table in ("trees", "used"):
+            (count,) = self._conn.execute(
+                f"SELECT COUNT(*) FROM {table}"
+            ).fetchone()
+            if count <= self.MAX_ENTRIES:
+                continue
+
+            with self._conn:
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE timestamp <= ("
+                    f"SELECT timestamp FROM {table} ORDER BY timestamp "
+                    "LIMIT 1 OFFSET ?)",
+                    (count - self.MAX_ENTRIES,),
+                )
+
+    def _query(self, sql: str, args: tuple) -> Optional[tuple]:
+        import sqlite3
+
+        if not self.path:
+            return None
+        try:
+            with self._lock:
+                return self.conn.execute(sql, args).fetchone()
+        except sqlite3.Error:
+            logger.debug("failed to query '%s'", self.path, exc_info=True)
+            return None
+
+    def _insert(self, sql: str, args: tuple):
+        import sqlite3
+
+        if not self.path:
+            return
+        try:
+            with self._lock, self.conn:
+                self.conn.execute(sql, args)
+        except sqlite3.Error:
+            logger.debug("failed to update '%s'", self.path, exc_info=True)
+
+    def get_identifier(self, tree: str) -> Optional[str]:
+        row = self._query(
+            "SELECT identifier FROM trees WHERE tree = ?", (tree,)
+        )
+        return row[0] if row else None
+
+    def set_identifier(self, tree: str, identifier: str):
+        self._insert(
+            "INSERT OR REPLACE INTO trees (tree, identifier, timestamp) "
+            "VALUES (?, ?, ?)",
+            (tree, identifier, time.time()),
+        )
+
+    def get_used(self, identifier: str) -> Optional[Set["HashInfo"]]:
+        """Return objects used by the index with the given identifier.
+
+        Returns new `HashInfo` instances on every call, as callers are
+        free to modify them (e.g. `obj_name`).
+        """
+        from dvc.hash_info import HashInfo
+
+        row = self._query(
+            "SELECT data FROM used WHERE identifier = ?", (identifier,)
+        )
+        if not row:
+            return None
+        return {
+            HashInfo(name, value, obj_name=obj_name)
+            for name, value, obj_name in pickle.loads(row[0])
+        }
+
+    def set_used(self, identifier: str, used: Set["HashInfo"]):
+        data = [
+            (hash_info.name, hash_info.value, hash_info.obj_name)
+            for hash_info in used
+        ]
+        self._insert(
+            "INSERT OR REPLACE INTO used (identifier, timestamp, data) "
+            "VALUES (?, ?, ?)",
+            (identifier, time.time(), pickle.dumps(data, protocol=4)),
+        )
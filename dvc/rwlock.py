@@ -1,6 +1,7 @@
 import json
 import os
-from collections import defaultdict
+import threading
+from collections import Counter, defaultdict
 from contextlib import contextmanager
 
 from voluptuous import Invalid, Optional, Required, Schema
@@ -19,6 +20,13 @@ SCHEMA = Schema(
 )
 
 
+# NOTE: all of the threads of a process lock paths with the same info, so
+# they are counted to only be released once the last thread is done with
+# them (e.g. when several stages depending on the same data are running).
+_held: Counter = Counter()
+_held_lock = threading.Lock()
+
+
 class RWLockFileCorruptedError(DvcException):
     def __init__(self, path):
         super().__init__(
@@ -83,31 +91,29 @@ def _check_blockers(lock, info, *, mode, waiters):
         )
 
 
-def _acquire_read(lock, info, paths):
-    changes = []
-
+def _acquire_read(lock, info, paths, key):
     for path in paths:
+        _held[(key, "read", path)] += 1
         readers = lock["read"][path]
-        if info in readers:
-            continue
-
-        changes.append(path)
-        readers.append(info)
-
-    return changes
+        if info not in readers:
+            readers.append(info)
 
 
-def _acquire_write(lock, info, paths):
-    changes = []
-
+def _acquire_write(lock, info, paths, key):
     for path in paths:
-        if lock["write"][path] == info:
-            continue
-
-        changes.append(path)
+        _held[(key, "write", path)] += 1
         lock["write"][path] = info
 
-    return changes
+
+def _unhold(paths, mode, key):
+    """Return paths which are not held by any other thread anymore."""
+    ret = []
+    for path in paths:
+        _held[(key, mode, path)] -= 1
+        if _held[(key, mode, path)] <= 0:
+            del _held[(key, mode, path)]
+            ret.append(path)
+    return ret
 
 
 def _release_write(lock, info, changes):
@@ -152,17 +158,18 @@ def rwlock(tmp_dir, cmd, read, write):
     """
     info = {"pid": os.getpid(), "cmd": cmd}
 
-    with _edit_rwlock(tmp_dir) as lock:
+    with _held_lock, _edit_rwlock(tmp_dir) as lock:
 
         _check_blockers(lock, info, mode="write", waiters=read + write)
         _check_blockers(lock, info, mode="read", waiters=write)
 
-        rchanges = _acquire_read(lock, info, read)
-        wchanges = _acquire_write(lock, info, write)
+        key = (tmp_dir, cmd)
+        _acquire_read(lock, info, read, key)
+        _acquire_write(lock, info, write, key)
 
     try:
         yield
     finally:
-        with _edit_rwlock(tmp_dir) as lock:
-            _release_write(lock, info, wchanges)
-            _release_read(lock, info, rchanges)
+        with _held_lock, _edit_rwlock(tmp_dir) as lock:
+            _release_write(lock, info, _unhold(write, "write", key))
+            _release_read(lock, info, _unhold(read, "read", key))
@@ -1,10 +1,11 @@
+import json
 import logging
 import os
 import tempfile
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 
-from funcy import cached_property, first
+from funcy import cached_property
 
 from dvc.exceptions import DvcException
 from dvc.utils import dict_sha256, relpath
@@ -53,6 +54,100 @@ def _get_stage_hash(stage):
     return _get_cache_hash(to_single_stage_lockfile(stage), key=True)
 
 
+class RunCacheIndex:
+    """Index of the parsed run-cache entries.
+
+    Entries are stored in a sqlite table keyed by the stage hash and the
+    hash of the entry, along with the time they were saved, so that
+    looking up a stage doesn't need to list its key directory and to
+    parse and validate every entry in it. Since entries are addressed by
+    the hash of their contents, the index stays valid for any run-cache
+    and only needs to be checked for entries that were removed.
+    """
+
+    INDEX_DIR = "index"
+    INDEX_FILE = "runs.db"
+
+    def __init__(self, tmp_dir: str):
+        from dvc.utils.fs import makedirs
+
+        index_dir = os.path.join(tmp_dir, self.INDEX_DIR)
+        makedirs(index_dir, exist_ok=True)
+        self.path = os.path.join(index_dir, self.INDEX_FILE)
+        self._conn = None
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            import sqlite3
+
+            conn = sqlite3.connect(
+                self.path, timeout=60, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS runs "
+                    "(key TEXT NOT NULL, value TEXT NOT NULL, "
+                    "timestamp REAL NOT NULL, entry TEXT NOT NULL, "
+                    "PRIMARY KEY (key, value)) WITHOUT ROWID"
+                )
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get(self, key: str, value: str) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT entry FROM runs WHERE key = ? AND value = ?",
+            (key, value),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def entries(self, key: str) -> Iterator[Tuple[str, dict]]:
+        """Iterate over the entries for `key`, latest first."""
+        rows = self.conn.execute(
+            "SELECT value, entry FROM runs WHERE key = ? "
+            "ORDER BY timestamp DESC",
+            (key,),
+        ).fetchall()
+        for value, entry in rows:
+            yield value, json.loads(entry)
+
+    def add(self, key: str, value: str, entry: dict, timestamp: float):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO runs (key, value, timestamp, entry) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, timestamp, json.dumps(entry)),
+            )
+
+    def remove(self, key: str, value: str):
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM runs WHERE key = ? AND value = ?", (key, value)
+            )
+
+
+def _list_runs(odb: "ObjectDB") -> List[Tuple[str, str, str]]:
+    """List run-cache entries in `odb` as (key, value, path) tuples."""
+    fs = odb.fs
+    runs = fs.path.join(odb.fs_path, "runs")
+    if not fs.exists(runs):
+        return []
+
+    ret = []
+    for path in fs.find(runs):
+        # NOTE: splitting the path directly, as `fs.path.name()` is too slow
+        # to be called for every entry in a big run-cache
+        *_, key, value = path.rsplit(fs.sep, 2)
+        ret.append((key, value, path))
+    return ret
+
+
 class StageCache:
     def __init__(self, repo):
         self.repo = repo
@@ -61,6 +156,14 @@ class StageCache:
     def cache_dir(self):
         return os.path.join(self.repo.odb.local.cache_dir, "runs")
 
+    @cached_property
+    def index(self):
+        return RunCacheIndex(self.repo.tmp_dir)
+
+    def close(self):
+        if "index" in self.__dict__:
+            self.index.close()
+
     def _get_cache_dir(self, key):
         return os.path.join(self.cache_dir, key[:2], key)
 
@@ -75,8 +178,16 @@ class StageCache:
 
         path = self._get_cache_path(key, value)
 
+        cache = self.index.get(key, value)
+        if cache is not None:
+            if os.path.exists(path):
+                return cache
+            self.index.remove(key, value)
+            return None
+
         try:
-            return COMPILED_LOCK_FILE_STAGE_SCHEMA(load_yaml(path))
+            cache = COMPILED_LOCK_FILE_STAGE_SCHEMA(load_yaml(path))
+            mtime = os.path.getmtime(path)
         except FileNotFoundError:
             return None
         except (YAMLFileCorruptedError, Invalid):
@@ -84,16 +195,30 @@ class StageCache:
             os.unlink(path)
             return None
 
+        self.index.add(key, value, cache, mtime)
+        return cache
+
     def _load(self, stage):
         key = _get_stage_hash(stage)
         if not key:
             return None
 
+        checked = set()
+        for value, cache in self.index.entries(key):
+            if os.path.exists(self._get_cache_path(key, value)):
+                return cache
+            self.index.remove(key, value)
+            checked.add(value)
+
+        # NOTE: entries could have been added by other repos sharing the
+        # cache or pulled from a remote since the index was updated
         cache_dir = self._get_cache_dir(key)
         if not os.path.exists(cache_dir):
             return None
 
         for value in os.listdir(cache_dir):
+            if value in checked:
+                continue
             cache = self._load_cache(key, value)
             if cache:
                 return cache
@@ -174,6 +299,7 @@ class StageCache:
         assert os.path.isdir(parent)
         dump_yaml(tmp, cache)
         self.repo.odb.local.move(tmp, path)
+        self.index.add(cache_key, cache_value, cache, os.path.getmtime(path))
 
     def restore(self, stage, run_cache=True, pull=False):
         from .serialize import to_single_stage_lockfile
@@ -211,31 +337,48 @@ class StageCache:
         cached_stage.checkout()
 
     @staticmethod
-    def _transfer(func, from_remote, to_remote):
-        ret = []
+    def _transfer(func, from_remote, to_remote, jobs=None):
+        from concurrent.futures import ThreadPoolExecutor
 
-        runs = from_remote.fs.path.join(from_remote.fs_path, "runs")
-        if not from_remote.fs.exists(runs):
+        from_runs = _list_runs(from_remote)
+        if not from_runs:
             return []
 
-        from_path = from_remote.fs.path
-        for src in from_remote.fs.find(runs):
-            rel = from_path.relpath(src, from_remote.fs_path)
-            dst = to_remote.fs.path.join(to_remote.fs_path, rel)
-            key = to_remote.fs.path.parent(dst)
-            # check if any build cache already exists for this key
-            # TODO: check if MaxKeys=1 or something like that applies
-            # or otherwise this will take a lot of time!
-            if to_remote.fs.exists(key) and first(to_remote.fs.find(key)):
+        # NOTE: listing the whole destination once is much faster than
+        # checking every key separately, as there could be a lot of them
+        to_keys = {key for key, _, _ in _list_runs(to_remote)}
+        to_path = to_remote.fs.path
+        missing = []
+        for key, value, src in from_runs:
+            # skip keys which already have any run-cache in the destination
+            if key in to_keys:
                 continue
-            func(src, dst)
-            ret.append(
-                (from_path.name(from_path.parent(src)), from_path.name(src))
-            )
+            dst = to_path.join(to_remote.fs_path, "runs", key[:2], key, value)
+            missing.append((key, value, src, dst))
+
+        if not missing:
+            return []
 
-        return ret
+        def transfer(entry):
+            _, _, src, dst = entry
+            return func(src, dst)
+
+        max_workers = jobs or max(from_remote.fs.jobs, to_remote.fs.jobs)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            failed = list(executor.map(transfer, missing))
+
+        return [
+            (key, value)
+            for (key, value, _, _), fail in zip(missing, failed)
+            if not fail
+        ]
 
-    def push(self, remote: Optional[str], odb: Optional["ObjectDB"] = None):
+    def push(
+        self,
+        remote: Optional[str],
+        odb: Optional["ObjectDB"] = None,
+        jobs: Optional[int] = None,
+    ):
         from dvc.objects.transfer import _log_exceptions
 
         if odb is None:
@@ -244,9 +387,10 @@ class StageCache:
             _log_exceptions(odb.fs.upload),
             self.repo.odb.local,
             odb,
+            jobs=jobs,
         )
 
-    def pull(self, remote: Optional[str]):
+    def pull(self, remote: Optional[str], jobs: Optional[int] = None):
         from dvc.objects.transfer import _log_exceptions
 
         odb = self.repo.cloud.get_remote_odb(remote)
@@ -254,6 +398,7 @@ class StageCache:
             _log_exceptions(odb.fs.download),
             odb,
             self.repo.odb.local,
+            jobs=jobs,
         )
 
     def get_used_objs(self, used_run_cache, *args, **kwargs):
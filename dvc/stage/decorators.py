@@ -1,3 +1,5 @@
+import threading
+from contextlib import contextmanager
 from functools import wraps
 
 from funcy import decorator
@@ -36,9 +38,43 @@ def rwlocked(call, read=None, write=None):
         return call()
 
 
+class _SharedRepo(threading.local):
+    mutex = None
+
+
+_shared_repo = _SharedRepo()
+
+
+@contextmanager
+def shared_repo(mutex):
+    """Use the repo from multiple threads.
+
+    `mutex` is held by the current thread for all of the operations on the
+    repo, except while stage commands are running (see `unlocked_repo`),
+    so that only the commands themselves run concurrently.
+    """
+    with mutex:
+        _shared_repo.mutex = mutex
+        try:
+            yield
+        finally:
+            _shared_repo.mutex = None
+
+
 def unlocked_repo(f):
     @wraps(f)
     def wrapper(stage, *args, **kwargs):
+        mutex = _shared_repo.mutex
+        if mutex is not None:
+            # NOTE: the repo lock can't be released while other threads
+            # are still using the repo, only the mutex is.
+            stage.repo._reset()  # pylint: disable=protected-access
+            mutex.release()
+            try:
+                return f(stage, *args, **kwargs)
+            finally:
+                mutex.acquire()
+
         stage.repo.lock.unlock()
         stage.repo._reset()  # pylint: disable=protected-access
         try:
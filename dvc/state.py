@@ -2,12 +2,19 @@
 
 import logging
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
 
 from dvc.fs.local import LocalFileSystem
-from dvc.hash_info import HashInfo
+from dvc.hash_info import DEFAULT_HASH_NAME, HashInfo
 from dvc.utils import relpath
-from dvc.utils.fs import get_inode, get_mtime_and_size, remove
+from dvc.utils.fs import (
+    get_file_mtime_and_size,
+    get_inode,
+    get_mtime_and_size,
+    remove,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +25,19 @@ class StateBase(ABC):
         pass
 
     @abstractmethod
-    def save(self, path, fs, hash_info):
+    def save(self, path, fs, hash_info, stat=None):
         pass
 
     @abstractmethod
-    def get(self, path, fs):
+    def save_many(self, entries, fs, stats=None):
+        pass
+
+    @abstractmethod
+    def get(self, path, fs, stat=None, name=DEFAULT_HASH_NAME):
+        pass
+
+    @abstractmethod
+    def get_many(self, paths, fs, stats=None, name=DEFAULT_HASH_NAME):
         pass
 
     @abstractmethod
@@ -34,18 +49,67 @@ class StateNoop(StateBase):
     def close(self):
         pass
 
-    def save(self, path, fs, hash_info):
+    def save(self, path, fs, hash_info, stat=None):
         pass
 
-    def get(self, path, fs):  # pylint: disable=unused-argument
+    def save_many(self, entries, fs, stats=None):
+        pass
+
+    def get(
+        self, path, fs, stat=None, name=DEFAULT_HASH_NAME
+    ):  # pylint: disable=unused-argument
         return None, None
 
+    def get_many(
+        self, paths, fs, stats=None, name=DEFAULT_HASH_NAME
+    ):  # pylint: disable=unused-argument
+        for path in paths:
+            yield path, None, None
+
     def save_link(self, path, fs):
         pass
 
 
+# NOTE: sqlite stores integers as signed 64-bit values, so inodes that
+# don't fit are wrapped into the negative range.
+# See http://jakegoulding.com/blog/2011/02/06/sqlite-64-bit-integers/
+_MAX_INT = 2 ** 63 - 1
+_MAX_UINT = 2 ** 64 - 2
+# keep well below SQLITE_MAX_VARIABLE_NUMBER (999 on older sqlite builds)
+_QUERY_BATCH_SIZE = 900
+
+
+def _to_sqlite(num):
+    assert 0 <= num < _MAX_UINT
+    if num > _MAX_INT:
+        return -(num - _MAX_INT)
+    return num
+
+
 class State(StateBase):  # pylint: disable=too-many-instance-attributes
-    def __init__(self, root_dir=None, tmp_dir=None, dvcignore=None):
+    STATE_FILE = "state.db"
+    # NOTE: bump if the format of any of the tables changes
+    VERSION = 2
+    # legacy diskcache-based md5s storage, migrated on first use
+    LEGACY_MD5S_DIR = "md5s"
+    # NOTE: the legacy storage was limited to 1GB (diskcache's default
+    # size limit), evicting least recently used entries first, which is
+    # roughly 10M entries.
+    MAX_ENTRIES = 10_000_000
+    # NOTE: summaries of directories that are no longer walked (e.g. the
+    # ones of removed workspaces) are evicted the same way
+    MAX_DIR_ENTRIES = 100_000
+    # NOTE: access times are only updated once in a while, so that looking
+    # up hashes doesn't need to write to the database every time
+    ATIME_RESOLUTION_NS = 24 * 60 * 60 * 10 ** 9
+
+    def __init__(
+        self,
+        root_dir=None,
+        tmp_dir=None,
+        dvcignore=None,
+        trust_dir_mtime=False,
+    ):
         from diskcache import Cache
 
         super().__init__()
@@ -53,6 +117,11 @@ class State(StateBase):  # pylint: disable=too-many-instance-attributes
         self.tmp_dir = tmp_dir
         self.root_dir = root_dir
         self.dvcignore = dvcignore
+        # reuse stats of the files in directories which haven't changed
+        # (see `dvc.utils.fs._get_summarized_dir_mtime_and_size`)
+        self.trust_dir_mtime = trust_dir_mtime
+        self._conn = None
+        self._lock = threading.RLock()
 
         if not tmp_dir:
             return
@@ -62,65 +131,338 @@ class State(StateBase):  # pylint: disable=too-many-instance-attributes
             "disk_pickle_protocol": 4,
         }
         self.links = Cache(directory=os.path.join(tmp_dir, "links"), **config)
-        self.md5s = Cache(directory=os.path.join(tmp_dir, "md5s"), **config)
+        self.state_file = os.path.join(tmp_dir, self.STATE_FILE)
+
+    @property
+    def conn(self):
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            return self._conn
+
+    def _connect(self):
+        import sqlite3
+
+        conn = sqlite3.connect(
+            self.state_file, timeout=60, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version != self.VERSION:
+            self._create_tables(conn)
+            self._migrate(conn)
+        self._prune(conn)
+        return conn
+
+    def _create_tables(self, conn):
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS hashes")
+            conn.execute("DROP TABLE IF EXISTS dirs")
+            # NOTE: files can be hashed with different hashes (see
+            # `cache.hash`), so entries are keyed by the name of the hash
+            # as well. `mtime` is stored as text, exactly as returned by
+            # `get_mtime_and_size` (nanoseconds for files and a digest of
+            # the mtimes of all of their files for directories).
+            conn.execute(
+                "CREATE TABLE hashes ("
+                "inode INTEGER NOT NULL, "
+                "name TEXT NOT NULL, "
+                "mtime TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "value TEXT NOT NULL, "
+                "atime INTEGER NOT NULL, "
+                "PRIMARY KEY (inode, name)) WITHOUT ROWID"
+            )
+            conn.execute("CREATE INDEX hashes_atime ON hashes (atime)")
+            conn.execute(
+                "CREATE TABLE dirs ("
+                "path TEXT PRIMARY KEY, "
+                "summary TEXT NOT NULL, "
+                "atime INTEGER NOT NULL)"
+            )
+            conn.execute("CREATE INDEX dirs_atime ON dirs (atime)")
+            conn.execute(f"PRAGMA user_version = {self.VERSION}")
+
+    def _prune(self, conn):
+        """Evict least recently used entries above `MAX_ENTRIES` and
+        `MAX_DIR_ENTRIES`."""
+        for table, max_entries in (
+            ("hashes", self.MAX_ENTRIES),
+            ("dirs", self.MAX_DIR_ENTRIES),
+        ):
+            (count,) = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+            if count <= max_entries:
+                continue
+
+            logger.debug(
+                "evicting %d state entries from '%s'",
+                count - max_entries,
+                table,
+            )
+            with conn:
+                conn.execute(
+                    f"DELETE FROM {table} WHERE atime <= ("
+                    f"SELECT atime FROM {table} ORDER BY atime "
+                    "LIMIT 1 OFFSET ?)",
+                    (count - max_entries - 1,),
+                )
+
+    def _migrate(self, conn):
+        """Import entries from the legacy diskcache-based md5s storage.
+
+        The legacy storage itself is left in place for older versions of
+        dvc, it is only imported once, when the tables are created.
+        """
+        from diskcache import Cache
+
+        legacy_dir = os.path.join(self.tmp_dir, self.LEGACY_MD5S_DIR)
+        if not os.path.isdir(legacy_dir):
+            return
+
+        logger.debug("migrating state from '%s'", legacy_dir)
+        atime = time.time_ns()
+        rows = []
+        with Cache(directory=legacy_dir) as legacy:
+            for inode in legacy:
+                value = legacy.get(inode)
+                if not value:
+                    continue
+                mtime, size, md5 = value
+                rows.append(
+                    (_to_sqlite(inode), "md5", mtime, int(size), md5, atime)
+                )
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO hashes "
+                "(inode, name, mtime, size, value, atime) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
 
     def close(self):
-        self.md5s.close()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
         self.links.close()
 
-    def save(self, path, fs, hash_info):
+    def _stat(self, path, fs, stat=None):
+        if stat is not None:
+            mtime, size = get_file_mtime_and_size(stat.mtime, stat.size)
+            inode = stat.inode
+        else:
+            mtime, size = get_mtime_and_size(
+                path, fs, self.dvcignore, state=self
+            )
+            inode = get_inode(path)
+        return _to_sqlite(inode), mtime, size
+
+    @staticmethod
+    def _dir_range(path):
+        # NOTE: all of the subdirectories are prefixed with `path + os.sep`
+        return (
+            "(path = ? OR (path > ? AND path < ?))",
+            (path, path + os.sep, path + chr(ord(os.sep) + 1)),
+        )
+
+    def get_dir_summaries(self, path):
+        """Get summaries of the directory and all of its subdirectories.
+
+        Returns:
+            dict: `DirSummary` for each of the directories by their path.
+        """
+        import json
+
+        from dvc.utils.fs import DirSummary
+
+        path = os.path.abspath(path)
+        where, args = self._dir_range(path)
+        query = f"SELECT path, summary, atime FROM dirs WHERE {where}"
+        with self._lock:
+            rows = self.conn.execute(query, args).fetchall()
+
+        ret = {}
+        outdated = time.time_ns() - self.ATIME_RESOLUTION_NS
+        used = False
+        for dirname, summary, atime in rows:
+            ret[dirname] = DirSummary.from_json(json.loads(summary))
+            used = used or atime < outdated
+
+        if used:
+            # mark them as recently used (see `MAX_DIR_ENTRIES`)
+            with self._lock, self.conn:
+                self.conn.execute(
+                    f"UPDATE dirs SET atime = ? WHERE {where}",
+                    (time.time_ns(), *args),
+                )
+        return ret
+
+    def save_dir_summaries(self, summaries, removed=()):
+        """Save summaries of directories and remove the outdated ones.
+
+        Args:
+            summaries (dict): `DirSummary` to save by directory path.
+            removed (list): paths of directories to remove summaries for,
+                along with the ones of all of their subdirectories.
+        """
+        import json
+
+        atime = time.time_ns()
+        rows = [
+            (os.path.abspath(dirname), json.dumps(summary), atime)
+            for dirname, summary in summaries.items()
+        ]
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO dirs (path, summary, atime) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+            for dirname in removed:
+                where, args = self._dir_range(os.path.abspath(dirname))
+                self.conn.execute(f"DELETE FROM dirs WHERE {where}", args)
+
+    def save(self, path, fs, hash_info, stat=None):
         """Save hash for the specified path info.
 
         Args:
             path (str): path to save hash for.
             hash_info (HashInfo): hash to save.
+            stat (ScanEntry): stat results of the file, if already known.
         """
+        stats = {path: stat} if stat is not None else None
+        self.save_many([(path, hash_info)], fs, stats=stats)
+
+    def save_many(self, entries, fs, stats=None):
+        """Save hashes for multiple paths in a single transaction.
 
+        Args:
+            entries (iterable): (path, HashInfo) pairs to save.
+            stats (dict): `ScanEntry` stat results of the files by path, if
+                already known (e.g. from `LocalFileSystem.scan`), so that
+                they don't need to be stat-ed again.
+        """
         if not isinstance(fs, LocalFileSystem):
             return
 
-        mtime, size = get_mtime_and_size(path, fs, self.dvcignore)
-        inode = get_inode(path)
-
-        logger.debug(
-            "state save (%s, %s, %s) %s",
-            inode,
-            mtime,
-            str(size),
-            hash_info.value,
-        )
+        atime = time.time_ns()
+        stats = stats or {}
+        rows = []
+        for path, hash_info in entries:
+            inode, mtime, size = self._stat(path, fs, stats.get(path))
+            logger.debug(
+                "state save (%s, %s, %s) %s",
+                inode,
+                mtime,
+                size,
+                hash_info,
+            )
+            rows.append(
+                (inode, hash_info.name, mtime, size, hash_info.value, atime)
+            )
+
+        if not rows:
+            return
 
-        self.md5s[inode] = (mtime, str(size), hash_info.value)
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO hashes "
+                "(inode, name, mtime, size, value, atime) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
 
-    def get(self, path, fs):
+    def get(self, path, fs, stat=None, name=DEFAULT_HASH_NAME):
         """Gets the hash for the specified path info. Hash will be
         retrieved from the state database if available.
 
         Args:
             path (str): path info to get the hash for.
+            stat (ScanEntry): stat results of the file, if already known.
+            name (str): name of the hash to get.
 
         Returns:
             HashInfo or None: hash for the specified path info or None if it
             doesn't exist in the state database.
         """
-        from .objects.meta import Meta
-
-        if not isinstance(fs, LocalFileSystem):
-            return None, None
+        stats = {path: stat} if stat is not None else None
+        ((_, meta, hash_info),) = self.get_many(
+            [path], fs, stats=stats, name=name
+        )
+        return meta, hash_info
 
-        try:
-            mtime, size = get_mtime_and_size(path, fs, self.dvcignore)
-        except FileNotFoundError:
-            return None, None
+    def get_many(self, paths, fs, stats=None, name=DEFAULT_HASH_NAME):
+        """Gets hashes for multiple paths with batched state lookups.
 
-        inode = get_inode(path)
+        Args:
+            paths (iterable): paths to get hashes for.
+            stats (dict): `ScanEntry` stat results of the files by path, if
+                already known.
+            name (str): name of the hashes to get.
+
+        Yields:
+            (path, Meta, HashInfo) tuples in the same order as `paths`, with
+            (path, None, None) for paths that don't have a valid entry in
+            the state database.
+        """
+        from funcy import chunks
 
-        value = self.md5s.get(inode)
+        from .objects.meta import Meta
 
-        if not value or value[0] != mtime or value[1] != str(size):
-            return None, None
+        if not isinstance(fs, LocalFileSystem):
+            for path in paths:
+                yield path, None, None
+            return
 
-        return Meta(size=size), HashInfo("md5", value[2])
+        known = stats or {}
+        for batch in chunks(_QUERY_BATCH_SIZE, paths):
+            batch_stats = {}
+            for path in batch:
+                try:
+                    batch_stats[path] = self._stat(path, fs, known.get(path))
+                except FileNotFoundError:
+                    pass
+
+            inodes = [inode for inode, _, _ in batch_stats.values()]
+            query = (
+                "SELECT inode, mtime, size, value, atime FROM hashes "
+                "WHERE name = ? AND inode IN ({})".format(
+                    ", ".join("?" * len(inodes))
+                )
+            )
+            with self._lock:
+                rows = {
+                    row[0]: row[1:]
+                    for row in self.conn.execute(query, [name, *inodes])
+                }
+
+            results = []
+            used = []
+            for path in batch:
+                inode, mtime, size = batch_stats.get(path, (None, None, None))
+                value = rows.get(inode)
+                if not value or value[0] != mtime or value[1] != size:
+                    results.append((path, None, None))
+                    continue
+                results.append(
+                    (path, Meta(size=size), HashInfo(name, value[2]))
+                )
+                if value[3] < time.time_ns() - self.ATIME_RESOLUTION_NS:
+                    used.append(inode)
+
+            if used:
+                self._touch(name, used)
+            yield from results
+
+    def _touch(self, name, inodes):
+        """Mark entries as recently used (see `MAX_ENTRIES`)."""
+        atime = time.time_ns()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "UPDATE hashes SET atime = ? WHERE inode = ? AND name = ?",
+                ((atime, inode, name) for inode in inodes),
+            )
 
     def save_link(self, path, fs):
         """Adds the specified path to the list of links created by dvc. This
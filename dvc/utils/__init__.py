@@ -9,6 +9,7 @@ import re
 import stat
 import sys
 import time
+from functools import wraps
 from typing import Dict, List, Optional, Tuple
 
 import colorama
@@ -25,35 +26,92 @@ def dos2unix(data):
     return data.replace(b"\r\n", b"\n")
 
 
-def _fobj_md5(fobj, hash_md5, binary, progress_func=None):
-    while True:
-        data = fobj.read(LOCAL_CHUNK_SIZE)
-        if not data:
-            break
+def _readinto(fobj, buf):
+    """Fill `buf` from `fobj`.
 
-        if binary:
-            chunk = data
+    Returns the number of bytes read, which is less than `len(buf)` only
+    at the end of the file.
+    """
+    view = memoryview(buf)
+    readinto = getattr(fobj, "readinto", None)
+    total = 0
+    while total < len(view):
+        if readinto:
+            count = readinto(view[total:])
         else:
-            chunk = dos2unix(data)
+            data = fobj.read(len(view) - total)
+            count = len(data)
+            view[total : total + count] = data
+        if not count:
+            break
+        total += count
+    return total
 
-        hash_md5.update(chunk)
+
+def _fobj_hash(fobj, hasher, binary=None, progress_func=None):
+    """Update `hasher` with the contents of `fobj`.
+
+    If `binary` is None, it is detected from the first block of the file.
+    Text files are hashed with CRLFs converted to LFs in every chunk of
+    `LOCAL_CHUNK_SIZE` bytes (as they always have been). Files larger than
+    a single chunk are read into a reused buffer.
+    """
+    from dvc.istextfile import DEFAULT_CHUNK_SIZE, istextblock
+
+    data = fobj.read(LOCAL_CHUNK_SIZE)
+    if binary is None:
+        binary = not istextblock(data[:DEFAULT_CHUNK_SIZE])
+
+    buf = None
+    while data:
+        if binary or b"\r\n" not in data:
+            hasher.update(data)
+        else:
+            hasher.update(dos2unix(data))
         if progress_func:
             progress_func(len(data))
 
+        if len(data) < LOCAL_CHUNK_SIZE:
+            data = fobj.read(LOCAL_CHUNK_SIZE)
+            continue
+        if buf is None:
+            buf = bytearray(LOCAL_CHUNK_SIZE)
+        count = _readinto(fobj, buf)
+        data = buf if count == len(buf) else buf[:count]
 
-def file_md5(fname, fs):
-    """get the (md5 hexdigest, md5 digest) of a file"""
-    from dvc.istextfile import istextfile
+
+def get_hasher(name):
+    """Return a new hash object for the specified content hash."""
+    if name != "blake3":
+        return hashlib.new(name)
+
+    try:
+        from blake3 import blake3
+    except ImportError as exc:
+        from dvc.exceptions import DvcException
+
+        raise DvcException(
+            "'blake3' hash requires 'dvc[blake3]' to be installed"
+        ) from exc
+    # NOTE: blake3 can hash a single large buffer with multiple threads
+    return blake3(max_threads=blake3.AUTO)
+
+
+def file_hash(fname, fs, name="md5"):
+    """get the hexdigest of a file for the specified content hash
+
+    Only md5 normalizes line endings of text files (as it always has),
+    other hashes are computed from the raw contents of the file.
+    """
     from dvc.progress import Tqdm
 
-    hash_md5 = hashlib.md5()
-    binary = not istextfile(fname, fs=fs)
+    hasher = get_hasher(name)
     size = fs.getsize(fname) or 0
     no_progress_bar = True
     if size >= LARGE_FILE_SIZE:
         no_progress_bar = False
         msg = (
-            f"Computing md5 for a large file '{fname}'. "
+            f"Computing {name} for a large file '{fname}'. "
             "This is only done once."
         )
         logger.info(msg)
@@ -66,9 +124,19 @@ def file_md5(fname, fs):
         leave=False,
     ) as pbar:
         with fs.open(fname, "rb") as fobj:
-            _fobj_md5(fobj, hash_md5, binary, pbar.update)
+            _fobj_hash(
+                fobj,
+                hasher,
+                binary=None if name == "md5" else True,
+                progress_func=pbar.update,
+            )
+
+    return hasher.hexdigest()
 
-    return hash_md5.hexdigest()
+
+def file_md5(fname, fs):
+    """get the md5 hexdigest of a file"""
+    return file_hash(fname, fs, "md5")
 
 
 def bytes_hash(byts, typ):
@@ -482,6 +550,7 @@ def glob_targets(targets, glob=True, recursive=True):
 
 
 def error_handler(func):
+    @wraps(func)
     def wrapper(*args, **kwargs):
         onerror = kwargs.get("onerror", None)
         result = {}
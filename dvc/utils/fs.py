@@ -5,7 +5,7 @@ import shutil
 import stat
 import sys
 from contextlib import contextmanager, suppress
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Tuple
 
 from dvc.exceptions import DvcException
 from dvc.system import System
@@ -28,37 +28,229 @@ def get_inode(path):
     return inode
 
 
-def get_mtime_and_size(path, fs, dvcignore=None):
-    import nanotime
+def get_mtime_and_size(path, fs, dvcignore=None, state=None):
+    """Return (mtime, size) of a file or a directory.
+
+    For local directories, `state` can be specified to keep summaries of
+    the walked directories, so that unchanged ones don't need to be listed
+    again (see `_get_summarized_dir_mtime_and_size`).
+    """
+    from dvc.fs.local import LocalFileSystem
 
     if fs.isdir(path):
-        size = 0
-        files_mtimes = {}
+        if isinstance(fs, LocalFileSystem):
+            if state is not None:
+                return _get_summarized_dir_mtime_and_size(
+                    path, dvcignore, state
+                )
+            if dvcignore:
+                entries = dvcignore.scan(fs, path)
+            else:
+                entries = fs.scan(path)
+            return get_dir_mtime_and_size(
+                (entry.path, entry.mtime, entry.size) for entry in entries
+            )
+
         if dvcignore:
             walk_iterator = dvcignore.find(fs, path)
         else:
             walk_iterator = fs.find(path)
-        for file_path in walk_iterator:
+        return get_dir_mtime_and_size(_iter_file_stats(fs, walk_iterator))
+
+    base_stat = fs.info(path)
+    return get_file_mtime_and_size(base_stat["mtime"], base_stat["size"])
+
+
+def _iter_file_stats(fs, paths):
+    for file_path in paths:
+        try:
+            stats = fs.info(file_path)
+        except OSError as exc:
+            # NOTE: broken symlink case.
+            if exc.errno != errno.ENOENT:
+                raise
+            continue
+        yield file_path, stats["mtime"], stats["size"]
+
+
+def get_file_mtime_and_size(mtime, size):
+    import nanotime
+
+    return str(int(nanotime.timestamp(mtime))), size
+
+
+def get_dir_mtime_and_size(file_stats):
+    """Compute mtime and size of a directory from the (path, mtime, size)
+    stats of its files."""
+    size = 0
+    files_mtimes = {}
+    for file_path, mtime, file_size in file_stats:
+        size += file_size
+        files_mtimes[file_path] = mtime
+
+    # We track file changes and moves, which cannot be detected with simply
+    # max(mtime(f) for f in non_ignored_files)
+    return str(dict_md5(files_mtimes)), size
+
+
+# NOTE: filesystems update mtimes with a coarse granularity, so a directory
+# modified right after it was listed could keep the same mtime. Summaries
+# that are too close to the time of the listing are not trusted.
+DIR_SUMMARY_RACY_WINDOW_NS = 2 * 10 ** 9
+
+
+class DirSummary(NamedTuple):
+    """Listing of a local directory, along with its own stat results and
+    the (name, mtime, size) stats of its files.
+
+    Subdirectories that are symlinks are also listed in `links`, as they
+    are not walked into.
+    """
+
+    inode: int
+    mtime: int
+    ctime: int
+    time: int
+    dirs: Tuple[str, ...]
+    files: Tuple[Tuple[str, int, int], ...]
+    links: Tuple[str, ...]
+
+    @classmethod
+    def from_json(cls, raw) -> "DirSummary":
+        inode, mtime, ctime, time_ns, dirs, files, links = raw
+        return cls(
+            inode,
+            mtime,
+            ctime,
+            time_ns,
+            tuple(dirs),
+            tuple(tuple(stats) for stats in files),
+            tuple(links),
+        )
+
+    def matches(self, st: os.stat_result) -> bool:
+        """Whether the directory is unchanged since it was listed."""
+        return (
+            self.inode == st.st_ino
+            and self.mtime == st.st_mtime_ns
+            and self.ctime == st.st_ctime_ns
+            and max(st.st_mtime_ns, st.st_ctime_ns)
+            < self.time - DIR_SUMMARY_RACY_WINDOW_NS
+        )
+
+
+def _list_dir(path: str, st: os.stat_result, time_ns: int) -> DirSummary:
+    dirs: List[str] = []
+    files: List[Tuple[str, int, int]] = []
+    links: List[str] = []
+    with os.scandir(path) as it:
+        for entry in it:
             try:
-                stats = fs.info(file_path)
-            except OSError as exc:
-                # NOTE: broken symlink case.
-                if exc.errno != errno.ENOENT:
-                    raise
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                dirs.append(entry.name)
+                if entry.is_symlink():
+                    links.append(entry.name)
                 continue
-            size += stats["size"]
-            files_mtimes[file_path] = stats["mtime"]
-
-        # We track file changes and moves, which cannot be detected with simply
-        # max(mtime(f) for f in non_ignored_files)
-        mtime = dict_md5(files_mtimes)
-    else:
-        base_stat = fs.info(path)
-        size = base_stat["size"]
-        mtime = base_stat["mtime"]
-        mtime = int(nanotime.timestamp(mtime))
+            try:
+                file_st = entry.stat()
+            except FileNotFoundError:
+                # broken symlink or the file was removed in the meantime
+                continue
+            files.append((entry.name, file_st.st_mtime_ns, file_st.st_size))
+    return DirSummary(
+        st.st_ino,
+        st.st_mtime_ns,
+        st.st_ctime_ns,
+        time_ns,
+        tuple(sorted(dirs)),
+        tuple(sorted(files)),
+        tuple(links),
+    )
+
+
+def _stat_files(dirname, files):
+    ret = []
+    for name, _, _ in files:
+        try:
+            st = os.stat(f"{dirname}{os.sep}{name}")
+        except FileNotFoundError:
+            # broken symlink or the file was removed in the meantime
+            continue
+        ret.append((name, st.st_mtime_ns, st.st_size))
+    return ret
+
+
+def _get_summarized_dir_mtime_and_size(path, dvcignore, state):
+    """Compute mtime and size of a local directory, listing only the
+    directories which have changed since the last time.
+
+    Listings of directories, along with the stats of their files, are kept
+    in `state` and reused while the directory's own inode, mtime and ctime
+    stay the same. Those change when entries are added, removed or renamed
+    (which is how files are replaced by dvc itself and by most editors),
+    but not when a file is modified in place, so the files of unchanged
+    directories are still stat-ed, unless `state.trust_dir_mtime` is set.
+    In that case an unchanged tree only takes a single `stat` per
+    directory, and in-place modifications are only noticed once something
+    else changes in the same directory.
+    """
+    import hashlib
+    import time
+
+    root = os.path.abspath(path)
+    summaries: Dict[str, DirSummary] = state.get_dir_summaries(root)
+    listed: Dict[str, DirSummary] = {}
+    visited = set()
+    now = time.time_ns()
+
+    size = 0
+    digest = hashlib.md5()
+    stack = [root]
+    while stack:
+        dirname = stack.pop()
+        try:
+            st = os.stat(dirname)
+            summary = summaries.get(dirname)
+            if summary is None or not summary.matches(st):
+                summary = listed[dirname] = _list_dir(dirname, st, now)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        visited.add(dirname)
+
+        dirs = list(summary.dirs)
+        files = summary.files
+        if dvcignore:
+            names = [name for name, _, _ in files]
+            dirs[:], names = dvcignore(dirname, dirs, names)
+            kept = set(names)
+            files = tuple(stats for stats in files if stats[0] in kept)
+        if dirname not in listed and not state.trust_dir_mtime:
+            files = _stat_files(dirname, files)
+
+        # NOTE: entries are sorted, so the digest doesn't depend on the
+        # order in which they are listed
+        rel = os.path.relpath(dirname, root)
+        lines = []
+        for name, mtime, file_size in files:
+            size += file_size
+            lines.append(f"{rel}/{name}\0{mtime}\0{file_size}\n")
+        digest.update("".join(lines).encode("utf-8", "surrogateescape"))
+
+        links = summary.links
+        stack.extend(
+            os.path.join(dirname, dname)
+            for dname in reversed(dirs)
+            if dname not in links
+        )
 
-    return str(mtime), size
+    # summaries of the directories that were removed or are ignored now
+    removed = [dirname for dirname in summaries if dirname not in visited]
+    if listed or removed:
+        state.save_dir_summaries(listed, removed)
+    return digest.hexdigest(), size
 
 
 class BasePathNotInCheckedPathException(DvcException):
@@ -1,22 +1,24 @@
-import hashlib
 import io
 
 from funcy import cached_property
 
 from dvc.hash_info import HashInfo
 from dvc.istextfile import DEFAULT_CHUNK_SIZE, istextblock
-from dvc.utils import dos2unix
+from dvc.utils import dos2unix, get_hasher
 
 
 class HashedStreamReader(io.IOBase):
 
     PARAM_CHECKSUM = "md5"
 
-    def __init__(self, fobj):
+    def __init__(self, fobj, name=PARAM_CHECKSUM):
         self.fobj = fobj
-        self.md5 = hashlib.md5()
+        self.name = name
+        self.hasher = get_hasher(name)
         self.total_read = 0
-        self.is_text_file = None
+        # NOTE: only md5 normalizes line endings of text files, see
+        # `dvc.utils.file_hash()`
+        self.is_text_file = None if name == "md5" else False
         super().__init__()
 
     def readable(self):
@@ -36,15 +38,15 @@ class HashedStreamReader(io.IOBase):
         if self.is_text_file is None:
             self.is_text_file = istextblock(chunk[:DEFAULT_CHUNK_SIZE])
 
-        if self.is_text_file:
+        if self.is_text_file and b"\r\n" in chunk:
             data = dos2unix(chunk)
         else:
             data = chunk
-        self.md5.update(data)
+        self.hasher.update(data)
         self.total_read += len(data)
 
         return chunk
 
     @property
     def hash_info(self):
-        return HashInfo(self.PARAM_CHECKSUM, self.md5.hexdigest())
+        return HashInfo(self.name, self.hasher.hexdigest())
@@ -0,0 +1,31 @@
+import time
+
+import pytest
+
+_RESULTS = []
+
+
+@pytest.fixture
+def bench(request):
+    """Call a function several times and record the best time."""
+
+    def _bench(func, *args, rounds=3, **kwargs):
+        times = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            times.append(time.perf_counter() - start)
+        _RESULTS.append((request.node.nodeid, min(times)))
+        return result
+
+    return _bench
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _RESULTS:
+        return
+
+    terminalreporter.section("benchmarks")
+    width = max(len(name) for name, _ in _RESULTS)
+    for name, best in _RESULTS:
+        terminalreporter.write_line(f"{name:<{width}}  {best:10.4f}s")
@@ -0,0 +1,36 @@
+import hashlib
+import io
+import random
+
+import pytest
+
+from dvc.objects.chunked import split
+
+pytestmark = pytest.mark.benchmark
+
+MB = 2 ** 20
+
+
+def _gen(size, kind):
+    if kind == "binary":
+        return random.Random(0).getrandbits(size * 8).to_bytes(size, "big")
+    line = b"".join(
+        f"{i},{i * 7919 % 10007},name{i}\n".encode() for i in range(MB)
+    )
+    return (line * (size // len(line) + 1))[:size]
+
+
+@pytest.mark.parametrize("kind", ["binary", "text"])
+def test_split(bench, kind):
+    data = _gen(64 * MB, kind)
+
+    def run():
+        return list(split(io.BytesIO(data)))
+
+    assert b"".join(bench(run)) == data
+
+
+def test_md5(bench):
+    # baseline for `test_split`
+    data = _gen(64 * MB, "binary")
+    assert bench(lambda: hashlib.md5(data).hexdigest())
@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from dvc.fs.local import localfs
+from dvc.utils import file_hash, file_md5
+
+pytestmark = pytest.mark.benchmark
+
+KB = 2 ** 10
+MB = 2 ** 20
+GB = 2 ** 30
+
+TEXT_LINE = b"id,name,value\r\n"
+
+
+def _gen(path, size, kind):
+    with open(path, "wb") as fobj:
+        if kind == "binary":
+            # NOTE: sparse, so that even the largest files are cheap to
+            # create (null bytes make them binary)
+            fobj.truncate(size)
+            return
+        block = TEXT_LINE * (MB // len(TEXT_LINE))
+        while size > 0:
+            fobj.write(block[:size])
+            size -= len(block)
+
+
+@pytest.mark.parametrize("kind", ["binary", "text"])
+@pytest.mark.parametrize(
+    "size",
+    [KB, MB, 100 * MB, GB, 10 * GB],
+    ids=["1KB", "1MB", "100MB", "1GB", "10GB"],
+)
+def test_file_md5(tmp_path, bench, size, kind):
+    if kind == "text" and size > GB:
+        pytest.skip("not generating huge text files")
+
+    path = os.fspath(tmp_path / "data")
+    _gen(path, size, kind)
+    rounds = 1 if size >= GB else 3
+    assert bench(file_md5, path, localfs, rounds=rounds)
+
+
+@pytest.mark.parametrize("kind", ["binary", "text"])
+def test_file_md5_many_small(tmp_path, bench, kind):
+    paths = []
+    for i in range(10_000):
+        path = os.fspath(tmp_path / str(i))
+        _gen(path, KB, kind)
+        paths.append(path)
+
+    def run():
+        return [file_md5(path, localfs) for path in paths]
+
+    assert len(set(bench(run))) == 1
+
+
+@pytest.mark.parametrize("name", ["md5", "sha256", "blake3"])
+def test_file_hash(tmp_path, bench, name):
+    if name == "blake3":
+        pytest.importorskip("blake3")
+
+    path = os.fspath(tmp_path / "data")
+    _gen(path, GB, "binary")
+    assert bench(file_hash, path, localfs, name, rounds=1)
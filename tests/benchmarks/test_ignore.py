@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from dvc.fs.local import localfs
+from dvc.ignore import DvcIgnoreFilter
+
+pytestmark = pytest.mark.benchmark
+
+DVCIGNORE = """\
+*.tmp
+!keep*.tmp
+tmp/
+/notes1.csv
+logs/**/*.log
+*.bak
+"""
+
+
+def _walk(dvcignore, root, files, depth, fanout):
+    """Walk a synthetic tree, where every directory has `fanout`
+    subdirectories (and an ignored `tmp` one) up to `depth` levels."""
+    count = 0
+    stack = [(root, 0)]
+    while stack:
+        path, level = stack.pop()
+        dirs = [f"dir{i}" for i in range(fanout)] + ["tmp"]
+        dirs, kept = dvcignore(path, dirs if level < depth else [], files)
+        count += len(kept)
+        stack.extend((os.path.join(path, d), level + 1) for d in dirs)
+    return count
+
+
+@pytest.mark.parametrize("nfiles", [100_000, 1_000_000])
+def test_dvcignore_filter(tmp_path, bench, nfiles):
+    depth, fanout = 6, 4
+    ndirs = sum(fanout ** level for level in range(depth + 1))
+    names = ["data", "keep", "notes"]
+    exts = [".csv", ".tmp", ".bak", ".log"]
+    files = [
+        f"{names[i % len(names)]}{i}{exts[i % len(exts)]}"
+        for i in range(max(nfiles // ndirs, 1))
+    ]
+
+    # deeply nested .dvcignore files along the first branch of the tree
+    path = os.fspath(tmp_path)
+    for level in range(depth + 1):
+        with open(os.path.join(path, ".dvcignore"), "w") as fobj:
+            fobj.write(DVCIGNORE)
+            fobj.write(f"data{level}*\n")
+        path = os.path.join(path, "dir0")
+        os.mkdir(path)
+
+    def run():
+        dvcignore = DvcIgnoreFilter(localfs, os.fspath(tmp_path))
+        return _walk(dvcignore, os.fspath(tmp_path), files, depth, fanout)
+
+    assert 0 < bench(run) < ndirs * len(files)
@@ -84,6 +84,12 @@ def pytest_addoption(parser):
         default=False,
         help="Test all of the remotes, unless other flags also supplied",
     )
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        default=False,
+        help="Run benchmarks",
+    )
     for remote_name in REMOTES:
         for action in ("enable", "disable"):
             opt = _get_opt(remote_name, action)
@@ -117,6 +123,10 @@ def pytest_runtest_setup(item):
     for marker in item.iter_markers():
         item.config.dvc_config.apply_marker(marker)
 
+    is_benchmark = item.get_closest_marker("benchmark") is not None
+    if is_benchmark and not item.config.getoption("--benchmarks"):
+        pytest.skip("benchmarks not enabled through CLI")
+
     if (
         "CI" in os.environ
         and item.get_closest_marker("needs_internet") is not None
@@ -348,6 +348,50 @@ def test_show_multiple_commits(tmp_dir, scm, dvc, exp_stage):
     assert set(results.keys()) == expected
 
 
+def test_show_jobs(tmp_dir, scm, dvc, exp_stage):
+    tmp_dir.scm_gen("file", "file", "commit")
+    dvc.experiments.run(exp_stage.addressing, params=["foo=2"])
+    dvc.experiments.run(exp_stage.addressing, params=["foo=3"])
+
+    expected = dvc.experiments.show(all_commits=True)
+    assert dvc.experiments.show(all_commits=True, jobs=2) == expected
+
+
+def test_show_table_cache(tmp_dir, scm, dvc, exp_stage, mocker):
+    from dvc.repo.experiments import show
+
+    results = dvc.experiments.run(exp_stage.addressing, params=["foo=2"])
+    exp_a = first(results)
+    ref_info_a = first(exp_refs_by_rev(scm, exp_a))
+    baseline = scm.get_rev()
+
+    expected = dvc.experiments.show()
+    collect = mocker.spy(show, "_collect_commit")
+    branch_revs = mocker.spy(scm, "branch_revs")
+    assert dvc.experiments.show() == expected
+    # only the workspace is collected again
+    assert collect.call_count == 1
+    assert branch_revs.call_count == 0
+
+    results = dvc.experiments.run(exp_stage.addressing, params=["foo=3"])
+    exp_b = first(results)
+    collect.reset_mock()
+    branch_revs.reset_mock()
+    result = dvc.experiments.show()
+    assert collect.call_count == 2
+    assert branch_revs.call_count == 1
+    assert result[baseline][exp_a] == expected[baseline][exp_a]
+    assert get_in(result, [baseline, exp_b, "data", "params"]) == {
+        "params.yaml": {"data": {"foo": 3}}
+    }
+    assert get_in(result, [baseline, exp_b, "data", "name"]) == (
+        first(exp_refs_by_rev(scm, exp_b)).name
+    )
+    assert get_in(result, [baseline, exp_a, "data", "name"]) == (
+        ref_info_a.name
+    )
+
+
 def test_show_sort(tmp_dir, scm, dvc, exp_stage, caplog):
     with caplog.at_level(logging.ERROR):
         assert main(["exp", "show", "--no-pager", "--sort-by=bar"]) != 0
@@ -6,7 +6,7 @@ from funcy import get_in
 
 from dvc.dvcfile import PIPELINE_FILE
 from dvc.exceptions import OverlappingOutputPathsError
-from dvc.repo import Repo
+from dvc.repo import Repo, brancher
 from dvc.utils.fs import remove
 from dvc.utils.serialize import YAMLFileCorruptedError
 
@@ -60,6 +60,58 @@ def test_show_branch(tmp_dir, scm, dvc, run_copy_metrics):
     }
 
 
+def test_show_jobs(tmp_dir, scm, dvc, run_copy_metrics, mocker):
+    tmp_dir.gen("metrics_temp.yaml", "foo: 1")
+    run_copy_metrics(
+        "metrics_temp.yaml",
+        "metrics.yaml",
+        metrics_no_cache=["metrics.yaml"],
+        commit="init",
+    )
+    tmp_dir.scm_gen("metrics.yaml", "foo: 2", commit="second")
+    tmp_dir.scm_gen("metrics.yaml", "foo: 3", commit="third")
+    tmp_dir.gen("metrics.yaml", "foo: 4")
+
+    expected = dvc.metrics.show(all_commits=True)
+    assert len(expected) == 5
+
+    spy = mocker.spy(brancher, "_can_fork")
+    result = dvc.metrics.show(all_commits=True, jobs=2)
+    assert spy.spy_return
+    assert result == expected
+    assert list(result) == list(expected)
+
+
+def test_show_parse_cache(tmp_dir, scm, dvc, run_copy_metrics, mocker):
+    from dvc.utils.serialize import _yaml
+
+    tmp_dir.gen("metrics_temp.yaml", "foo: 1")
+    run_copy_metrics(
+        "metrics_temp.yaml",
+        "metrics.yaml",
+        metrics_no_cache=["metrics.yaml"],
+        commit="init",
+    )
+    tmp_dir.scm_gen("other", "other", commit="other")
+    tmp_dir.scm_gen("metrics.yaml", "foo: 2", commit="metrics")
+
+    def parsed():
+        spy = mocker.spy(_yaml, "parse_yaml")
+        result = dvc.metrics.show(all_commits=True)
+        paths = [os.path.basename(call.args[1]) for call in spy.call_args_list]
+        mocker.stop(spy)
+        return result, paths
+
+    expected, paths = parsed()
+    # identical files from "init" and "other" commits are parsed once
+    assert paths.count("metrics.yaml") == 3
+
+    result, paths = parsed()
+    assert result == expected
+    # only the workspace is parsed again
+    assert paths == ["metrics.yaml"]
+
+
 def test_show_subrepo_with_preexisting_tags(tmp_dir, scm):
     tmp_dir.gen("foo", "foo")
     scm.add("foo")
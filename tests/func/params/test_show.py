@@ -97,6 +97,25 @@ def test_show_branch(tmp_dir, scm, dvc):
     }
 
 
+def test_show_parse_cache(tmp_dir, scm, dvc, mocker):
+    from dvc.utils.serialize import _yaml
+
+    tmp_dir.scm_gen("params.yaml", "foo: bar", commit="init")
+    tmp_dir.scm_gen("other", "other", commit="other")
+    revs = ["HEAD", "HEAD~1"]
+
+    expected = dvc.params.show(revs=revs)
+    assert expected == {
+        rev: {"data": {"params.yaml": {"data": {"foo": "bar"}}}}
+        for rev in ["workspace"] + revs
+    }
+
+    spy = mocker.spy(_yaml, "parse_yaml")
+    assert dvc.params.show(revs=revs) == expected
+    # only the workspace is parsed again
+    assert spy.call_count == 1
+
+
 def test_pipeline_params(tmp_dir, scm, dvc, run_copy):
     tmp_dir.gen(
         {"foo": "foo", "params.yaml": "foo: bar\nxyz: val\nabc: ignore"}
@@ -43,3 +43,19 @@ def test_diff_dirty(tmp_dir, scm, dvc, run_copy_metrics):
             "data": {"metric.json": {"data": metric_head, "props": props}}
         },
     }
+
+
+def test_diff_jobs(tmp_dir, scm, dvc, run_copy_metrics):
+    for i in range(3):
+        (tmp_dir / "metric_t.json").dump([{"y": i}], sort_keys=True)
+        run_copy_metrics(
+            "metric_t.json",
+            "metric.json",
+            plots_no_cache=["metric.json"],
+            commit=f"commit {i}",
+        )
+
+    revs = ["HEAD", "HEAD~1", "HEAD~2"]
+    expected = dvc.plots.diff(revs=revs)
+    assert list(expected) == revs
+    assert dvc.plots.diff(revs=revs, jobs=2) == expected
@@ -36,7 +36,7 @@ from dvc.stage.exceptions import (
 from dvc.system import System
 from dvc.testing.test_workspace import TestAdd
 from dvc.utils import LARGE_DIR_SIZE, file_md5, relpath
-from dvc.utils.fs import path_isin
+from dvc.utils.fs import path_isin, remove
 from dvc.utils.serialize import YAMLFileCorruptedError, load_yaml
 from tests.basic_env import TestDvc
 from tests.utils import get_gitignore_content
@@ -118,6 +118,25 @@ def test_add_directory(tmp_dir, dvc):
             assert "\\" not in part
 
 
+def test_add_directory_with_process_hash_backend(tmp_dir, dvc, mocker):
+    from dvc.objects import load
+
+    (thread_stage,) = tmp_dir.dvc_gen(
+        {"dir": {"foo": "foo", "sub": {"bar": "bar"}}}
+    )
+
+    dvc.config["core"]["hash_backend"] = "process"
+    tmp_dir.gen({"other": {"foo": "foo", "sub": {"bar": "bar"}}})
+    spy = mocker.spy(dvc.state, "save_many")
+    (stage,) = dvc.add("other")
+
+    assert stage.outs[0].fs.hash_backend == "process"
+    assert stage.outs[0].hash_info == thread_stage.outs[0].hash_info
+    assert len(load(dvc.odb.local, stage.outs[0].hash_info)) == 2
+    assert spy.called
+    assert dvc.status() == {}
+
+
 class TestAddDirectoryRecursive(TestDvc):
     def test(self):
         stages = self.dvc.add(self.DATA_DIR, recursive=True)
@@ -378,7 +397,7 @@ class TestDoubleAddUnchanged(TestDvc):
 
 
 def test_should_update_state_entry_for_file_after_add(mocker, dvc, tmp_dir):
-    file_md5_counter = mocker.spy(dvc_module.objects.stage, "file_md5")
+    file_md5_counter = mocker.spy(dvc_module.objects.stage, "file_hash")
     tmp_dir.gen("foo", "foo")
 
     ret = main(["config", "cache.type", "copy"])
@@ -409,7 +428,7 @@ def test_should_update_state_entry_for_file_after_add(mocker, dvc, tmp_dir):
 def test_should_update_state_entry_for_directory_after_add(
     mocker, dvc, tmp_dir
 ):
-    file_md5_counter = mocker.spy(dvc_module.objects.stage, "file_md5")
+    file_md5_counter = mocker.spy(dvc_module.objects.stage, "file_hash")
 
     tmp_dir.gen({"data/data": "foo", "data/data_sub/sub_data": "foo"})
 
@@ -1154,3 +1173,76 @@ def test_add_ignore_duplicated_targets(tmp_dir, dvc, capsys):
     _, err = capsys.readouterr()
     assert len(stages) == 3
     assert "ignoring duplicated targets: foo, bar" in err
+
+
+@pytest.mark.parametrize("hash_name", ["md5", "sha256"])
+def test_add_chunked_file(tmp_dir, dvc, mocker, local_cloud, hash_name):
+    from dvc.objects import chunked
+
+    mocker.patch.object(chunked, "CHUNK_MIN_SIZE", 1024)
+    mocker.patch.object(chunked, "CHUNK_MAX_SIZE", 4096)
+    dvc.odb.local.chunk_threshold = 1024
+    dvc.odb.local.hash_name = hash_name
+    dvc.config["remote"]["upstream"] = local_cloud.config
+    dvc.config["core"]["remote"] = "upstream"
+
+    data = os.urandom(64 * 1024)
+    tmp_dir.gen("data", data)
+    (stage,) = dvc.add("data")
+    hash_info = stage.outs[0].hash_info
+    assert hash_info.ischunked
+    assert hash_info.name == hash_name
+
+    obj = chunked.ChunkedFile.load(dvc.odb.local, hash_info)
+    assert len(list(obj)) > 1
+    assert {oid.name for _, _, oid in obj} == {hash_name}
+    assert obj.size == len(data)
+    with dvc.fs.open(tmp_dir / "data", "rb") as fobj:
+        assert fobj.read() == data
+    assert dvc.status() == {}
+
+    dvc.gc(workspace=True, force=True)
+    assert dvc.status() == {}
+
+    assert dvc.push() == len(list(obj)) + 1
+    remove(dvc.odb.local.cache_dir)
+    (tmp_dir / "data").unlink()
+    assert dvc.pull()["added"] == ["data"]
+    assert (tmp_dir / "data").read_bytes() == data
+
+
+def test_add_with_sha256_hash(tmp_dir, dvc, local_cloud):
+    import hashlib
+
+    from dvc.objects import load
+
+    (foo_stage,) = tmp_dir.dvc_gen("foo", "foo")
+    dvc.odb.local.hash_name = "sha256"
+    dvc.config["remote"]["upstream"] = local_cloud.config
+    dvc.config["core"]["remote"] = "upstream"
+
+    (stage,) = tmp_dir.dvc_gen({"dir": {"bar": "bar\r\n", "sub": {"baz": ""}}})
+    hash_info = stage.outs[0].hash_info
+    assert hash_info.name == "sha256"
+    assert hash_info.isdir
+    assert (tmp_dir / "dir.dvc").parse()["outs"][0]["sha256"] == (
+        hash_info.value
+    )
+    obj = load(dvc.odb.local, hash_info)
+    assert {key: oid for key, _, oid in obj} == {
+        ("bar",): HashInfo("sha256", hashlib.sha256(b"bar\r\n").hexdigest()),
+        ("sub", "baz"): HashInfo("sha256", hashlib.sha256(b"").hexdigest()),
+    }
+
+    # existing outputs keep their hash until they are added again
+    assert foo_stage.outs[0].hash_info.name == "md5"
+    assert dvc.status() == {}
+    (foo_stage,) = dvc.add("foo")
+    assert foo_stage.outs[0].hash_info.name == "sha256"
+
+    assert dvc.push() == 4
+    remove(dvc.odb.local.cache_dir)
+    remove(tmp_dir / "dir")
+    assert dvc.pull()["added"] == [os.path.join("dir", "")]
+    assert (tmp_dir / "dir" / "bar").read_bytes() == b"bar\r\n"
+    assert dvc.status() == {}
@@ -994,3 +994,47 @@ def test_checkout_dir_compat(tmp_dir, dvc):
     remove("data")
     dvc.checkout()
     assert (tmp_dir / "data").read_text() == {"foo": "foo"}
+
+
+def test_checkout_large_dir_checks_only_changes(tmp_dir, dvc, mocker):
+    from dvc.objects.db.local import LocalObjectDB
+
+    files = {f"file{i}": f"content{i}" for i in range(300)}
+    tmp_dir.dvc_gen({"dir": files})
+    (tmp_dir / "dir" / "file0").unlink()
+    (tmp_dir / "dir" / "file1").unlink()
+
+    check = mocker.spy(LocalObjectDB, "check")
+    list_hashes = mocker.spy(LocalObjectDB, "_list_hashes")
+    stats = dvc.checkout(force=True)
+
+    assert stats["modified"] == [os.path.join("dir", "")]
+    assert (tmp_dir / "dir" / "file0").read_text() == "content0"
+    # only the root and restored entries are checked one by one, the rest
+    # are checked by listing the cache
+    assert check.call_count < 10
+    assert list_hashes.called
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_checkout_jobs(tmp_dir, dvc, mocker, jobs):
+    from dvc.state import State
+
+    files = {f"sub{i % 3}": {f"file{i}": f"content{i}"} for i in range(3)}
+    files["sub0"].update({f"file{i}": f"content{i}" for i in range(3, 20)})
+    tmp_dir.dvc_gen({"dir": files})
+    remove("dir")
+
+    save_many = mocker.spy(State, "save_many")
+    save = mocker.spy(State, "save")
+    stats = dvc.checkout("dir", jobs=jobs)
+
+    assert stats["added"] == [os.path.join("dir", "")]
+    assert (tmp_dir / "dir").read_text() == files
+    # only the directory itself is saved on its own, files are saved in bulk
+    assert save.call_count == 1
+    assert save_many.called
+    _, hash_info = dvc.state.get(
+        os.path.join(tmp_dir, "dir", "sub0", "file3"), dvc.fs
+    )
+    assert hash_info.value == "c96310e55d9677b978eae0dada47642c"
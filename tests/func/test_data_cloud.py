@@ -7,6 +7,7 @@ from flaky.flaky_decorator import flaky
 
 import dvc as dvc_module
 from dvc.external_repo import clean_repos
+from dvc.hash_info import HashInfo
 from dvc.main import main
 from dvc.stage.exceptions import StageNotFound
 from dvc.testing.test_remote import (  # noqa, pylint: disable=unused-import
@@ -107,7 +108,7 @@ def test_warn_on_outdated_stage(tmp_dir, dvc, local_remote, caplog):
 
 def test_hash_recalculation(mocker, dvc, tmp_dir, local_remote):
     tmp_dir.gen({"foo": "foo"})
-    test_file_md5 = mocker.spy(dvc_module.objects.stage, "file_md5")
+    test_file_md5 = mocker.spy(dvc_module.objects.stage, "file_hash")
     ret = main(["config", "cache.type", "hardlink"])
     assert ret == 0
     ret = main(["add", "foo"])
@@ -169,7 +170,7 @@ def test_verify_hashes(
     remove("dir")
     remove(dvc.odb.local.cache_dir)
 
-    hash_spy = mocker.spy(dvc_module.objects.stage, "file_md5")
+    hash_spy = mocker.spy(dvc_module.objects.stage, "file_hash")
 
     dvc.pull()
     assert hash_spy.call_count == 0
@@ -528,3 +529,153 @@ def test_target_remote(tmp_dir, dvc, make_remote):
         "6b18131dc289fd37006705affe961ef8.dir",
         "b8a9f715dbb64fd5c56e7783c6820a61",
     }
+
+
+def test_remote_snapshot(tmp_dir, dvc, local_remote, mocker):
+    from dvc.objects.db import get_snapshot
+
+    tmp_dir.dvc_gen({"foo": "foo", "dir": {"bar": "bar"}})
+    assert dvc.push() == 3
+
+    odb = dvc.cloud.get_remote_odb()
+    snapshot = get_snapshot(odb)
+    assert set(snapshot) == set(odb.all())
+
+    hashes_exist = mocker.spy(type(odb), "hashes_exist")
+    list_hashes = mocker.spy(type(odb), "_list_hashes")
+    assert dvc.status(cloud=True) == {}
+    # the remote is never queried, only the local cache is
+    assert all(
+        call.args[0].fs_path != odb.fs_path
+        for call in hashes_exist.call_args_list
+    )
+    assert not list_hashes.called
+
+    # objects removed from the remote behind our back are detected
+    remove(local_remote.url)
+    assert dvc.status(cloud=True) == {
+        "foo": "new",
+        "dir": "new",
+        "dir/bar": "new",
+    }
+    assert not list(snapshot)
+
+    assert dvc.push() == 3
+    assert dvc.status(cloud=True, refresh_remote_index=True) == {}
+    # NOTE: the mock's call_count isn't updated atomically, while prefixes
+    # are listed from multiple threads
+    assert {call.args[1] for call in list_hashes.call_args_list} == {
+        f"{i:02x}" for i in range(256)
+    }
+    assert set(snapshot) == set(odb.all())
+
+    # a single snapshot is reused for the ODB until the repo is closed
+    # pylint: disable=protected-access
+    cached = dvc.cloud._get_snapshot(odb)
+    assert cached is dvc.cloud._get_snapshot(odb)
+    dvc.close()
+    assert cached._conn is None
+
+
+def test_pack_small_objects(tmp_dir, dvc, local_remote):
+    from dvc.objects.db.pack import INDEX_SUFFIX, PACK_SUFFIX, PACKS_DIR
+
+    dvc.config["remote"]["upstream"]["pack_threshold"] = 10
+    tmp_dir.dvc_gen(
+        {
+            "dir": {"foo": "foo", "bar": "bar", "data": "large enough"},
+            "baz": "baz",
+        }
+    )
+    assert dvc.push() == 5
+
+    packs = local_remote / PACKS_DIR
+    assert {path.suffix for path in packs.iterdir()} == {
+        PACK_SUFFIX,
+        INDEX_SUFFIX,
+    }
+    odb = dvc.cloud.get_remote_odb()
+    # .dir object, "large enough" and a lone "baz" are stored as loose
+    # objects, while "foo" and "bar" are packed
+    assert len(set(odb.all())) == 3
+    assert len(set(odb.packs)) == 2
+    assert dvc.status(cloud=True) == {}
+
+    remove(dvc.odb.local.cache_dir)
+    remove("dir")
+    remove("baz")
+    dvc.pull()
+    assert (tmp_dir / "dir").read_text() == {
+        "foo": "foo",
+        "bar": "bar",
+        "data": "large enough",
+    }
+    assert (tmp_dir / "baz").read_text() == "baz"
+
+    (tmp_dir / "dir.dvc").unlink()
+    dvc.gc(workspace=True, cloud=True, force=True)
+    assert not list(packs.iterdir())
+    assert dvc.status(cloud=True) == {}
+
+
+def test_pull_from_packed_remote(tmp_dir, dvc, local_remote, mocker):
+    tmp_dir.dvc_gen({"foo": "foo", "bar": "bar"})
+    # a remote without packs is only checked for them once
+    odb = dvc.cloud.get_remote_odb()
+    exists = mocker.spy(odb.fs, "exists")
+    find = mocker.spy(odb.fs, "find")
+    assert not odb.packs
+    assert not odb.packs
+    assert exists.call_count == 1
+    assert not find.called
+
+    dvc.config["remote"]["upstream"]["pack_threshold"] = 10
+    assert dvc.push() == 2
+    assert len(set(dvc.cloud.get_remote_odb().packs)) == 2
+
+    # packs are read without `pack_threshold` and without anything cached
+    # locally, e.g. by another client
+    del dvc.config["remote"]["upstream"]["pack_threshold"]
+    dvc.close()
+    remove(dvc.odb.local.cache_dir)
+    remove(os.path.join(dvc.index_db_dir, "index"))
+    remove("foo")
+    remove("bar")
+    dvc.pull()
+    assert (tmp_dir / "foo").read_text() == "foo"
+    assert (tmp_dir / "bar").read_text() == "bar"
+
+
+def test_packed_objects_are_streamed(tmp_dir, dvc, local_remote):
+    dvc.config["remote"]["upstream"]["pack_threshold"] = 100
+    tmp_dir.dvc_gen({"foo": "foo" * 10, "bar": "bar"})
+    assert dvc.push() == 2
+
+    odb = dvc.cloud.get_remote_odb()
+    (hash_,) = (hash_ for hash_ in odb.packs if odb.packs.get(hash_)[2] == 30)
+    obj = odb.get(HashInfo("md5", hash_))
+    with obj.fs.open(obj.fs_path, "rb") as fobj:
+        assert fobj.seekable()
+        fobj.seek(27)
+        assert fobj.read() == b"foo"
+        fobj.seek(0)
+        assert fobj.read(6) == b"foofoo"
+
+
+def test_gc_repacks_mostly_unused_packs(tmp_dir, dvc, local_remote):
+    dvc.config["remote"]["upstream"]["pack_threshold"] = 10
+    tmp_dir.dvc_gen({"foo": "foo", "bar": "bar", "baz": "baz"})
+    assert dvc.push() == 3
+    odb = dvc.cloud.get_remote_odb()
+    ((old_pack, hashes),) = odb.packs.packs().items()
+    assert len(hashes) == 3
+
+    (tmp_dir / "bar.dvc").unlink()
+    (tmp_dir / "baz.dvc").unlink()
+    dvc.gc(workspace=True, cloud=True, force=True)
+
+    odb = dvc.cloud.get_remote_odb()
+    ((new_pack, hashes),) = odb.packs.packs().items()
+    assert new_pack != old_pack
+    assert hashes == {"acbd18db4cc2f85cedef654fccc4a4d8"}
+    assert dvc.status(cloud=True) == {}
@@ -130,6 +130,44 @@ def test_walk_no_scm(tmp_dir):
     ]
 
 
+def test_scan(tmp_dir):
+    from dvc.system import System
+
+    tmp_dir.gen(
+        {
+            "foo": "foo",
+            "data_dir": {"data": "data", "sub": {"data_sub": "data_sub"}},
+        }
+    )
+    System.symlink(os.fspath(tmp_dir / "foo"), os.fspath(tmp_dir / "link"))
+    System.symlink(
+        os.fspath(tmp_dir / "data_dir"), os.fspath(tmp_dir / "dir_link")
+    )
+    System.symlink(
+        os.fspath(tmp_dir / "missing"), os.fspath(tmp_dir / "broken")
+    )
+
+    fs = LocalFileSystem()
+    entries = {entry.path: entry for entry in fs.scan(str(tmp_dir))}
+    assert set(entries) == set(fs.find(str(tmp_dir))) - {
+        str(tmp_dir / "broken")
+    }
+    for path, entry in entries.items():
+        info = fs.info(path)
+        assert entry.inode == System.inode(path)
+        assert entry.mtime == info["mtime"]
+        assert entry.size == info["size"]
+        assert entry.is_symlink == (path == str(tmp_dir / "link"))
+
+    walk_results = [
+        (root, dirs, [entry.name for entry in files])
+        for root, dirs, files in fs.walk_entries(str(tmp_dir))
+    ]
+    assert convert_to_sets(walk_results) == convert_to_sets(
+        fs.walk(str(tmp_dir))
+    )
+
+
 def test_walk_fs_with_git(tmp_dir, scm):
     tmp_dir.gen(
         {
@@ -367,3 +405,34 @@ def test_callback_on_repo_fs(tmp_dir, dvc, scm):
     assert (tmp_dir / "bar").read_text() == "bar"
     assert callback.size == size
     assert callback.value == size
+
+
+def test_git_fs_shares_trees_between_revs(tmp_dir, scm, mocker):
+    from dvc.fs.git import GitFileSystem
+
+    tmp_dir.scm_gen(
+        {"foo": "foo", "dir": {"bar": "bar", "sub": {"baz": "baz"}}},
+        commit="first",
+    )
+    tmp_dir.scm_gen("foo", "modified", commit="second")
+
+    def walk(rev):
+        fs = GitFileSystem(scm=scm, rev=rev)
+        return [
+            (os.path.relpath(root, tmp_dir), sorted(dirs), sorted(files))
+            for root, dirs, files in fs.walk(os.fspath(tmp_dir))
+        ]
+
+    expected = [
+        (".", ["dir"], ["foo"]),
+        ("dir", ["sub"], ["bar"]),
+        (os.path.join("dir", "sub"), [], ["baz"]),
+    ]
+    assert walk("HEAD~1") == expected
+
+    from scmrepo.git.backend.pygit2 import Pygit2Object
+
+    scandir = mocker.spy(Pygit2Object, "scandir")
+    assert walk("HEAD") == expected
+    # only the root tree has changed
+    assert scandir.call_count == 1
@@ -194,6 +194,31 @@ def test_all_commits(tmp_dir, scm, dvc):
     assert _count_files(dvc.odb.local.cache_dir) == n - 1
 
 
+def test_all_commits_used_cache(tmp_dir, scm, dvc, mocker):
+    from dvc.repo.index import Index
+
+    tmp_dir.dvc_gen({"dir": {"x": "x"}}, commit="first")
+    tmp_dir.scm_gen("code", "code", commit="same dvcfiles")
+    tmp_dir.dvc_gen({"dir": {"x": "x", "y": "y"}}, commit="second")
+    tmp_dir.dvc_gen("foo", "uncommitted")
+    tmp_dir.dvc_gen("foo", "workspace")
+
+    used_objs = mocker.spy(Index, "used_objs")
+    n = _count_files(dvc.odb.local.cache_dir)
+    dvc.gc(all_commits=True)
+    # workspace, initial commit and both revisions of `dir`
+    assert used_objs.call_count == 4
+    assert _count_files(dvc.odb.local.cache_dir) == n - 1
+
+    used_objs.reset_mock()
+    tmp_dir.dvc_gen("foo", "modified")
+    n = _count_files(dvc.odb.local.cache_dir)
+    dvc.gc(all_commits=True)
+    # only the workspace
+    assert used_objs.call_count == 1
+    assert _count_files(dvc.odb.local.cache_dir) == n - 1
+
+
 def test_gc_no_dir_cache(tmp_dir, dvc):
     tmp_dir.dvc_gen({"foo": "foo", "bar": "bar"})
     (dir_stage,) = tmp_dir.dvc_gen({"dir": {"x": "x", "subdir": {"y": "y"}}})
@@ -317,11 +342,14 @@ def test_gc_cloud_remove_order(tmp_dir, scm, dvc, tmp_path_factory, mocker):
         LocalFileSystem, "remove", autospec=True
     )
     dvc.gc(workspace=True, cloud=True)
-    assert len(mocked_remove.mock_calls) == 8
+    removed = []
+    for args in mocked_remove.call_args_list:
+        path = args[0][1]
+        removed.extend(path if isinstance(path, list) else [path])
+    assert len(removed) == 8
     # dir (and unpacked dir) should be first 4 checksums removed from
     # the remote
-    for args in mocked_remove.call_args_list[:4]:
-        checksum = str(args[0][1])
+    for checksum in removed[:4]:
         assert checksum.endswith(".dir") or checksum.endswith(".dir.unpacked")
 
 
@@ -398,3 +426,43 @@ def test_gc_all_experiments(tmp_dir, scm, dvc):
     assert (
         tmp_dir / ".dvc" / "cache" / baz_hash[:2] / baz_hash[2:]
     ).read_text() == "baz"
+
+
+def test_gc_dry_run(tmp_dir, dvc, local_remote, caplog):
+    tmp_dir.dvc_gen({"foo": "foo", "dir": {"bar": "bar", "baz": "baz"}})
+    dvc.push()
+    dvc.remove("dir.dvc")
+    cache_files = _count_files(dvc.odb.local.cache_dir)
+    remote_files = _count_files(local_remote.url)
+
+    with caplog.at_level(logging.INFO, logger="dvc"):
+        assert main(["gc", "-wc", "--dry-run"]) == 0
+    assert "Would remove 3 unused objects (132B) from 'local' cache." in (
+        caplog.text
+    )
+    assert "Would remove 3 unused objects (132B) from remote." in caplog.text
+    assert _count_files(dvc.odb.local.cache_dir) == cache_files
+    assert _count_files(local_remote.url) == remote_files
+
+    dvc.gc(workspace=True, cloud=True, force=True)
+    assert _count_files(dvc.odb.local.cache_dir) == cache_files - 3
+    assert _count_files(local_remote.url) == remote_files - 3
+
+
+def test_gc_batches(tmp_dir, dvc, mocker):
+    mocker.patch.object(LocalObjectDB, "GC_BATCH_SIZE", 2)
+    (stage,) = tmp_dir.dvc_gen({"dir": {str(i): str(i) for i in range(5)}})
+    dvc.remove("dir.dvc")
+
+    remove = mocker.spy(LocalFileSystem, "remove")
+    dvc.gc(workspace=True, force=True)
+    # .dir object goes first, in a batch of its own
+    assert [args[0][1] for args in remove.call_args_list[-4:-3]] == [
+        [stage.outs[0].cache_path]
+    ]
+    assert [len(args[0][1]) for args in remove.call_args_list[-3:]] == [
+        2,
+        2,
+        1,
+    ]
+    assert _count_files(dvc.odb.local.cache_dir) == 0
@@ -292,3 +292,44 @@ def test_used_objs(tmp_dir, scm, dvc, run_copy, rev):
     assert index.used_objs("copy-foo-bar", with_deps=True) == {
         None: {expected_objs[0]}
     }
+
+
+def test_index_cache(tmp_dir, dvc, mocker):
+    from dvc.repo import Repo
+    from dvc.utils import strictyaml
+
+    # files are modified right after being cached here
+    mocker.patch("dvc.repo.index_cache.RACY_WINDOW_NS", 0)
+    tmp_dir.gen(".dvcignore", "# empty\n")
+    tmp_dir.dvc_gen({"foo": "foo", "dir": {"bar": "bar"}})
+    assert {stage.relpath for stage in Index(dvc).stages} == {
+        "foo.dvc",
+        "dir.dvc",
+    }
+
+    def collect():
+        repo = Repo(os.fspath(tmp_dir))
+        load = mocker.spy(strictyaml, "load")
+        walk = mocker.spy(repo.dvcignore, "walk")
+        stages = {stage.relpath for stage in Index(repo).stages}
+        loaded = {relpath(call.args[0]) for call in load.call_args_list}
+        mocker.stop(load)
+        return stages, loaded, walk.called
+
+    assert collect() == ({"foo.dvc", "dir.dvc"}, set(), False)
+
+    tmp_dir.dvc_gen("baz", "baz")
+    assert collect() == ({"foo.dvc", "dir.dvc", "baz.dvc"}, {"baz.dvc"}, True)
+    assert collect() == ({"foo.dvc", "dir.dvc", "baz.dvc"}, set(), False)
+
+    (tmp_dir / ".dvcignore").write_text("baz.dvc\n")
+    assert collect() == ({"foo.dvc", "dir.dvc"}, set(), True)
+
+    (tmp_dir / "foo.dvc").write_text(
+        (tmp_dir / "foo.dvc").read_text() + "desc: foo\n"
+    )
+    assert collect() == ({"foo.dvc", "dir.dvc"}, {"foo.dvc"}, True)
+
+    # touched, but not modified
+    os.utime(tmp_dir / "dir.dvc", ns=(0, 0))
+    assert collect() == ({"foo.dvc", "dir.dvc"}, set(), True)
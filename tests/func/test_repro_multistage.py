@@ -564,3 +564,79 @@ def test_repro_list_of_commands_raise_and_stops_after_failure(
         dvc.reproduce(targets=["multi"])
     assert (tmp_dir / "foo").read_text() == "foo\n"
     assert not (tmp_dir / "bar").exists()
+
+
+def test_repro_jobs(tmp_dir, dvc):
+    from dvc.dvcfile import Lockfile
+
+    # NOTE: `a` and `b` only finish if they are running at the same time
+    tmp_dir.gen(
+        "barrier.py",
+        dedent(
+            """\
+            import os, sys, time
+            name, other = sys.argv[1:]
+            open(name + ".started", "w").close()
+            for _ in range(1000):
+                if os.path.exists(other + ".started"):
+                    break
+                time.sleep(0.01)
+            else:
+                sys.exit(1)
+            with open(name, "w") as fobj:
+                fobj.write(name)
+            """
+        ),
+    )
+    (tmp_dir / "dvc.yaml").dump(
+        {
+            "stages": {
+                "a": {
+                    "cmd": "python barrier.py a b",
+                    "deps": ["barrier.py"],
+                    "outs": ["a"],
+                },
+                "b": {
+                    "cmd": "python barrier.py b a",
+                    "deps": ["barrier.py"],
+                    "outs": ["b"],
+                },
+                "c": {
+                    "cmd": "python copy.py a c",
+                    "deps": ["a", "b", "copy.py"],
+                    "outs": ["c"],
+                },
+            }
+        }
+    )
+    tmp_dir.gen("copy.py", COPY_SCRIPT)
+
+    stages = dvc.reproduce(jobs=2)
+    assert [stage.addressing for stage in stages][-1] == "c"
+    assert {stage.addressing for stage in stages} == {"a", "b", "c"}
+    assert (tmp_dir / "c").read_text() == "a"
+    assert set(Lockfile(dvc, "dvc.lock").load()["stages"]) == {"a", "b", "c"}
+
+    assert dvc.reproduce(jobs=2) == []
+
+
+def test_repro_jobs_failure(tmp_dir, dvc):
+    (tmp_dir / "dvc.yaml").dump(
+        {
+            "stages": {
+                "failed": {"cmd": "failed_command", "outs": ["failed"]},
+                "after": {
+                    "cmd": "echo after>after",
+                    "deps": ["failed"],
+                    "outs": ["after"],
+                },
+                "foo": {"cmd": "echo foo>foo", "outs": ["foo"]},
+            }
+        }
+    )
+
+    with pytest.raises(ReproductionError):
+        dvc.reproduce(jobs=2)
+    # independent stages still run, but not the ones after the failed one
+    assert (tmp_dir / "foo").exists()
+    assert not (tmp_dir / "after").exists()
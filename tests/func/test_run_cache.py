@@ -1,6 +1,7 @@
 import os
 
 from dvc.dvcfile import PIPELINE_LOCK
+from dvc.stage.cache import _get_stage_hash
 from dvc.utils import relpath
 from dvc.utils.fs import remove
 
@@ -20,6 +21,24 @@ def test_push_pull(tmp_dir, dvc, erepo_dir, run_copy, local_remote):
         assert os.listdir(erepo_dir.dvc.stage_cache.cache_dir)
 
 
+def test_push_pull_only_missing(tmp_dir, dvc, run_copy, local_remote):
+    tmp_dir.gen({"foo": "foo", "bar": "bar"})
+    run_copy("foo", "foo.bak", name="backup-foo")
+    assert len(dvc.stage_cache.push(None)) == 1
+
+    run_copy("bar", "bar.bak", name="backup-bar")
+    ((key, value),) = dvc.stage_cache.push(None)
+    assert dvc.stage_cache.push(None) == []
+    assert os.path.exists(
+        os.path.join(local_remote.config["url"], "runs", key[:2], key, value)
+    )
+
+    remove(dvc.stage_cache.cache_dir)
+    assert len(dvc.stage_cache.pull(None)) == 2
+    assert dvc.stage_cache.pull(None) == []
+    assert _recurse_count_files(dvc.stage_cache.cache_dir) == 2
+
+
 def test_restore(tmp_dir, dvc, run_copy, mocker):
     tmp_dir.gen("foo", "foo")
     run_copy("foo", "bar", name="copy-foo-bar")
@@ -49,6 +68,21 @@ def test_save(tmp_dir, dvc, run_copy):
     assert dvc.stage_cache._load(stage)
 
 
+def test_load_from_index(tmp_dir, dvc, run_copy, mocker):
+    tmp_dir.gen("foo", "foo")
+    stage = run_copy("foo", "bar", name="copy-foo-bar")
+
+    load_yaml = mocker.patch("dvc.utils.serialize.load_yaml")
+    entry = dvc.stage_cache._load(stage)
+    assert entry["cmd"] == stage.cmd
+    load_yaml.assert_not_called()
+
+    # index entries for removed files are dropped
+    remove(dvc.stage_cache.cache_dir)
+    assert not dvc.stage_cache._load(stage)
+    assert not list(dvc.stage_cache.index.entries(_get_stage_hash(stage)))
+
+
 def test_do_not_save_on_no_exec_and_dry(tmp_dir, dvc, run_copy):
     run_cache_dir = dvc.stage_cache.cache_dir
     assert not os.path.exists(run_cache_dir)
@@ -4,7 +4,7 @@ import re
 from dvc.hash_info import HashInfo
 from dvc.repo import Repo
 from dvc.state import State
-from dvc.utils import file_md5
+from dvc.utils import file_hash, file_md5
 
 
 def test_state(tmp_dir, dvc):
@@ -91,3 +91,208 @@ def test_state_dir_config(make_tmp_dir, dvc):
         r"^test_state_dir_config0-([0-9a-f]+)$",
         os.path.basename(repo.state.tmp_dir),
     )
+
+
+def test_state_many(tmp_dir, dvc):
+    tmp_dir.gen({"foo": "foo content", "bar": "bar content"})
+    paths = [os.fspath(tmp_dir / name) for name in ("foo", "bar", "missing")]
+    foo_hash, bar_hash = (
+        HashInfo("md5", file_md5(path, dvc.fs)) for path in paths[:2]
+    )
+
+    state = State(dvc.root_dir, dvc.tmp_dir, dvc.dvcignore)
+    assert list(state.get_many(paths, dvc.fs)) == [
+        (path, None, None) for path in paths
+    ]
+
+    state.save_many(zip(paths, [foo_hash, bar_hash]), dvc.fs)
+    foo, bar, missing = state.get_many(paths, dvc.fs)
+    assert foo[1].size == 11 and foo[2] == foo_hash
+    assert bar[1].size == 11 and bar[2] == bar_hash
+    assert missing == (paths[2], None, None)
+
+
+def test_state_many_with_stats(tmp_dir, dvc, mocker):
+    tmp_dir.gen({"dir": {"foo": "foo content", "bar": "bar content"}})
+    entries = {entry.path: entry for entry in dvc.fs.scan(tmp_dir / "dir")}
+    hashes = {
+        path: HashInfo("md5", file_md5(path, dvc.fs)) for path in entries
+    }
+
+    state = State(dvc.root_dir, dvc.tmp_dir, dvc.dvcignore)
+    state.save_many(hashes.items(), dvc.fs)
+
+    stat = mocker.spy(os, "stat")
+    lstat = mocker.spy(os, "lstat")
+    result = list(state.get_many(entries, dvc.fs, stats=entries))
+    assert [(path, hash_info) for path, _, hash_info in result] == list(
+        hashes.items()
+    )
+    assert not stat.called and not lstat.called
+
+    # stats take precedence over the files on disk
+    foo = entries[os.fspath(tmp_dir / "dir" / "foo")]
+    assert state.get(foo.path, dvc.fs, stat=foo._replace(size=1)) == (
+        None,
+        None,
+    )
+
+
+def test_state_migrate_from_diskcache(tmp_dir, dvc):
+    from diskcache import Cache
+
+    from dvc.utils.fs import get_inode, get_mtime_and_size
+
+    tmp_dir.gen("foo", "foo content")
+    path = os.fspath(tmp_dir / "foo")
+    hash_info = HashInfo("md5", file_md5(path, dvc.fs))
+    mtime, size = get_mtime_and_size(path, dvc.fs)
+
+    legacy_dir = tmp_dir / "legacy"
+    with Cache(directory=os.fspath(legacy_dir / "md5s")) as legacy:
+        legacy[get_inode(path)] = (mtime, str(size), hash_info.value)
+
+    state = State(dvc.root_dir, os.fspath(legacy_dir), dvc.dvcignore)
+    assert state.get(path, dvc.fs)[1] == hash_info
+    state.close()
+    # left in place for older versions of dvc
+    assert (legacy_dir / "md5s").exists()
+
+
+def test_state_evicts_least_recently_used(tmp_dir, dvc, mocker):
+    tmp_dir.gen({"foo": "foo", "bar": "bar", "baz": "baz"})
+    paths = [os.fspath(tmp_dir / name) for name in ("foo", "bar", "baz")]
+    hashes = [HashInfo("md5", file_md5(path, dvc.fs)) for path in paths]
+
+    state = State(dvc.root_dir, dvc.tmp_dir, dvc.dvcignore)
+    for path, hash_info in zip(paths, hashes):
+        state.save(path, dvc.fs, hash_info)
+    # using "foo" makes "bar" the least recently used entry
+    mocker.patch.object(State, "ATIME_RESOLUTION_NS", -(10 ** 9))
+    assert state.get(paths[0], dvc.fs)[1] == hashes[0]
+    state.close()
+
+    mocker.patch.object(State, "MAX_ENTRIES", 2)
+    state = State(dvc.root_dir, dvc.tmp_dir, dvc.dvcignore)
+    assert [
+        hash_info for _, _, hash_info in state.get_many(paths, dvc.fs)
+    ] == [
+        hashes[0],
+        None,
+        hashes[2],
+    ]
+    state.close()
+
+
+def test_state_hash_names(tmp_dir, dvc):
+    tmp_dir.gen("foo", "foo content")
+    path = os.fspath(tmp_dir / "foo")
+    md5 = HashInfo("md5", file_md5(path, dvc.fs))
+    sha256 = HashInfo("sha256", file_hash(path, dvc.fs, "sha256"))
+
+    state = State(dvc.root_dir, dvc.tmp_dir, dvc.dvcignore)
+    state.save(path, dvc.fs, md5)
+    assert state.get(path, dvc.fs, name="sha256") == (None, None)
+
+    state.save(path, dvc.fs, sha256)
+    assert state.get(path, dvc.fs)[1] == md5
+    assert state.get(path, dvc.fs, name="sha256")[1] == sha256
+
+
+def test_state_dir_summaries(tmp_dir, dvc, mocker):
+    from dvc.utils import fs as fs_utils
+
+    mocker.patch.object(fs_utils, "DIR_SUMMARY_RACY_WINDOW_NS", 0)
+    tmp_dir.gen({"dir": {"foo": "foo", "sub": {"bar": "bar"}}})
+    path = os.fspath(tmp_dir / "dir")
+    state = State(dvc.root_dir, dvc.tmp_dir, dvc.dvcignore)
+
+    _, mtime, size = state._stat(path, dvc.fs)
+    assert size == 6
+    assert set(state.get_dir_summaries(path)) == {
+        path,
+        os.path.join(path, "sub"),
+    }
+
+    scandir = mocker.spy(os, "scandir")
+    assert state._stat(path, dvc.fs)[1:] == (mtime, size)
+    assert not scandir.called
+
+    # modifying a file in place doesn't change the mtime of its directory
+    (tmp_dir / "dir" / "sub" / "bar").write_text("modified")
+    _, new_mtime, new_size = state._stat(path, dvc.fs)
+    assert new_mtime != mtime and new_size == 11
+    assert not scandir.called
+
+    (tmp_dir / "dir" / "sub" / "new").write_text("new")
+    assert state._stat(path, dvc.fs)[2] == 14
+    assert scandir.call_count == 1
+
+    (tmp_dir / ".dvcignore").write_text("sub\n")
+    state = State(
+        dvc.root_dir, dvc.tmp_dir, Repo(os.fspath(tmp_dir)).dvcignore
+    )
+    assert state._stat(path, dvc.fs)[2] == 3
+    assert set(state.get_dir_summaries(path)) == {path}
+
+
+def test_state_dir_summaries_unchanged_tree(tmp_dir, dvc, mocker):
+    from dvc.utils import fs as fs_utils
+
+    mocker.patch.object(fs_utils, "DIR_SUMMARY_RACY_WINDOW_NS", 0)
+    tmp_dir.gen(
+        {"dir": {"foo": "foo", "sub": {"bar": "bar", "subsub": {"baz": "b"}}}}
+    )
+    path = os.fspath(tmp_dir / "dir")
+    state = State(
+        dvc.root_dir, dvc.tmp_dir, dvc.dvcignore, trust_dir_mtime=True
+    )
+    expected = fs_utils.get_mtime_and_size(path, dvc.fs, state=state)
+
+    stat = mocker.spy(os, "stat")
+    scandir = mocker.spy(os, "scandir")
+    assert fs_utils.get_mtime_and_size(path, dvc.fs, state=state) == expected
+    # only directories are stat-ed (the root one by `isdir` as well),
+    # files are not stat-ed again
+    stated = [os.fspath(call.args[0]) for call in stat.call_args_list]
+    assert sorted(stated) == [
+        path,
+        path,
+        os.path.join(path, "sub"),
+        os.path.join(path, "sub", "subsub"),
+    ]
+    assert not scandir.called
+
+    # replacing a file changes its directory, so only that one is re-listed
+    sub = tmp_dir / "dir" / "sub"
+    (sub / "tmp").write_text("modified")
+    os.replace(sub / "tmp", sub / "bar")
+    assert fs_utils.get_mtime_and_size(path, dvc.fs, state=state)[1] == 12
+    assert scandir.call_count == 1
+    assert scandir.call_args[0][0] == os.fspath(sub)
+
+
+def test_state_dir_summaries_pruning(tmp_dir, dvc, mocker):
+    from dvc.utils import fs as fs_utils
+
+    tmp_dir.gen({"dir": {"sub": {"subsub": {"foo": "foo"}}}, "other": {}})
+    path = os.fspath(tmp_dir / "dir")
+    state = State(dvc.root_dir, dvc.tmp_dir, dvc.dvcignore)
+    state._stat(path, dvc.fs)
+    assert len(state.get_dir_summaries(path)) == 3
+
+    fs_utils.remove(tmp_dir / "dir" / "sub")
+    state._stat(path, dvc.fs)
+    assert set(state.get_dir_summaries(path)) == {path}
+
+    state._stat(os.fspath(tmp_dir / "other"), dvc.fs)
+    state.close()
+
+    # "dir" is the least recently used one
+    mocker.patch.object(State, "MAX_DIR_ENTRIES", 1)
+    state = State(dvc.root_dir, dvc.tmp_dir, dvc.dvcignore)
+    assert not state.get_dir_summaries(path)
+    assert set(state.get_dir_summaries(os.fspath(tmp_dir / "other"))) == {
+        os.fspath(tmp_dir / "other")
+    }
+    state.close()
@@ -4,7 +4,15 @@ from dvc.command.checkout import CmdCheckout, log_changes
 
 def test_checkout(tmp_dir, dvc, mocker):
     cli_args = parse_args(
-        ["checkout", "foo.dvc", "bar.dvc", "--relink", "--with-deps"]
+        [
+            "checkout",
+            "foo.dvc",
+            "bar.dvc",
+            "--relink",
+            "--with-deps",
+            "--jobs",
+            "8",
+        ]
     )
     assert cli_args.func == CmdCheckout
 
@@ -18,6 +26,7 @@ def test_checkout(tmp_dir, dvc, mocker):
         recursive=False,
         relink=True,
         with_deps=True,
+        jobs=8,
     )
 
 
@@ -17,6 +17,7 @@ def test_fetch(mocker):
             "--all-commits",
             "--with-deps",
             "--recursive",
+            "--refresh-remote-index",
             "--run-cache",
         ]
     )
@@ -37,6 +38,7 @@ def test_fetch(mocker):
         with_deps=True,
         recursive=True,
         run_cache=True,
+        refresh_remote_index=True,
     )
 
 
@@ -56,6 +58,7 @@ def test_pull(mocker):
             "--with-deps",
             "--force",
             "--recursive",
+            "--refresh-remote-index",
             "--run-cache",
             "--glob",
         ]
@@ -79,6 +82,7 @@ def test_pull(mocker):
         recursive=True,
         run_cache=True,
         glob=True,
+        refresh_remote_index=True,
     )
 
 
@@ -97,6 +101,7 @@ def test_push(mocker):
             "--all-commits",
             "--with-deps",
             "--recursive",
+            "--refresh-remote-index",
             "--run-cache",
             "--glob",
         ]
@@ -119,4 +124,5 @@ def test_push(mocker):
         recursive=True,
         run_cache=True,
         glob=True,
+        refresh_remote_index=True,
     )
@@ -99,6 +99,8 @@ def test_experiments_show(dvc, scm, mocker):
             "--param-deps",
             "-n",
             "1",
+            "-j",
+            "3",
         ]
     )
     assert cli_args.func == CmdExperimentsShow
@@ -116,6 +118,7 @@ def test_experiments_show(dvc, scm, mocker):
         sha_only=True,
         num=1,
         param_deps=True,
+        jobs=3,
     )
 
 
@@ -107,6 +107,8 @@ def test_metrics_show(dvc, mocker):
             "target2",
             "--precision",
             "8",
+            "--jobs",
+            "4",
         ]
     )
     assert cli_args.func == CmdMetricsShow
@@ -124,6 +126,7 @@ def test_metrics_show(dvc, mocker):
         all_tags=True,
         all_branches=True,
         all_commits=True,
+        jobs=4,
     )
     m2.assert_called_once_with(
         {},
@@ -171,6 +174,7 @@ def test_metrics_show_json(dvc, mocker, capsys):
         all_tags=True,
         all_branches=True,
         all_commits=True,
+        jobs=1,
     )
     show_metrics_mock.assert_not_called()
     assert json.dumps(d) in out
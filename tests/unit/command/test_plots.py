@@ -43,6 +43,8 @@ def test_plots_diff(dvc, mocker, plots_data):
             "--y-label",
             "y_title",
             "--experiment",
+            "--jobs",
+            "2",
             "HEAD",
             "tag1",
             "tag2",
@@ -71,6 +73,7 @@ def test_plots_diff(dvc, mocker, plots_data):
             "y_label": "y_title",
         },
         experiment=True,
+        jobs=2,
     )
     render_mock.assert_not_called()
 
@@ -16,6 +16,7 @@ default_arguments = {
     "pull": False,
     "glob": False,
     "targets": [],
+    "jobs": 1,
 }
 
 
@@ -35,3 +36,13 @@ def test_downstream(dvc, mocker):
     arguments.update({"downstream": True})
     # pylint: disable=no-member
     cmd.repo.reproduce.assert_called_with(**arguments)
+
+
+def test_jobs(dvc, mocker):
+    cmd = CmdRepro(parse_args(["repro", "--jobs", "4"]))
+    mocker.patch.object(cmd.repo, "reproduce")
+    cmd.run()
+    arguments = default_arguments.copy()
+    arguments.update({"jobs": 4})
+    # pylint: disable=no-member
+    cmd.repo.reproduce.assert_called_with(**arguments)
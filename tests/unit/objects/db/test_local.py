@@ -140,3 +140,53 @@ def test_staging_dir(tmp_dir, dvc):
 
     path = local_odb.hash_to_path(obj.hash_info.value)
     assert fs.exists(path)
+
+
+@pytest.mark.parametrize("threshold", [1, 1000])
+def test_hashes_exist(tmp_dir, dvc, mocker, threshold):
+    odb = dvc.odb.local
+    mocker.patch.object(LocalObjectDB, "SCANDIR_THRESHOLD", threshold)
+
+    tmp_dir.dvc_gen({"foo": "foo", "bar": "bar", "baz": "baz"})
+    foo = "acbd18db4cc2f85cedef654fccc4a4d8"
+    bar = "37b51d194a7513e45b56f6524f2d51f2"
+    baz = "73feffa4b7f6bb68e44cf984c85f6e88"
+    missing = "00000000000000000000000000000000"
+
+    # unprotected and corrupted
+    baz_path = odb.hash_to_path(baz)
+    os.chmod(baz_path, 0o644)
+    with open(baz_path, "w", encoding="utf-8") as fobj:
+        fobj.write("corrupted")
+
+    hashes = [foo, bar, baz, missing]
+    assert set(odb.hashes_exist(hashes, verify=False)) == {foo, bar, baz}
+
+    check = mocker.spy(odb, "check")
+    # files are only rehashed with the hash they are known to be addressed by
+    assert set(odb.hashes_exist(hashes)) == {foo, bar, baz}
+    assert not check.called
+
+    hash_names = dict.fromkeys(hashes, "md5")
+    assert set(odb.hashes_exist(hashes, hash_names=hash_names)) == {foo, bar}
+    # only the unprotected file without a state entry is rehashed
+    check.assert_called_once_with(HashInfo("md5", baz))
+    assert not os.path.exists(baz_path)
+
+
+def test_hashes_exist_uses_hash_names(tmp_dir, dvc, mocker):
+    import hashlib
+
+    odb = dvc.odb.local
+    odb.hash_name = "sha256"
+    tmp_dir.dvc_gen("foo", "foo")
+    value = hashlib.sha256(b"foo").hexdigest()
+    # unprotected and without an up-to-date state entry
+    path = odb.hash_to_path(value)
+    os.chmod(path, 0o644)
+    with open(path, "wb") as fobj:
+        fobj.write(b"foo")
+
+    check = mocker.spy(odb, "check")
+    assert odb.hashes_exist([value], hash_names={value: "sha256"}) == [value]
+    check.assert_called_once_with(HashInfo("sha256", value))
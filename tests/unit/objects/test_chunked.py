@@ -0,0 +1,77 @@
+import hashlib
+import io
+import random
+
+import pytest
+
+from dvc.objects.chunked import ChunkedFile, split
+
+
+def test_split_is_content_defined():
+    rnd = random.Random(0)
+    data = bytes(rnd.getrandbits(8) for _ in range(256 * 1024))
+    kwargs = {"min_size": 1024, "max_size": 64 * 1024}
+
+    chunks = list(split(io.BytesIO(data), **kwargs))
+    assert b"".join(chunks) == data
+    assert all(len(chunk) <= 64 * 1024 for chunk in chunks)
+
+    shifted = list(split(io.BytesIO(b"prefix" + data), **kwargs))
+    assert b"".join(shifted) == b"prefix" + data
+    # boundaries after the inserted data are found at the same spots
+    assert len(chunks) > 2
+    assert chunks[1:] == shifted[1:]
+
+
+def test_split_text_reuses_chunks_after_insert():
+    data = b"".join(
+        f"{i},{i * 7919 % 10007},name{i}\n".encode() for i in range(20000)
+    )
+    kwargs = {"min_size": 1024, "max_size": 16 * 1024}
+
+    chunks = list(split(io.BytesIO(data), **kwargs))
+    changed = data[:1000] + b"x" + data[1000:]
+    shifted = list(split(io.BytesIO(changed), **kwargs))
+    assert b"".join(shifted) == changed
+
+    assert len(chunks) > 50
+    reused = set(chunks) & set(shifted)
+    assert len(reused) >= len(chunks) - 2
+
+
+def test_split_empty():
+    assert list(split(io.BytesIO(b""))) == []
+
+
+def test_chunked_file_roundtrip():
+    obj = ChunkedFile.from_list(
+        [{"md5": "acbd18db4cc2f85cedef654fccc4a4d8", "size": 3}]
+    )
+    obj.digest()
+
+    assert obj.hash_info.name == "md5"
+    assert obj.hash_info.value.endswith(".chunks")
+    assert obj.hash_info.ischunked
+    assert ChunkedFile.from_list(obj.as_list()).as_bytes() == obj.as_bytes()
+    assert obj.size == 3
+
+
+@pytest.mark.parametrize("name", ["md5", "sha256"])
+def test_chunks_are_addressed_by_raw_hash(tmp_dir, dvc, mocker, name):
+    from dvc.fs.local import localfs
+
+    mocker.patch("dvc.objects.chunked.CHUNK_MIN_SIZE", 1024)
+    mocker.patch("dvc.objects.chunked.CHUNK_MAX_SIZE", 4096)
+    data = b"".join(b"line %d\r\n" % i for i in range(2000))
+    (tmp_dir / "foo").write_bytes(data)
+
+    odb = dvc.odb.local
+    obj = ChunkedFile.from_file("foo", localfs, odb=odb, name=name)
+    chunks = list(split(io.BytesIO(data), 1024, 4096))
+    assert [(oid.name, oid.value) for _, _, oid in obj] == [
+        (name, hashlib.new(name, chunk).hexdigest()) for chunk in chunks
+    ]
+    # chunks are verified from their contents, not from the state
+    mocker.patch.object(odb.state, "get", return_value=(None, None))
+    for _, _, oid in obj:
+        odb.get(oid).check(odb)
@@ -0,0 +1,143 @@
+import pytest
+
+from dvc.hash_info import HashInfo
+from dvc.objects.compact_tree import CompactTree, write
+from dvc.objects.tree import Tree
+from dvc.utils.fs import remove
+
+
+def _md5(char):
+    return char * 32
+
+
+@pytest.fixture
+def lst():
+    return [
+        {"md5": _md5("1"), "relpath": "dir/b"},
+        {"md5": _md5("2"), "relpath": "dir.txt"},
+        {"md5": _md5("3"), "relpath": "dir/subdir/a"},
+        {"md5": _md5("4"), "relpath": "a"},
+        {"md5": _md5("5"), "relpath": "dir/a"},
+        {"md5": _md5("6"), "relpath": "z"},
+    ]
+
+
+@pytest.fixture
+def tree(tmp_path, lst):
+    path = str(tmp_path / "tree")
+    write(path, lst)
+    return CompactTree.open(path)
+
+
+def test_roundtrip(tree, lst):
+    assert len(tree) == 6
+    assert tree.as_dict() == Tree.from_list(lst).as_dict()
+    assert tree.as_list() == Tree.from_list(lst).as_list()
+
+
+def test_get_oid(tree):
+    assert tree.get_oid(("dir", "subdir", "a")) == HashInfo("md5", _md5("3"))
+    assert tree.get_oid(("dir.txt",)) == HashInfo("md5", _md5("2"))
+    assert tree.get_oid(("dir",)) is None
+    assert tree.get_oid(("missing",)) is None
+
+
+def test_filter(tree):
+    assert [key for key, _, _ in tree.filter(("dir",))] == [
+        ("dir", "a"),
+        ("dir", "b"),
+        ("dir", "subdir", "a"),
+    ]
+    assert list(tree.filter(("a",))) == [
+        (("a",), None, HashInfo("md5", _md5("4")))
+    ]
+    assert not list(tree.filter(("missing",)))
+
+
+def test_get(tree, mocker):
+    odb = mocker.Mock()
+    subtree = tree.get(odb, ("dir",))
+    assert subtree.as_dict() == {
+        ("a",): (None, HashInfo("md5", _md5("5"))),
+        ("b",): (None, HashInfo("md5", _md5("1"))),
+        ("subdir", "a"): (None, HashInfo("md5", _md5("3"))),
+    }
+    assert subtree.hash_info.isdir
+    assert tree.get(odb, ("missing",)) is None
+
+
+def test_sha256(tmp_path):
+    lst = [
+        {"sha256": "1" * 64, "relpath": "dir/b"},
+        {"sha256": "2" * 64, "relpath": "a"},
+    ]
+    path = str(tmp_path / "tree")
+    write(path, lst)
+    tree = CompactTree.open(path)
+    assert tree.as_dict() == Tree.from_list(lst).as_dict()
+    assert tree.get_oid(("dir", "b")) == HashInfo("sha256", "1" * 64)
+
+
+@pytest.mark.parametrize(
+    "lst",
+    [
+        [{"md5": "abc", "relpath": "foo"}],
+        [{"sha256": _md5("1"), "relpath": "foo"}],
+        [
+            {"md5": _md5("1"), "relpath": "foo"},
+            {"sha256": "2" * 64, "relpath": "bar"},
+        ],
+    ],
+)
+def test_not_packable(tmp_path, lst):
+    with pytest.raises(ValueError):
+        write(str(tmp_path / "tree"), lst)
+
+
+def test_load(tmp_dir, dvc):
+    (stage,) = tmp_dir.dvc_gen({"dir": {"foo": "foo", "sub": {"bar": "bar"}}})
+    hash_info = stage.outs[0].hash_info
+
+    tree = CompactTree.load(dvc.odb.local, hash_info)
+    assert isinstance(tree, CompactTree)
+    assert tree.hash_info == hash_info
+    assert tree.as_dict() == Tree.load(dvc.odb.local, hash_info).as_dict()
+    assert (tmp_dir / ".dvc" / "tmp" / "trees" / hash_info.value).exists()
+
+
+def test_diff(tmp_dir, dvc):
+    from dvc.objects.diff import diff
+
+    (old,) = tmp_dir.dvc_gen({"dir": {"foo": "foo", "sub": {"bar": "bar"}}})
+    remove(tmp_dir / "dir" / "sub")
+    (new,) = tmp_dir.dvc_gen({"dir": {"foo": "foo", "sub": "sub"}})
+
+    odb = dvc.odb.local
+    trees = [
+        Tree.load(odb, out.hash_info) for out in (old.outs[0], new.outs[0])
+    ]
+    compact = [
+        CompactTree.load(odb, out.hash_info)
+        for out in (old.outs[0], new.outs[0])
+    ]
+    assert diff(*compact, odb) == diff(*trees, odb)
+
+
+def test_output_uses_compact_tree(tmp_dir, dvc):
+    (stage,) = tmp_dir.dvc_gen({"dir": {"foo": "foo"}})
+    out = stage.outs[0]
+    out.obj = None
+
+    assert isinstance(out.get_obj(), CompactTree)
+    assert not out.changed_cache()
+
+
+def test_gc_removes_compact_tree(tmp_dir, dvc):
+    (stage,) = tmp_dir.dvc_gen({"dir": {"foo": "foo"}})
+    hash_info = stage.outs[0].hash_info
+    CompactTree.load(dvc.odb.local, hash_info)
+    path = tmp_dir / ".dvc" / "tmp" / "trees" / hash_info.value
+    assert path.exists()
+
+    dvc.odb.local.gc(set())
+    assert not path.exists()
@@ -0,0 +1,52 @@
+import pytest
+
+from dvc.hash_info import HashInfo
+from dvc.objects.gc import GCResult, UsedHashes
+
+
+def test_used_hashes():
+    used = UsedHashes(
+        [
+            HashInfo("md5", "acbd18db4cc2f85cedef654fccc4a4d8"),
+            HashInfo("md5", "37b51d194a7513e88b5a6ea1d1b5c7b3.dir"),
+            HashInfo("md5", "acbd18db4cc2f85cedef654fccc4a4d8"),
+            HashInfo("sha256", "foo"),
+        ]
+    )
+    used.add("acbd18db4cc2f85cedef654fccc4a4d9.chunks")
+
+    assert len(used) == 4
+    assert "acbd18db4cc2f85cedef654fccc4a4d8" in used
+    assert "37b51d194a7513e88b5a6ea1d1b5c7b3.dir" in used
+    assert "acbd18db4cc2f85cedef654fccc4a4d9.chunks" in used
+    assert "foo" in used
+
+    assert "37b51d194a7513e88b5a6ea1d1b5c7b3" not in used
+    assert "acbd18db4cc2f85cedef654fccc4a4d8.dir" not in used
+    assert "acbd18db4cc2f85cedef654fccc4a4d9" not in used
+    assert "ACBD18DB4CC2F85CEDEF654FCCC4A4D8" not in used
+    assert "bar" not in used
+
+    assert used.expandable == {
+        HashInfo("md5", "37b51d194a7513e88b5a6ea1d1b5c7b3.dir")
+    }
+    assert not used.isdisjoint(["bar", "foo"])
+    assert used.isdisjoint(["bar", "37b51d194a7513e88b5a6ea1d1b5c7b3"])
+
+
+@pytest.mark.parametrize("count", [0, 1, 1000])
+def test_used_hashes_many(count):
+    values = [f"{i:032x}" for i in range(0, 2 * count, 2)]
+    used = UsedHashes()
+    for value in reversed(values):
+        used.add(value)
+
+    assert len(used) == count
+    assert all(value in used for value in values)
+    assert not any(f"{i:032x}" in used for i in range(1, 2 * count, 2))
+
+
+def test_gc_result():
+    assert not GCResult(0)
+    assert GCResult(1)
+    assert GCResult(2, 10).size == 10
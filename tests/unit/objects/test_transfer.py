@@ -0,0 +1,101 @@
+import os
+
+import pytest
+from fsspec.asyn import AsyncFileSystem
+from fsspec.implementations.local import LocalFileSystem as _LocalFileSystem
+from funcy import cached_property
+
+from dvc.fs.fsspec_wrapper import FSSpecWrapper
+from dvc.objects.db.base import ObjectDB
+from dvc.objects.stage import stage
+from dvc.objects.transfer import transfer
+
+
+class _AsyncLocalFileSystem(AsyncFileSystem):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.local = _LocalFileSystem()
+
+    async def _info(self, path, **kwargs):
+        return self.local.info(path)
+
+    async def _ls(self, path, detail=True, **kwargs):
+        return self.local.ls(path, detail=detail)
+
+    def _open(self, path, mode="rb", **kwargs):
+        return self.local.open(path, mode=mode, **kwargs)
+
+    async def _put_file(self, lpath, rpath, **kwargs):
+        with open(lpath, "rb") as fobj:
+            if fobj.read() == b"fail":
+                raise OSError("failed")
+        self.local.makedirs(os.path.dirname(rpath), exist_ok=True)
+        self.local.put_file(lpath, rpath)
+
+    async def _get_file(self, rpath, lpath, **kwargs):
+        self.local.get_file(rpath, lpath)
+
+
+class AsyncFileSystem(FSSpecWrapper):  # pylint:disable=abstract-method
+    scheme = "async"
+    PARAM_CHECKSUM = "md5"
+
+    @cached_property
+    def fs(self):
+        return _AsyncLocalFileSystem(**self.fs_args)
+
+
+@pytest.fixture
+def remote_odb(tmp_dir):
+    return ObjectDB(AsyncFileSystem(), os.fspath(tmp_dir / "remote"))
+
+
+def _add(odb, path):
+    staging, _, obj = stage(odb, path, odb.fs, "md5")
+    transfer(staging, odb, {obj.hash_info}, shallow=False, hardlink=True)
+    return obj
+
+
+def test_async_transfer(tmp_dir, dvc, mocker, remote_odb):
+    tmp_dir.gen({"dir": {"foo": "foo", "sub": {"baz": "baz"}}})
+    odb = dvc.odb.local
+    obj = _add(odb, os.fspath(tmp_dir / "dir"))
+
+    put_many = mocker.spy(remote_odb.fs, "put_many")
+    add = mocker.spy(remote_odb, "add")
+    assert (
+        transfer(odb, remote_odb, {obj.hash_info}, jobs=2, shallow=False) == 3
+    )
+    assert put_many.called
+    assert not add.called
+    assert remote_odb.exists(obj.hash_info)
+    for _, _, oid in obj:
+        assert remote_odb.exists(oid)
+
+    odb.fs.remove(odb.cache_path)
+    get_many = mocker.spy(remote_odb.fs, "get_many")
+    add = mocker.spy(odb, "add")
+    assert (
+        transfer(remote_odb, odb, {obj.hash_info}, jobs=2, shallow=False) == 3
+    )
+    assert get_many.called
+    assert not add.called
+    for _, _, oid in obj:
+        path = odb.hash_to_path(oid.value)
+        assert odb.is_protected(path)
+        assert odb.state.get(path, odb.fs)[1] == oid
+
+
+def test_async_transfer_errors(tmp_dir, dvc, remote_odb):
+    from dvc.exceptions import FileTransferError
+
+    tmp_dir.gen({"foo": "foo", "bar": "fail"})
+    odb = dvc.odb.local
+    foo = _add(odb, os.fspath(tmp_dir / "foo"))
+    bar = _add(odb, os.fspath(tmp_dir / "bar"))
+
+    with pytest.raises(FileTransferError) as exc_info:
+        transfer(odb, remote_odb, {foo.hash_info, bar.hash_info})
+    assert "1 files failed" in str(exc_info.value)
+    assert remote_odb.exists(foo.hash_info)
+    assert not remote_odb.exists(bar.hash_info)
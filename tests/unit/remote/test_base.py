@@ -135,3 +135,128 @@ def test_list_paths(dvc):
         walk_mock.assert_called_with(
             posixpath.join(path, "00", "0"), prefix=True
         )
+
+
+def test_traverse_prefixes(dvc):
+    odb = ObjectDB(FileSystem(), None)
+    prefixes = odb._traverse_prefixes(1000)
+    assert len(prefixes) == 255 + 15
+
+    # large remotes are split into longer prefixes
+    size = pow(16, 3) * odb.TRAVERSE_SPLIT_SIZE + 1
+    prefixes = odb._traverse_prefixes(size)
+    assert len(prefixes) == pow(16, 4) - 16
+    assert {len(prefix) for prefix in prefixes} == {4}
+
+    # every hash (except ones from the estimation prefix) is in exactly one
+    # of the prefixes
+    for hash_ in ["0000ab", "0001ab", "00ffab", "0fffab", "ffffab"]:
+        matching = [p for p in prefixes if hash_.startswith(p)]
+        assert len(matching) == (0 if hash_.startswith("000") else 1)
+
+
+@pytest.fixture
+def memory_odb(dvc):
+    from dvc.fs.memory import MemoryFileSystem
+
+    fs = MemoryFileSystem()
+    odb = ObjectDB(fs, "/odb", tmp_dir=dvc.tmp_dir)
+    hashes = {f"{i:02x}{j:030x}" for i in range(256) for j in range(3)}
+    for hash_ in hashes:
+        fs.fs.pipe_file(odb.hash_to_path(hash_), b"")
+    yield odb, hashes
+    fs.fs.rm("/odb", recursive=True)
+
+
+def test_list_hashes_traverse_resume(memory_odb, mocker):
+    from dvc.objects.db import get_listing_checkpoint
+
+    odb, hashes = memory_odb
+    size = 256 * odb.fs.LIST_OBJECT_PAGE_SIZE
+    list_hashes = odb._list_hashes
+
+    def _list_hashes(prefix=None, **kwargs):
+        if prefix == "80":
+            raise OSError("interrupted")
+        return list_hashes(prefix=prefix, **kwargs)
+
+    mocker.patch.object(odb, "_list_hashes", side_effect=_list_hashes)
+    with pytest.raises(OSError):
+        list(odb._list_hashes_traverse(size, set(), jobs=1, resume=True))
+    _, done = get_listing_checkpoint(odb).start([])
+    assert "01" in done
+    assert "80" not in done
+
+    odb._list_hashes.reset_mock(side_effect=True)
+    odb._list_hashes.side_effect = list_hashes
+    result = list(odb._list_hashes_traverse(size, set(), jobs=1, resume=True))
+    assert len(result) == len(hashes) - 3
+    assert set(result) == {h for h in hashes if not h.startswith("00")}
+    # only prefixes which weren't fully listed are listed again
+    relisted = {call[1]["prefix"] for call in odb._list_hashes.call_args_list}
+    assert "80" in relisted
+    assert not relisted & done
+
+    # checkpoint is discarded once listing is finished
+    prefixes, done = get_listing_checkpoint(odb).start(["00"])
+    assert (prefixes, done) == (["00"], set())
+
+
+def test_list_hashes_traverse_no_resume(memory_odb, mocker):
+    from dvc.objects.db import get_listing_checkpoint
+
+    odb, _ = memory_odb
+    size = 256 * odb.fs.LIST_OBJECT_PAGE_SIZE
+    checkpoint = get_listing_checkpoint(odb)
+    checkpoint.start(["01"])
+    checkpoint.add("01", ["01" + "f" * 30])
+    checkpoint.finish_prefix("01")
+    checkpoint.close()
+
+    # e.g. `hashes_exist()` never trusts hashes from an older listing
+    list_hashes = mocker.spy(odb, "_list_hashes")
+    result = set(odb._list_hashes_traverse(size, set(), jobs=1))
+    assert "01" + "f" * 30 not in result
+    assert "01" in {call[1]["prefix"] for call in list_hashes.call_args_list}
+
+
+def test_gc_clears_listing_checkpoint(memory_odb, mocker):
+    from dvc.objects.db import get_listing_checkpoint
+
+    odb, _ = memory_odb
+    dir_hash = "01" + "f" * 30 + ".dir"
+    odb.fs.fs.pipe_file(odb.hash_to_path(dir_hash), b"")
+    mocker.patch.object(ObjectDB, "GC_BATCH_SIZE", 1)
+    size = 256 * odb.fs.LIST_OBJECT_PAGE_SIZE
+    mocker.patch.object(
+        odb, "_estimate_remote_size", return_value=(size, set())
+    )
+    list_hashes = odb._list_hashes
+
+    def _list_hashes(prefix=None, **kwargs):
+        if prefix == "80":
+            raise OSError("interrupted")
+        return list_hashes(prefix=prefix, **kwargs)
+
+    mocker.patch.object(odb, "_list_hashes", side_effect=_list_hashes)
+    with pytest.raises(OSError):
+        odb.gc(set(), jobs=1)
+    assert not odb.fs.exists(odb.hash_to_path(dir_hash))
+
+    # the unfinished listing still contains the removed `.dir` object, so
+    # it must not be resumed
+    assert get_listing_checkpoint(odb).start(["01"]) == (["01"], set())
+
+
+def test_list_hashes_traverse_bounded_queue(memory_odb, mocker):
+    odb, hashes = memory_odb
+    mocker.patch.object(ObjectDB, "TRAVERSE_BATCH_SIZE", 1)
+    mocker.patch.object(ObjectDB, "TRAVERSE_QUEUE_SIZE", 1)
+    size = 256 * odb.fs.LIST_OBJECT_PAGE_SIZE
+    list_hashes = mocker.spy(odb, "_list_hashes")
+
+    it = odb._list_hashes_traverse(size, set(), jobs=1)
+    next(it)
+    # listing threads wait for the consumer
+    assert list_hashes.call_count < 255
+    it.close()
@@ -1,9 +1,14 @@
 import os
+import time
 
 import pytest
 from funcy import first
 
-from dvc.objects.db.index import ObjectDBIndex
+from dvc.objects.db.index import (
+    ObjectDBIndex,
+    ObjectDBListingCheckpoint,
+    ObjectDBSnapshot,
+)
 
 
 @pytest.fixture
@@ -45,3 +50,97 @@ def test_intersection(dvc, index):
     expected = {str(i) for i in range(1000)}
     index.update([], hashes)
     assert set(index.intersection(expected)) == expected
+
+
+@pytest.fixture
+def snapshot(dvc):
+    snapshot_ = ObjectDBSnapshot(dvc.index_db_dir, "foo")
+    yield snapshot_
+    snapshot_.close()
+
+
+def test_snapshot_roundtrip(dvc, snapshot):
+    snapshot.add(["5678", "1234.dir"])
+    snapshot.close()
+
+    new_snapshot = ObjectDBSnapshot(dvc.index_db_dir, "foo")
+    assert list(new_snapshot) == ["1234.dir", "5678"]
+    assert "5678" in new_snapshot
+    assert len(new_snapshot) == 2
+    new_snapshot.close()
+
+
+def test_snapshot_intersection(dvc, snapshot):
+    snapshot.add(f"{i:04x}" for i in range(2000))
+    expected = {f"{i:04x}" for i in range(1000)}
+    assert set(snapshot.intersection(expected | {"ffff"})) == expected
+
+
+def test_snapshot_update_prefix(dvc, snapshot):
+    snapshot.add(["aa01", "aa02", "ab01"])
+    snapshot.update_prefix("aa", ["aa03"])
+    assert list(snapshot) == ["aa03", "ab01"]
+
+    for prefix in ObjectDBSnapshot.PREFIXES:
+        snapshot.update_prefix(prefix, [])
+    assert list(snapshot) == []
+
+
+@pytest.fixture
+def checkpoint(dvc):
+    checkpoint_ = ObjectDBListingCheckpoint(dvc.index_db_dir, "foo")
+    yield checkpoint_
+    checkpoint_.close()
+
+
+def test_listing_checkpoint_resume(dvc, checkpoint, mocker):
+    assert checkpoint.start(["aa", "ab", "ac"]) == (["aa", "ab", "ac"], set())
+    checkpoint.add("aa", ["aa01", "aa02"])
+    checkpoint.finish_prefix("aa")
+    checkpoint.add("ab", ["ab01"])
+    checkpoint.close()
+
+    new_checkpoint = ObjectDBListingCheckpoint(dvc.index_db_dir, "foo")
+    prefixes, done = new_checkpoint.start(["a", "b"])
+    assert (prefixes, done) == (["aa", "ab", "ac"], {"aa"})
+    assert sorted(new_checkpoint.hashes("aa")) == ["aa01", "aa02"]
+    new_checkpoint.reset_prefix("ab")
+    assert new_checkpoint.hashes("ab") == []
+
+    # stale checkpoints are discarded
+    mocker.patch.object(ObjectDBListingCheckpoint, "MAX_AGE", -1)
+    assert new_checkpoint.start(["a", "b"]) == (["a", "b"], set())
+    assert new_checkpoint.hashes("aa") == []
+    new_checkpoint.close()
+
+
+def test_listing_checkpoint_clear(dvc, checkpoint):
+    checkpoint.start(["aa", "ab"])
+    checkpoint.add("aa", ["aa01"])
+    checkpoint.finish_prefix("aa")
+    checkpoint.clear()
+    assert checkpoint.start(["ac"]) == (["ac"], set())
+    assert checkpoint.hashes("aa") == []
+
+
+def test_snapshot_refreshes_stale_prefixes(dvc, snapshot, mocker):
+    snapshot.add(["aa01", "ab01"])
+    assert snapshot.stale_prefixes() == []
+
+    odb = mocker.MagicMock()
+    odb._list_hashes.side_effect = lambda prefix: [f"{prefix}02"]
+    snapshot.refresh(odb, jobs=1, max_age=snapshot.MAX_AGE)
+    assert not odb._list_hashes.called
+    assert list(snapshot) == ["aa01", "ab01"]
+
+    mocker.patch("time.time", return_value=time.time() + snapshot.MAX_AGE + 1)
+    assert snapshot.stale_prefixes() == ObjectDBSnapshot.PREFIXES
+    snapshot.update_prefix("aa", ["aa03"])
+    assert "aa" not in snapshot.stale_prefixes()
+
+    snapshot.refresh(odb, jobs=1, max_age=snapshot.MAX_AGE)
+    assert odb._list_hashes.call_count == len(ObjectDBSnapshot.PREFIXES) - 1
+    assert "aa03" in snapshot
+    assert "ab01" not in snapshot
+    assert "ab02" in snapshot
+    assert snapshot.stale_prefixes() == []
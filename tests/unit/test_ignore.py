@@ -209,3 +209,31 @@ def test_should_ignore_dir(omit_dir, sub_dir):
 
     assert set(new_dirs) == {"dir1", "dir2"}
     assert set(new_files) == {"file1", "file2", omit_dir}
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        ["to_ignore*", "!to_ignore.txt"],
+        ["/file", "data/", "!data/file"],
+        ["rel/**/to_ignore", "!rel/p/to_ignore"],
+        ["data/*", "**/p2/to_ignore", "*.txt", "rel/**"],
+        ["[a-z]ile", "!/rel/p/", "p?/"],
+        # not supported by the bulk filter, uses regexes instead
+        ["/**/", "file"],
+    ],
+)
+def test_filter_matches(patterns):
+    root = os.path.join(os.path.sep, "full", "path")
+    ignore = DvcIgnorePatterns(patterns, root)
+    names = ["to_ignore", "to_ignore.txt", "file", "data", "p", "p2", "rel"]
+
+    for parts in [(), ("data",), ("rel", "p"), ("rel", "p", "p2"), ("x",)]:
+        dirname = os.path.join(root, *parts)
+        dirs, files = ignore.filter(dirname, names, names)
+        assert files == [
+            name for name in names if not ignore.matches(dirname, name)
+        ]
+        assert dirs == [
+            name for name in names if not ignore.matches(dirname, name, True)
+        ]
@@ -92,3 +92,23 @@ def test_broken_rwlock(tmp_path):
     with pytest.raises(RWLockFileCorruptedError):
         with _edit_rwlock(dir_path):
             pass
+
+
+def test_rwlock_shared_between_threads(tmp_path):
+    path = os.fspath(tmp_path)
+    foo = "foo"
+
+    # e.g. two stages depending on the same data, running in parallel
+    first = rwlock(path, "cmd", [foo], [])
+    second = rwlock(path, "cmd", [foo], [])
+    first.__enter__()
+    second.__enter__()
+    first.__exit__(None, None, None)
+
+    with pytest.raises(LockError):
+        with rwlock(path, "cmd2", [], [foo]):
+            pass
+
+    second.__exit__(None, None, None)
+    with rwlock(path, "cmd2", [], [foo]):
+        pass
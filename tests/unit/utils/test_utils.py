@@ -5,7 +5,9 @@ import pytest
 
 from dvc.fs.local import LocalFileSystem
 from dvc.utils import (
+    LOCAL_CHUNK_SIZE,
     dict_sha256,
+    file_hash,
     file_md5,
     fix_env,
     parse_target,
@@ -90,6 +92,47 @@ def test_file_md5(tmp_dir):
     assert file_md5("foo", fs) == file_md5("foo", fs)
 
 
+@pytest.mark.parametrize(
+    "contents, expected",
+    [
+        (b"", "d41d8cd98f00b204e9800998ecf8427e"),
+        # text files are hashed with CRLFs converted in every chunk
+        (b"foo\r\nbar\r\n", "f47c75614087a8dd938ba4acff252494"),
+        (
+            b"a" * (LOCAL_CHUNK_SIZE - 1) + b"\r\n" + b"b\r\n" * 3,
+            "fd4278bfa4fd456e80cea2afd2ad6b3a",
+        ),
+        # binary files are hashed as is
+        (b"foo\x00\r\n", "e7f2d947bc69a97818072a48a7a80585"),
+        (
+            b"\x00" * (2 * LOCAL_CHUNK_SIZE + 1),
+            "4eda5bcf5ef0cd4066425006dba9ffaa",
+        ),
+    ],
+)
+def test_file_md5_contents(tmp_dir, mocker, contents, expected):
+    tmp_dir.gen("foo", contents)
+    fs = LocalFileSystem()
+    open_spy = mocker.spy(fs, "open")
+    assert file_md5("foo", fs) == expected
+    # the file is opened only once, text is detected from the same buffer
+    assert open_spy.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "contents", [b"foo\r\nbar\r\n", b"\x00" * (2 * LOCAL_CHUNK_SIZE + 1)]
+)
+def test_file_hash_sha256(tmp_dir, contents):
+    import hashlib
+
+    tmp_dir.gen("foo", contents)
+    # NOTE: unlike md5, line endings of text files are not normalized
+    assert (
+        file_hash("foo", LocalFileSystem(), "sha256")
+        == hashlib.sha256(contents).hexdigest()
+    )
+
+
 def test_tmp_fname():
     file_path = os.path.join("path", "to", "file")
 